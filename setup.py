@@ -21,7 +21,7 @@ setup(name = 'herculeum',
                      'Programming Language :: Python :: 3',
                      'Topic :: Games/Entertainment :: Role-Playing'],
       packages = ['herculeum',
-                 'herculeum.ai',
+                 'herculeum.ai', 'herculeum.benchmark',
                  'herculeum.config', 'herculeum.config.levels',
                  'herculeum.ui',
                  'herculeum.ui.controllers', 'herculeum.ui.gui', 'herculeum.ui.text',
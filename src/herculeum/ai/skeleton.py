@@ -24,7 +24,7 @@
 AI routines for skeletons
 """
 
-from pyherc.ai.pathfinding import a_star
+from pyherc.ai import downhill_step, jump_point_search
 from pyherc.aspects import log_debug
 from pyherc.data.geometry import find_direction
 from pyherc.data import find_free_space
@@ -66,8 +66,6 @@ class SkeletonWarriorAI():
         :param rng: random number generator
         :type rng: Random
         """
-        del self.character.short_term_memory[:]
-
         if self.character.inventory.weapon is None:
             self._wield_weapon(action_factory)
 
@@ -120,9 +118,9 @@ class SkeletonWarriorAI():
 
             self.destination = find_free_space(level)
 
-        path, connections, updated = a_star(character.location,
-                                            self.destination,
-                                            level)
+        path, connections, updated = jump_point_search(character.location,
+                                                       self.destination,
+                                                       level)
 
         next_tile = path[1]
 
@@ -156,10 +154,13 @@ class SkeletonWarriorAI():
             pyherc.vtable['\ufdd0:attack'](character,
                                            direction)
         else:
-            path, connections, updated = a_star(c_location,
-                                                p_location,
-                                                character.level)
-            next_tile = path[1]
+            next_tile = downhill_step(c_location,
+                                      p_location,
+                                      character.level)
+
+            if next_tile is None:
+                character.tick = character.tick + 10
+                return
 
             direction = find_direction(character.location,
                                        next_tile)
@@ -24,12 +24,14 @@
 Module for application level objects
 """
 import logging
+import os
 import sys
 
 import herculeum.config.levels
 from herculeum.config import Configuration
 from pyherc.aspects import set_logger
 from pyherc.data.model import Model
+from pyherc.data.savegame import INDEX_FILE, SaveGame
 
 
 class Application():
@@ -46,6 +48,8 @@ class Application():
         self.logger = None
         self.screen = None
         self.log_level = None
+        self.save_path = None
+        self.saved_game = None
 
     def load_configuration(self, controls, surface_manager):
         """
@@ -59,6 +63,40 @@ class Application():
 
         self.config.initialise()
 
+    def load_game(self):
+        """
+        Load game saved when application was closed previously
+
+        :returns: True if saved game was loaded, otherwise False
+        :rtype: Boolean
+
+        .. versionadded:: 0.16
+        """
+        if (self.save_path is None
+                or not os.path.exists(os.path.join(self.save_path,
+                                                   INDEX_FILE))):
+            return False
+        self.saved_game = SaveGame(self.save_path, self.config.level_pager)
+        self.saved_game.load(self.world)
+        return True
+
+    def save_game(self):
+        """
+        Save game when application is closed, so that it can be continued
+
+        Game that has ended is not saved and its earlier save is removed.
+
+        .. versionadded:: 0.16
+        """
+        if self.save_path is None or self.world.player is None:
+            return
+        if self.saved_game is None:
+            self.saved_game = SaveGame(self.save_path, self.config.level_pager)
+        if self.world.end_condition == 0:
+            self.saved_game.save(self.world)
+        else:
+            self.saved_game.remove()
+
     def run(self, user_interface):
         """
         Starts the application
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Common routines for benchmarks
+
+.. versionadded:: 0.16
+"""
+import random
+from timeit import default_timer
+
+import hy  # noqa
+import herculeum.config.levels
+from herculeum.config import Configuration
+from pyherc.data import Model
+
+
+class HeadlessSurfaceManager():
+    """
+    Surface manager that does not load or show any graphics
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.icons = {}
+
+    def load_resources(self):
+        """
+        Load graphics from files
+        """
+        pass
+
+    def add_icon(self, key, filename, ascii_char, attributes=None):
+        """
+        Add icon to internal collection
+        """
+        if not (hasattr(key, 'upper') or hasattr(key, 'real')):
+            key = key[0]
+        self.icons[key] = ascii_char
+        return key
+
+    def get_icon(self, id):
+        """
+        Get icon with ID
+        """
+        return self.icons.get(id, ' ')
+
+
+def create_configuration(seed, level_cache=None):
+    """
+    Create and initialise configuration for headless use
+
+    :param seed: seed for random number generators
+    :type seed: int
+    :param level_cache: directory for caching generated levels, None for
+                        no caching
+    :type level_cache: string
+    :returns: initialised configuration
+    :rtype: Configuration
+    """
+    random.seed(seed)
+    config = Configuration(Model(),
+                           herculeum.config.levels,
+                           None,
+                           HeadlessSurfaceManager())
+    config.rng.seed(seed)
+    config.level_cache_path = level_cache
+    config.initialise()
+    return config
+
+
+def generate_level(config, name):
+    """
+    Generate level with given name
+
+    :param config: configuration to use
+    :type config: Configuration
+    :param name: name of the level
+    :type name: string
+    :returns: generated level
+    :rtype: Level
+    """
+    generator = config.level_generator_factory.get_generator(name)
+    return generator(None)
+
+
+def measure(function, repeats):
+    """
+    Measure how long calling function takes
+
+    :param function: function to call without parameters
+    :type function: function
+    :param repeats: how many times function is called
+    :type repeats: int
+    :returns: total time in seconds
+    :rtype: float
+    """
+    start = default_timer()
+    for _ in range(repeats):
+        function()
+    return default_timer() - start
+
+
+def report(title, results):
+    """
+    Print results of benchmark
+
+    :param title: title of the benchmark
+    :type title: string
+    :param results: pairs of name and time in seconds
+    :type results: [(string, float)]
+    """
+    print(title)
+    for name, seconds in results:
+        print('  {0:<40} {1:>10.4f} s'.format(name, seconds))
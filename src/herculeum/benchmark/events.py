@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark for creating and delivering events
+
+Simulates turns of heavy combat, where every character in the level attacks
+another character, damages it and moves. Events of these turns are created
+and delivered through the model to player and to characters noticing them.
+Cost of single event and memory allocated for it are reported.
+
+Usage:
+  events [--seed=SEED] [--turns=COUNT] [--start=NAME]
+
+Options:
+  --seed=SEED      Seed for random number generators [default: 1]
+  --turns=COUNT    Amount of combat turns to simulate [default: 1000]
+  --start=NAME     Level to fight in [default: upper catacombs]
+
+.. versionadded:: 0.16
+"""
+import tracemalloc
+
+from docopt import docopt
+
+from herculeum.benchmark.common import measure, report
+from herculeum.benchmark.simulation import start_game
+from pyherc.data import get_characters
+from pyherc.events import (damage_triggered, new_attack_hit_event,
+                           new_hit_points_changed_event, new_move_event,
+                           new_notice_event)
+
+
+def combat_turn(characters):
+    """
+    Create events of one turn of combat
+
+    :param characters: characters fighting each other
+    :type characters: [Character]
+    :returns: events in order they were raised
+    :rtype: [Event]
+    """
+    events = []
+    for character, target in zip(characters, characters[1:] + characters[:1]):
+        events.append(new_notice_event(character, target))
+        events.append(new_move_event(character, character.location,
+                                     character.level, 1))
+        events.append(new_attack_hit_event('melee', character, target,
+                                           None))
+        events.append(damage_triggered(target, 1, 'crushing'))
+        events.append(new_hit_points_changed_event(target, target.hit_points,
+                                                   target.hit_points - 1))
+    return events
+
+
+def allocated_per_event(characters):
+    """
+    Measure memory allocated for events of one turn
+
+    :param characters: characters fighting each other
+    :type characters: [Character]
+    :returns: bytes per event
+    :rtype: float
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = combat_turn(characters)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(events)
+
+
+def benchmark_events(model, characters, turns):
+    """
+    Benchmark creating and delivering events
+
+    :param model: model to raise events in
+    :type model: Model
+    :param characters: characters fighting each other
+    :type characters: [Character]
+    :param turns: amount of turns to simulate
+    :type turns: int
+    :returns: pairs of name and time in seconds
+    :rtype: [(string, float)]
+    """
+    def create():
+        combat_turn(characters)
+
+    def deliver():
+        for event in combat_turn(characters):
+            model.raise_event(event)
+
+    return [('creating', measure(create, turns)),
+            ('creating and delivering', measure(deliver, turns))]
+
+
+def main(arguments):
+    """
+    Run benchmark
+
+    :param arguments: parsed command line arguments
+    :type arguments: dict
+    """
+    config = start_game(int(arguments['--seed']), 'Warrior',
+                        arguments['--start'])
+    model = config.model
+    characters = list(get_characters(model.player.level))
+    turns = int(arguments['--turns'])
+    count = turns * len(combat_turn(characters))
+
+    results = benchmark_events(model, characters, turns)
+    report('{0} events in {1} turns'.format(count, turns), results)
+    for name, seconds in results:
+        print('  {0:<40} {1:>10.2f} us/event'.format(name,
+                                                    seconds * 1e6 / count))
+    print('  {0:<40} {1:>10.0f} bytes/event'.format(
+        'allocated', allocated_per_event(characters)))
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark for field of view calculation
+
+Usage:
+  fov [--seed=SEED] [--radius=RADIUS] [--levels=NAMES]
+
+Options:
+  --seed=SEED      Seed for level generation [default: 1]
+  --radius=RADIUS  Radius of field of view [default: 8]
+  --levels=NAMES   Comma separated list of levels
+                   [default: upper catacombs,upper caverns]
+
+.. versionadded:: 0.16
+"""
+from docopt import docopt
+
+from herculeum.benchmark.common import (create_configuration, generate_level,
+                                        measure, report)
+from pyherc.data import get_tiles, blocks_movement
+from pyherc.rules.fov import calculate_fov, get_fov
+from pyherc.rules.los import get_fov_matrix
+
+
+def origins(level):
+    """
+    Locations where field of view is calculated from
+
+    :param level: level to use
+    :type level: Level
+    :returns: all locations where character could stand
+    :rtype: [(int, int)]
+    """
+    return [location for location, tile in get_tiles(level)
+            if not blocks_movement(level, location)]
+
+
+def benchmark_level(level, radius):
+    """
+    Benchmark field of view calculation in a level
+
+    :param level: level to use
+    :type level: Level
+    :param radius: radius of field of view
+    :type radius: int
+    :returns: pairs of name and time in seconds
+    :rtype: [(string, float)]
+    """
+    locations = origins(level)
+
+    def recursive():
+        for location in locations:
+            get_fov_matrix(location, level, radius)
+
+    def tables():
+        for location in locations:
+            calculate_fov(location, level, radius)
+
+    def cached():
+        for location in locations:
+            get_fov(location, level, radius)
+
+    return [('recursive shadowcasting', measure(recursive, 1)),
+            ('octant tables', measure(tables, 1)),
+            ('octant tables, filling cache', measure(cached, 1)),
+            ('octant tables, cached', measure(cached, 1))]
+
+
+def main(arguments):
+    """
+    Run benchmark
+
+    :param arguments: parsed command line arguments
+    :type arguments: dict
+    """
+    seed = int(arguments['--seed'])
+    radius = int(arguments['--radius'])
+    config = create_configuration(seed)
+
+    for name in arguments['--levels'].split(','):
+        level = generate_level(config, name.strip())
+        report('{0}, {1} origins, radius {2}'.format(name.strip(),
+                                                   len(origins(level)),
+                                                   radius),
+               benchmark_level(level, radius))
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Benchmark for path finding
+
+Usage:
+  pathfinding [--seed=SEED] [--paths=COUNT] [--levels=NAMES]
+
+Options:
+  --seed=SEED      Seed for level generation [default: 1]
+  --paths=COUNT    Amount of paths to find per level [default: 50]
+  --levels=NAMES   Comma separated list of levels
+                   [default: upper catacombs,upper caverns]
+
+.. versionadded:: 0.16
+"""
+from random import Random
+
+from docopt import docopt
+
+from herculeum.ai.movement import whole_level
+from herculeum.benchmark.common import (create_configuration, generate_level,
+                                        measure, report)
+from pyherc.ai.pathfinding import a_star, jump_point_search
+from pyherc.data import get_tiles, blocks_movement, new_level, floor_tile
+
+
+def long_routes(level, count, rng):
+    """
+    Select pairs of locations that are far apart from each other
+
+    :param level: level to use
+    :type level: Level
+    :param count: amount of pairs
+    :type count: int
+    :param rng: random number generator
+    :type rng: Random
+    :returns: pairs of start and goal
+    :rtype: [((int, int), (int, int))]
+    """
+    free = [location for location, tile in get_tiles(level)
+            if not blocks_movement(level, location)]
+    routes = []
+    while len(routes) < count:
+        start, goal = rng.choice(free), rng.choice(free)
+        if abs(start[0] - goal[0]) + abs(start[1] - goal[1]) > 40:
+            routes.append((start, goal))
+    return routes
+
+
+def open_level(size):
+    """
+    Create level without any walls
+
+    :param size: size of the level
+    :type size: (int, int)
+    :returns: level
+    :rtype: Level
+    """
+    level = new_level(None)
+    for loc_x in range(size[0]):
+        for loc_y in range(size[1]):
+            floor_tile(level, (loc_x, loc_y), 'floor')
+    return level
+
+
+def benchmark_level(level, routes):
+    """
+    Benchmark path finding in a level
+
+    :param level: level to use
+    :type level: Level
+    :param routes: pairs of start and goal
+    :type routes: [((int, int), (int, int))]
+    :returns: pairs of name and time in seconds
+    :rtype: [(string, float)]
+    """
+    find_path = a_star(whole_level())
+
+    def with_a_star():
+        for start, goal in routes:
+            find_path(start, goal, level)
+
+    def with_jump_points():
+        for start, goal in routes:
+            jump_point_search(start, goal, level)
+
+    return [('a*', measure(with_a_star, 1)),
+            ('jump point search', measure(with_jump_points, 1))]
+
+
+def main(arguments):
+    """
+    Run benchmark
+
+    :param arguments: parsed command line arguments
+    :type arguments: dict
+    """
+    seed = int(arguments['--seed'])
+    count = int(arguments['--paths'])
+    rng = Random(seed)
+    config = create_configuration(seed)
+
+    levels = [(name.strip(), generate_level(config, name.strip()))
+              for name in arguments['--levels'].split(',')]
+    levels.append(('open 200x60', open_level((200, 60))))
+
+    for name, level in levels:
+        report('{0}, {1} paths'.format(name, count),
+               benchmark_level(level, long_routes(level, count, rng)))
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Headless simulation of full games
+
+Generates levels, places a player controlled by a simple script in the
+start level and plays given amount of player turns without user interface.
+Game is played three times with same seed: once for measuring speed, once
+under profiler for measuring time spent in different subsystems and once
+for counting and timing actions per action type, including moving,
+attacking and waiting that are rules in vtable. Results
+are printed and optionally written as JSON, so they can be compared run to
+run.
+
+Usage:
+  simulation [--seed=SEED] [--turns=COUNT] [--player=MODE] [--class=NAME]
+             [--start=NAME] [--levels=NAMES] [--output=FILE] [--cache=DIR]
+
+Options:
+  --seed=SEED      Seed for random number generators [default: 1]
+  --turns=COUNT    Amount of player turns to simulate [default: 500]
+  --player=MODE    random, wait or comma separated list of directions
+                   to repeat [default: random]
+  --class=NAME     Character class of player [default: Warrior]
+  --start=NAME     Level to start from, use a populated level so that AI
+                   and path finding get exercised [default: upper catacombs]
+  --levels=NAMES   Comma separated list of levels to time generation of,
+                   all levels by default
+  --output=FILE    Write results as JSON into a file, - for standard output
+  --cache=DIR      Read levels from cache in given directory instead of
+                   generating them, generated levels are added to cache
+
+.. versionadded:: 0.16
+"""
+import cProfile
+import json
+import os
+import pstats
+import sys
+from random import Random
+from timeit import default_timer
+
+from docopt import docopt
+
+import pyherc
+from herculeum.benchmark.common import (create_configuration, generate_level,
+                                        report)
+from herculeum.ui.controllers.moving import MoveController
+from pyherc.data.constants import Duration
+from pyherc.generators import generate_dungeon
+from pyherc.rules.public import ActionStatistics
+
+SUBSYSTEMS = {'ai': [(('pyherc', 'data', 'character.py'), 'act')],
+              'perception': [(('herculeum', 'ai', 'combat.hy'),
+                              'detected_enemies')],
+              'pathfinding': [(('pyherc', 'ai', 'pathfinding.py'), 'a_star'),
+                              (('pyherc', 'ai', 'pathfinding.py'),
+                               'jump_point_search'),
+                              (('pyherc', 'ai', 'distancemap.py'),
+                               'distance_map')],
+              'events': [(('pyherc', 'data', 'model.py'), 'raise_event')]}
+
+
+def random_walk(rng):
+    """
+    Create player script that walks to random directions
+
+    :param rng: random number generator
+    :type rng: Random
+    :returns: function selecting direction for next turn
+    :rtype: function
+    """
+    return lambda turn: rng.randint(1, 8)
+
+
+def waiting():
+    """
+    Create player script that only waits
+
+    :returns: function selecting direction for next turn
+    :rtype: function
+    """
+    return lambda turn: None
+
+
+def repeating(directions):
+    """
+    Create player script that repeats given directions
+
+    :param directions: directions to move to
+    :type directions: [int]
+    :returns: function selecting direction for next turn
+    :rtype: function
+    """
+    return lambda turn: directions[turn % len(directions)]
+
+
+def create_script(mode, rng):
+    """
+    Create player script from command line option
+
+    :param mode: random, wait or comma separated list of directions
+    :type mode: string
+    :param rng: random number generator
+    :type rng: Random
+    :returns: function selecting direction for next turn
+    :rtype: function
+    """
+    if mode == 'random':
+        return random_walk(rng)
+    if mode == 'wait':
+        return waiting()
+    return repeating([int(direction) for direction in mode.split(',')])
+
+
+def start_game(seed, class_name, start_level=None, level_cache=None):
+    """
+    Create configuration, player and start of the dungeon
+
+    :param seed: seed for random number generators
+    :type seed: int
+    :param class_name: name of character class of player
+    :type class_name: string
+    :param start_level: name of level to start from, None for default
+    :type start_level: string
+    :param level_cache: directory for caching levels, None for no caching
+    :type level_cache: string
+    :returns: initialised configuration
+    :rtype: Configuration
+    """
+    config = create_configuration(seed, level_cache)
+    model = config.model
+    model.player = config.player_generator(class_name)
+    model.dungeon = generate_dungeon(model,
+                                     start_level or config.start_level)
+    return config
+
+
+def play(config, script, turns):
+    """
+    Play game until player has taken given amount of turns or game ends
+
+    :param config: configuration with game started
+    :type config: Configuration
+    :param script: function selecting direction for player
+    :type script: function
+    :param turns: amount of player turns to play
+    :type turns: int
+    :returns: amount of turns player took
+    :rtype: int
+    """
+    model = config.model
+    player = model.player
+    controller = MoveController(action_factory=None, rng=config.rng)
+
+    for turn in range(turns):
+        if model.process_npcs(config.rules_engine) is not player:
+            return turn
+        if model.end_condition != 0:
+            return turn
+
+        tick = player.tick
+        direction = script(turn)
+        if direction is not None:
+            controller.move_or_attack(player, direction)
+        if player.tick == tick:
+            pyherc.vtable['\ufdd0:wait'](player, Duration.fast)
+
+    return turns
+
+
+def subsystem_times(profile):
+    """
+    Collect time spent in subsystems from profiling results
+
+    Times are cumulative, so time of a subsystem includes time of everything
+    it called. Time of AI for example includes path finding done by AI.
+
+    :param profile: profiler used to run the game
+    :type profile: Profile
+    :returns: seconds and call counts keyed by subsystem
+    :rtype: {string: {string: float}}
+    """
+    stats = pstats.Stats(profile).stats
+    times = {}
+    for subsystem, functions in sorted(SUBSYSTEMS.items()):
+        seconds = 0.0
+        calls = 0
+        for path, name in functions:
+            suffix = os.path.join(*path)
+            for (filename, _, function), entry in stats.items():
+                if function == name and filename.endswith(suffix):
+                    calls = calls + entry[1]
+                    seconds = seconds + entry[3]
+        times[subsystem] = {'seconds': seconds, 'calls': calls}
+    return times
+
+
+def time_level_generation(seed, names):
+    """
+    Measure how long generating levels takes
+
+    :param seed: seed for random number generators
+    :type seed: int
+    :param names: names of levels to generate, None for all levels
+    :type names: [string]
+    :returns: seconds keyed by name of level
+    :rtype: {string: float}
+    """
+    config = create_configuration(seed)
+    if names is None:
+        names = sorted(config.level_generator_factory.config)
+    times = {}
+    for name in names:
+        start = default_timer()
+        generate_level(config, name)
+        times[name] = default_timer() - start
+    return times
+
+
+def simulate(seed, turns, mode, class_name, start_level=None,
+             level_names=None, level_cache=None):
+    """
+    Run simulation and collect results
+
+    :param seed: seed for random number generators
+    :type seed: int
+    :param turns: amount of player turns to simulate
+    :type turns: int
+    :param mode: random, wait or comma separated list of directions
+    :type mode: string
+    :param class_name: name of character class of player
+    :type class_name: string
+    :param start_level: name of level to start from, None for default
+    :type start_level: string
+    :param level_names: names of levels to time generation of, None for all
+    :type level_names: [string]
+    :param level_cache: directory for caching levels, None for no caching
+    :type level_cache: string
+    :returns: results of the simulation
+    :rtype: dict
+    """
+    config = start_game(seed, class_name, start_level, level_cache)
+    start = default_timer()
+    played = play(config, create_script(mode, Random(seed)), turns)
+    elapsed = default_timer() - start
+
+    config = start_game(seed, class_name, start_level, level_cache)
+    profile = cProfile.Profile()
+    profile.enable()
+    play(config, create_script(mode, Random(seed)), turns)
+    profile.disable()
+
+    subsystems = subsystem_times(profile)
+
+    config = start_game(seed, class_name, start_level, level_cache)
+    statistics = ActionStatistics()
+    config.action_factory.statistics = statistics
+    statistics.instrument(pyherc.vtable)
+    try:
+        play(config, create_script(mode, Random(seed)), turns)
+    finally:
+        statistics.restore(pyherc.vtable)
+
+    return {'seed': seed,
+            'player': mode,
+            'start': start_level or config.start_level,
+            'turns': played,
+            'actions': subsystems['ai']['calls'] + played,
+            'seconds': elapsed,
+            'turns_per_second': played / elapsed if elapsed else 0.0,
+            'level_generation': time_level_generation(seed, level_names),
+            'subsystems': subsystems,
+            'actions_by_type': statistics.report()}
+
+
+def main(arguments):
+    """
+    Run simulation
+
+    :param arguments: parsed command line arguments
+    :type arguments: dict
+    """
+    level_names = None
+    if arguments['--levels']:
+        level_names = [name.strip()
+                       for name in arguments['--levels'].split(',')]
+
+    results = simulate(int(arguments['--seed']),
+                       int(arguments['--turns']),
+                       arguments['--player'],
+                       arguments['--class'],
+                       arguments['--start'],
+                       level_names,
+                       arguments['--cache'])
+
+    output = arguments['--output']
+    if output == '-':
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        return
+
+    report('{0} turns, {1} actions, {2:.1f} turns/s'.format(
+        results['turns'], results['actions'], results['turns_per_second']),
+           [('playing', results['seconds'])])
+    report('level generation',
+           sorted(results['level_generation'].items()))
+    report('subsystems (profiled, cumulative)',
+           [(name, values['seconds'])
+            for name, values in sorted(results['subsystems'].items())])
+    report('actions (executed, cumulative)',
+           [('{0} x{1}'.format(name,
+                               stages.get('execution', {}).get('calls', 0)),
+             sum(stage['seconds'] for stage in stages.values()))
+            for name, stages in sorted(results['actions_by_type'].items())])
+
+    if output:
+        with open(output, 'w') as results_file:
+            json.dump(results, results_file, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -28,3 +28,4 @@ from herculeum.test.integration.test_scroll_creation import *
 
 from herculeum.test.unit.test_society import *
 from herculeum.test.unit.test_mouse import *
+from herculeum.test.unit.test_names import *
@@ -25,14 +25,38 @@ Module for testing main configuration
 """
 
 #pylint: disable=W0614
+import random
+
 import herculeum.config.levels
-from hamcrest import assert_that, is_, not_none  # pylint: disable-msg=E0611
+from hamcrest import assert_that, is_, not_none, equal_to  # pylint: disable-msg=E0611
 from herculeum.config import Configuration
 from mockito import mock
-from pyherc.data import Model
+from pyherc.data import Model, get_items
 from pyherc.ports.inventory import InventoryParameters
 
 
+def generate_items(seed, level_name):
+    """
+    Generate level with fresh configuration and list its items
+
+    :param seed: seed for random number generators
+    :type seed: int
+    :param level_name: name of level to generate
+    :type level_name: string
+    :returns: location and name of each item, sorted
+    :rtype: [((int, int), string)]
+    """
+    random.seed(seed)
+    config = Configuration(Model(),
+                           herculeum.config.levels,
+                           mock(),
+                           mock())
+    config.rng.seed(seed)
+    config.initialise()
+    level = config.level_generator_factory.get_generator(level_name)(None)
+    return sorted((item.location, item.name) for item in get_items(level))
+
+
 class TestMainConfiguration():
     """
     Tests for main configuration
@@ -216,3 +240,13 @@ class TestMainConfiguration():
         configuration phase
         """
         assert_that(self.config.player_generator, is_(not_none()))
+
+    def test_same_seed_generates_same_items(self):
+        """
+        Items, including artefacts, are same when level is generated twice
+        from same seed
+        """
+        first = generate_items(1, 'first gate')
+        second = generate_items(1, 'first gate')
+
+        assert_that(second, is_(equal_to(first)))
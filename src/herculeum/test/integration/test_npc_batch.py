@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Module for testing processing of characters in a batch
+"""
+
+from random import Random
+
+import pyherc
+from hamcrest import assert_that, is_, equal_to
+from herculeum.benchmark.simulation import random_walk, start_game
+from herculeum.ui.controllers.moving import MoveController
+from pyherc.data import get_characters
+from pyherc.data.constants import Duration
+
+
+def snapshot(model):
+    """
+    Record state of characters on level of player
+
+    :param model: model to record
+    :type model: Model
+    :returns: time of model and name, location, hit points and tick of
+              each character
+    :rtype: (int, [(string, (int, int), int, int)])
+    """
+    return (model.time,
+            [(character.name, character.location, character.hit_points,
+              character.tick)
+             for character in get_characters(model.player.level)])
+
+
+def take_turn(config, direction):
+    """
+    Let player move or attack to given direction, or wait
+
+    :param config: configuration with game started
+    :type config: Configuration
+    :param direction: direction to move to, None for waiting
+    :type direction: int
+    """
+    player = config.model.player
+    tick = player.tick
+    if direction is not None:
+        MoveController(action_factory=None,
+                       rng=config.rng).move_or_attack(player, direction)
+    if player.tick == tick:
+        pyherc.vtable['\ufdd0:wait'](player, Duration.fast)
+
+
+def play_one_at_time(config, script, turns):
+    """
+    Play game letting characters act one at a time
+
+    :param config: configuration with game started
+    :type config: Configuration
+    :param script: function selecting direction for player
+    :type script: function
+    :param turns: amount of player turns to play
+    :type turns: int
+    :returns: state of characters after each turn of player
+    :rtype: [(int, [(string, (int, int), int, int)])]
+    """
+    model = config.model
+    player = model.player
+    states = []
+    for turn in range(turns):
+        creature = model.get_next_creature(config.rules_engine)
+        while creature is not player and model.end_condition == 0:
+            creature.act()
+            creature = model.get_next_creature(config.rules_engine)
+        states.append(snapshot(model))
+        if model.end_condition != 0:
+            return states
+
+        take_turn(config, script(turn))
+    return states
+
+
+def play_in_batches(config, script, turns):
+    """
+    Play game letting characters act in batches
+
+    :param config: configuration with game started
+    :type config: Configuration
+    :param script: function selecting direction for player
+    :type script: function
+    :param turns: amount of player turns to play
+    :type turns: int
+    :returns: state of characters after each turn of player
+    :rtype: [(int, [(string, (int, int), int, int)])]
+    """
+    model = config.model
+    states = []
+    for turn in range(turns):
+        model.process_npcs(config.rules_engine)
+        states.append(snapshot(model))
+        if model.end_condition != 0:
+            return states
+
+        take_turn(config, script(turn))
+    return states
+
+
+def start(seed, level_name):
+    """
+    Start game in given level, with player that does not die easily
+
+    :param seed: seed for random number generators
+    :type seed: int
+    :param level_name: name of level to start from
+    :type level_name: string
+    :returns: configuration with game started
+    :rtype: Configuration
+    """
+    config = start_game(seed, 'Warrior', level_name)
+    config.model.player.hit_points = 1000
+    return config
+
+
+class TestNPCBatch():
+    """
+    Tests for processing characters in a batch
+    """
+    def test_batch_is_same_as_one_at_time(self):
+        """
+        Characters processed in a batch act like when processed one at time
+        """
+        for seed, level_name in [(1, 'upper mines'), (2, 'lower caverns')]:
+            expected = play_one_at_time(start(seed, level_name),
+                                        random_walk(Random(seed)), 100)
+            states = play_in_batches(start(seed, level_name),
+                                     random_walk(Random(seed)), 100)
+
+            assert_that(states, is_(equal_to(expected)))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Module for testing saving game when application is closed
+"""
+
+import os
+import shutil
+import tempfile
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to
+from herculeum.application import Application
+from herculeum.benchmark.simulation import (create_configuration, play,
+                                            random_walk, start_game)
+from pyherc.data.model import DIED_IN_DUNGEON
+from pyherc.data.savegame import INDEX_FILE
+
+
+def application(config, path):
+    """
+    Create application for given configuration, saving into given directory
+
+    :param config: configuration of the game
+    :type config: Configuration
+    :param path: directory for saved game
+    :type path: string
+    :returns: application
+    :rtype: Application
+    """
+    app = Application()
+    app.config = config
+    app.world = config.model
+    app.save_path = path
+    return app
+
+
+class TestSaveGame():
+    """
+    Tests for saving game on quit and loading it on start
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.path = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.path = tempfile.mkdtemp()
+
+    def teardown(self):
+        """
+        Remove saved files
+        """
+        shutil.rmtree(self.path)
+
+    def test_game_is_continued_from_save(self):
+        """
+        Game saved on quit is continued when application is started again
+        """
+        config = start_game(1, 'Warrior', 'upper mines')
+        play(config, random_walk(Random(1)), 50)
+        player = config.model.player
+        application(config, self.path).save_game()
+
+        app = application(create_configuration(1, None), self.path)
+
+        assert_that(app.load_game(), is_(equal_to(True)))
+        loaded = app.world.player
+        assert_that((loaded.name, loaded.location, loaded.hit_points),
+                    is_(equal_to((player.name, player.location,
+                                  player.hit_points))))
+        assert_that(play(app.config, random_walk(Random(1)), 10),
+                    is_(equal_to(10)))
+
+    def test_ended_game_is_not_continued(self):
+        """
+        Save is removed when application is closed after game has ended
+        """
+        config = start_game(1, 'Warrior', 'upper mines')
+        app = application(config, self.path)
+        app.save_game()
+        config.model.end_condition = DIED_IN_DUNGEON
+
+        app.save_game()
+
+        assert_that(os.path.exists(os.path.join(self.path, INDEX_FILE)),
+                    is_(equal_to(False)))
+        assert_that(application(create_configuration(1, None),
+                                self.path).load_game(),
+                    is_(equal_to(False)))
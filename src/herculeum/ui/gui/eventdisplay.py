@@ -51,7 +51,9 @@ class EventMessageDockWidget(QDockWidget):
         self.setWidget(self.message_display)
         self.setWindowTitle('Messages')
 
-        character.register_event_listener(self.message_display)
+        character.register_event_listener(
+            self.message_display,
+            self.message_display.event_types_to_show)
         self.message_display.set_point_of_view(character)
 
 
@@ -82,9 +82,13 @@ class QtUserInterface():
                                                      self.application.config.start_level))
 
         self.splash_screen.finish(main_window)
-        main_window.show_new_game()
+        if self.application.load_game():
+            main_window.show_saved_game()
+        else:
+            main_window.show_new_game()
 
         self.qt_app.exec_()
+        self.application.save_game()
 
 
 class MainWindow(QMainWindow):
@@ -168,12 +172,32 @@ class MainWindow(QMainWindow):
             intro_text = self.controller.setup_world(self.application.world,
                                                      player)
 
-            player.register_for_updates(self.map_window.hit_points_widget)
-            self.map_window.hit_points_widget.show_hit_points(player)
-            self.map_window.hit_points_widget.show_spirit_points(player)
-            self.map_window.message_widget.text_edit.setText(intro_text)
+            self.__show_game(player, intro_text)
 
-            self.__show_map_window()
+    def show_saved_game(self):
+        """
+        Show game loaded from save
+
+        .. versionadded:: 0.16
+        """
+        self.__show_game(self.application.world.player,
+                         'You continue your adventure.')
+
+    def __show_game(self, player, text):
+        """
+        Show map window for playing with given player
+
+        :param player: player character
+        :type player: Character
+        :param text: text to show in message window
+        :type text: string
+        """
+        player.register_for_updates(self.map_window.hit_points_widget)
+        self.map_window.hit_points_widget.show_hit_points(player)
+        self.map_window.hit_points_widget.show_spirit_points(player)
+        self.map_window.message_widget.text_edit.setText(text)
+
+        self.__show_map_window()
 
     def __show_map_window(self):
         """
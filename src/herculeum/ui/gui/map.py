@@ -197,6 +197,7 @@ class PlayMapWidget(QWidget):
             self.animation_timers[adapter].start(450 + adapter * 10)
 
         self.animations = []
+        self.batch_npcs = True
         self.move_controller = MoveController(action_factory = action_factory,
                                               rng = rng)
 
@@ -272,9 +273,18 @@ class PlayMapWidget(QWidget):
         self.__construct_scene(self.model, self.scene)
 
         self.model.player.register_for_updates(self)
-        self.model.register_event_listener(self)
+        self.__register_for_events()
         self.__center_view_on_character(self.model.player)
 
+    def __register_for_events(self):
+        """
+        Register to receive events that are animated in current level
+        """
+        self.model.register_event_listener(
+            self,
+            event_types=self.animation_factory.animations.keys(),
+            level=self.current_level)
+
     def __center_view_on_character(self, entity):
         """
         Center view on given entity
@@ -393,6 +403,7 @@ class PlayMapWidget(QWidget):
         if e_event_type(event) == 'move':
             if self.model.player.level != self.current_level:
                 self.__construct_scene(self.model, self.scene)
+                self.__register_for_events()
                 self.__center_view_on_character(self.model.player)
 
     def eventFilter(self, qobject, event): #pylint: disable-msg=C0103
@@ -481,6 +492,46 @@ class PlayMapWidget(QWidget):
     def process_npc(self):
         """
         Process npc characters
+
+        By default all characters acting before the player are processed
+        in one batch with :meth:`Model.process_npcs`. Setting
+        ``batch_npcs`` to False processes them one at a time.
+        """
+        if self.batch_npcs:
+            next_creature = self.model.process_npcs(self.rules_engine)
+
+            if next_creature is None:
+                self.model.end_condition = DIED_IN_DUNGEON
+        else:
+            self._process_npc_one_at_time()
+
+        if self.model.end_condition != 0:
+            self.EndScreenRequested.emit()
+        else:
+            self._schedule_pregeneration()
+
+    def _schedule_pregeneration(self):
+        """
+        Generate levels behind portals of current level when idle
+        """
+        pregenerator = self.configuration.level_pregenerator
+        if (pregenerator is not None
+                and pregenerator.has_pending(self.model.player.level)):
+            QTimer.singleShot(0, self._pregenerate_level)
+
+    def _pregenerate_level(self):
+        """
+        Generate single level and continue later if there are more
+        """
+        if self.model.player is None or self.model.player.level is None:
+            return
+        self.configuration.level_pregenerator.run_pending(
+            self.model.player.level, limit=1)
+        self._schedule_pregeneration()
+
+    def _process_npc_one_at_time(self):
+        """
+        Process npc characters, finding next character after every action
         """
         player = self.model.player
         next_creature = self.model.get_next_creature(self.rules_engine)
@@ -497,9 +548,6 @@ class PlayMapWidget(QWidget):
             if next_creature is None:
                 self.model.end_condition = DIED_IN_DUNGEON
 
-        if self.model.end_condition != 0:
-            self.EndScreenRequested.emit()
-
             
     def _move(self, key, modifiers):
         """
@@ -74,10 +74,13 @@ class CursesUserInterface():
                                                      self.application.item_generator,
                                                      self.application.config.start_level))
 
-        main_window.show_new_game()
+        if not self.application.load_game():
+            main_window.show_new_game()
         main_window.show_map_window()
 
         curses.echo()
         curses.nocbreak()
         curses.curs_set(1)
         curses.endwin()
+
+        self.application.save_game()
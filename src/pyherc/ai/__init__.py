@@ -25,4 +25,6 @@ Module containing AI routines for pyherc
 """
 
 from .base import ai_state, show_alert_icon, show_confusion_icon
-from .pathfinding import a_star
+from .pathfinding import a_star, jump_point_search
+from .distancemap import distance_map, downhill_step, follow_distance_map
+from .batch import prepare_npc_batch
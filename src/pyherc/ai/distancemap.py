@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Shared distance maps for characters moving towards same target
+
+Distance map holds distance of every location of a level from a target,
+measured in steps in cardinal directions. Any number of characters can
+then find their way to the target by stepping to a neighbouring location
+with smaller distance.
+
+Maps are cached per level and target. Cache is emptied when revision of
+the level changes and map of a target is calculated anew if the target
+moves to a new location.
+
+.. versionadded:: 0.16
+"""
+
+from array import array
+from collections import OrderedDict, deque
+
+from toolz import curry
+
+from pyherc.data import level_size, level_revision, movement_blocker
+
+DISTANCE_MAPS = '\ufdd0:distance-maps'
+MAX_MAPS = 64
+
+
+class DistanceMap():
+    """
+    Distances of all locations of a level from a target
+
+    .. versionadded:: 0.16
+    """
+    __slots__ = ('target', 'x_origin', 'y_origin', 'width', 'height',
+                 'distances')
+
+    def __init__(self, a_map, target):
+        """
+        Default constructor
+
+        :param a_map: level to calculate map for
+        :type a_map: Level
+        :param target: location of the target
+        :type target: (int, int)
+        """
+        x0, x1, y0, y1 = level_size(a_map)
+        self.target = target
+        self.x_origin, self.y_origin = x0, y0
+        self.width = width = x1 - x0 + 1
+        self.height = height = y1 - y0 + 1
+        self.distances = distances = array('i', [-1]) * (width * height)
+
+        target_index = self.index(target)
+        if target_index is None:
+            return
+
+        blocks = movement_blocker(a_map)
+        distances[target_index] = 0
+        queue = deque([target_index])
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            loc_x = index % width
+            loc_y = index // width
+            for next_x, next_y in ((loc_x, loc_y - 1), (loc_x + 1, loc_y),
+                                   (loc_x, loc_y + 1), (loc_x - 1, loc_y)):
+                if 0 <= next_x < width and 0 <= next_y < height:
+                    next_index = next_y * width + next_x
+                    if (distances[next_index] == -1
+                            and not blocks((next_x + x0, next_y + y0))):
+                        distances[next_index] = distance
+                        queue.append(next_index)
+
+    def index(self, location):
+        """
+        Index of location in distance array
+
+        :param location: location to check
+        :type location: (int, int)
+        :returns: index or None if location is outside of level
+        :rtype: int
+        """
+        loc_x = location[0] - self.x_origin
+        loc_y = location[1] - self.y_origin
+        if 0 <= loc_x < self.width and 0 <= loc_y < self.height:
+            return loc_y * self.width + loc_x
+        return None
+
+    def distance(self, location):
+        """
+        Distance of location from target
+
+        :param location: location to check
+        :type location: (int, int)
+        :returns: amount of steps or None if target can not be reached
+        :rtype: int
+        """
+        index = self.index(location)
+        if index is None or self.distances[index] == -1:
+            return None
+        return self.distances[index]
+
+    def downhill(self, location):
+        """
+        Next step from location towards target
+
+        :param location: location to step from
+        :type location: (int, int)
+        :returns: neighbouring location closer to target or None
+        :rtype: (int, int)
+        """
+        distance = self.distance(location)
+        if not distance:
+            return None
+        loc_x, loc_y = location
+        for next_location in ((loc_x, loc_y - 1), (loc_x + 1, loc_y),
+                              (loc_x, loc_y + 1), (loc_x - 1, loc_y)):
+            if self.distance(next_location) == distance - 1:
+                return next_location
+        return None
+
+    def path(self, start):
+        """
+        Path from start to target
+
+        :param start: location to start from
+        :type start: (int, int)
+        :returns: locations from start to target, empty if there's no path
+        :rtype: [(int, int)]
+        """
+        if self.distance(start) is None:
+            return []
+        path = [start]
+        step = self.downhill(start)
+        while step is not None:
+            path.append(step)
+            step = self.downhill(step)
+        return path
+
+
+def distance_map(a_map, target):
+    """
+    Get distance map of a target, calculating it if needed
+
+    :param a_map: level where target is
+    :type a_map: Level
+    :param target: location of the target
+    :type target: (int, int)
+    :returns: distance map for current revision of level
+    :rtype: DistanceMap
+    """
+    revision = level_revision(a_map)
+    cached = a_map.get(DISTANCE_MAPS)
+    if cached is None or cached[0] != revision:
+        cached = (revision, OrderedDict())
+        a_map[DISTANCE_MAPS] = cached
+
+    maps = cached[1]
+    found = maps.get(target)
+    if found is None:
+        found = DistanceMap(a_map, target)
+        maps[target] = found
+        if len(maps) > MAX_MAPS:
+            maps.popitem(last=False)
+    else:
+        maps.move_to_end(target)
+    return found
+
+
+@curry
+def downhill_step(start, goal, a_map):
+    """
+    Find next step towards goal using shared distance map
+
+    Only the neighbours of start are checked, so taking a step costs the
+    same regardless of how far away the goal is.
+
+    :param start: start location
+    :type start: (int, int)
+    :param goal: goal location
+    :type goal: (int, int)
+    :param a_map: level to search
+    :type a_map: Level
+    :returns: neighbouring location closer to goal, None if there is none
+    :rtype: (int, int)
+    """
+    return distance_map(a_map, goal).downhill(start)
+
+
+@curry
+def follow_distance_map(start, goal, a_map):
+    """
+    Find path to goal using shared distance map
+
+    Paths are as short as ones found by :func:`pyherc.ai.pathfinding.a_star`
+    moving in cardinal directions, but all characters heading towards the
+    same goal share the work. Whole route is walked, use
+    :func:`downhill_step` when only the next step is needed.
+
+    :param start: start location
+    :type start: (int, int)
+    :param goal: goal location
+    :type goal: (int, int)
+    :param a_map: level to search
+    :type a_map: Level
+    :returns: (path, connections, updated), like
+              :func:`pyherc.ai.pathfinding.a_star`
+    :rtype: ([(int, int)], dict, set)
+    """
+    return distance_map(a_map, goal).path(start), {}, set()
@@ -1,181 +1,425 @@
-"""{-
-Copyright (c) 2009 Pauli Henrikki Rikula
-
-Permission is hereby granted, free of charge, to any person
-obtaining a copy of this software and associated documentation
-files (the "Software"), to deal in the Software without
-restriction, including without limitation the rights to use,
-copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the
-Software is furnished to do so, subject to the following
-conditions:
-
-The above copyright notice and this permission notice shall be
-included in all copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
-EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
-OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
-NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
-HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
-WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
-OTHER DEALINGS IN THE SOFTWARE.
--}"""
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Path finding for levels
+
+Searches are done over integer grid covering the level. Scores and visited
+information are kept in flat arrays indexed by location, open set is a
+binary heap where outdated entries are skipped when they are popped.
+
+.. versionchanged:: 0.16
+   Rewritten to use heapq and flat arrays, jump point search added
+"""
+
+from heapq import heappush, heappop
+from math import hypot
 
 from toolz import curry
 
-from copy import copy
+from pyherc.data import level_size, level_revision, movement_blocker
 
-from pyherc.ai import pyheapq
-from pyherc.ai.heapset import HeapSet
-from pyherc.data import distance_between, heuristic_estimate_of_distance
-from pyherc.data import area_4_around, blocks_movement
+DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+NORTH_INDEX = 0
+SOUTH_INDEX = 2
 
-
-def reconstruct_path(came_from, current_node):
-    """
-    came_from : dictuonary of nodes and nodes before them in the shortest found path
-    current_node : the last node of the path
-    """
-    if current_node in came_from:
-        p = reconstruct_path(came_from, came_from[current_node])
-        return p + [current_node]
-    else:
-        return []
+JUMP_TABLE = '\ufdd0:jump-table'
 
 
-class HeapItem:
-    def __init__(self, y, goal, a_map, g_score):
+class SearchGrid():
+    """
+    Flat arrays covering the level, used during a single search
 
-        self.node = y
+    .. versionadded:: 0.16
+    """
+    __slots__ = ('x_origin', 'y_origin', 'width', 'height',
+                 'g_scores', 'parents', 'closed')
 
-        """ g_score = Distance from start along optimal path."""
-        self.g_score = g_score
+    def __init__(self, a_map):
+        """
+        Default constructor
 
-        """h_score the heuristic estimates of the distances to goal"""
-        self.h_score = heuristic_estimate_of_distance(y, goal)
+        :param a_map: level to search
+        :type a_map: Level
+        """
+        x0, x1, y0, y1 = level_size(a_map)
+        self.x_origin = x0
+        self.y_origin = y0
+        self.width = x1 - x0 + 1
+        self.height = y1 - y0 + 1
+        area = self.width * self.height
+        self.g_scores = [float('inf')] * area
+        self.parents = [-1] * area
+        self.closed = bytearray(area)
+
+    def index(self, location):
+        """
+        Index of location in arrays
 
-        """f_score Estimated total distance from start to goal through y."""
-        self.f_score = self.h_score + self.g_score
+        :param location: location to check
+        :type location: (int, int)
+        :returns: index or None if location is outside of level
+        :rtype: int
+        """
+        loc_x = location[0] - self.x_origin
+        loc_y = location[1] - self.y_origin
+        if 0 <= loc_x < self.width and 0 <= loc_y < self.height:
+            return loc_y * self.width + loc_x
+        return None
 
-    def as_tuple(self):
-        return (self.f_score, self.g_score, self.h_score, self.node)
+    def location(self, index):
+        """
+        Location of given index
 
-    def __hash__(self):
-        return self.as_tuple().__hash__()
+        :param index: index to convert
+        :type index: int
+        :rtype: (int, int)
+        """
+        return (index % self.width + self.x_origin,
+                index // self.width + self.y_origin)
 
-    def __repr__(self):
-        return str(self.as_tuple())
+    def path(self, start, goal):
+        """
+        Rebuild path from start to goal by following parents
+
+        :param start: start of the path
+        :type start: (int, int)
+        :param goal: end of the path
+        :type goal: (int, int)
+        :returns: locations from start to goal
+        :rtype: [(int, int)]
+        """
+        path = []
+        index = self.index(goal)
+        start_index = self.index(start)
+        while index != start_index:
+            path.append(self.location(index))
+            index = self.parents[index]
+        path.append(start)
+        path.reverse()
+        return path
 
-    def type_check(self, other):
-        return type(self) == type(other)
-    def __lt__(self, other):
-        return self.type_check(other) and self.as_tuple().__lt__(other.as_tuple())
-    def __le__(self, other):
-        return self.type_check(other) and self.as_tuple().__le__(other.as_tuple())
-    def __eq__(self, other):
-        return self.type_check(other) and self.as_tuple().__eq__(other.as_tuple())
-    def __ne__(self, other):
-        return self.type_check(other) and self.as_tuple().__ne__(other.as_tuple())
-    def __gt__(self, other):
-        return self.type_check(other) and self.as_tuple().__gt__(other.as_tuple())
-    def __ge__(self, other):
-        return self.type_check(other) and self.as_tuple().__ge__(other.as_tuple())
 
 @curry
 def a_star(adjacent_nodes, start, goal, a_map):
     """
-    start = the start node in a_map
-    goal = the goal node in a_map
-    a_map = a object that should inherit the Map class
-
-    returns a tuple (path, connections, uptated) where:
-      path is the optimal path (as a list of points) from the start to the goal. empty if not found,
-
-      connections and updated are for debugging (remove them from code if too slow..,):
-        connections is the came_from dictionary and
-        uptated is the set of the connections, which were uptated from the heap
-
+    Find shortest path between two locations
+
+    Cost of step between two locations is their euclidean distance.
+    Locations outside of level are never entered.
+
+    :param adjacent_nodes: function returning neighbours of a location
+    :type adjacent_nodes: function (level, location) -> [(int, int)]
+    :param start: start location
+    :type start: (int, int)
+    :param goal: goal location
+    :type goal: (int, int)
+    :param a_map: level to search
+    :type a_map: Level
+    :returns: (path, connections, updated), path is list of locations from
+              start to goal, empty if there is no path. Connections and
+              updated were used for debugging and are always empty.
+    :rtype: ([(int, int)], dict, set)
     """
+    grid = SearchGrid(a_map)
+    start_index = grid.index(start)
+    if start_index is None or grid.index(goal) is None:
+        return [], {}, set()
+
+    x_origin, y_origin = grid.x_origin, grid.y_origin
+    width, height = grid.width, grid.height
+    g_scores, parents, closed = grid.g_scores, grid.parents, grid.closed
+    goal_x, goal_y = goal
+
+    g_scores[start_index] = 0.0
+    estimate = hypot(start[0] - goal_x, start[1] - goal_y)
+    heap = [(estimate, estimate, 0.0, start_index, start)]
+
+    while heap:
+        f_score, h_score, g_score, index, node = heappop(heap)
+        if closed[index] or g_score > g_scores[index]:
+            continue
+        if node == goal:
+            return grid.path(start, goal), {}, set()
+        closed[index] = 1
+
+        node_x, node_y = node
+        for neighbour in adjacent_nodes(a_map, node):
+            loc_x = neighbour[0] - x_origin
+            loc_y = neighbour[1] - y_origin
+            if not (0 <= loc_x < width and 0 <= loc_y < height):
+                continue
+            neighbour_index = loc_y * width + loc_x
+            if closed[neighbour_index]:
+                continue
+            tentative_g = g_score + hypot(neighbour[0] - node_x,
+                                          neighbour[1] - node_y)
+            if tentative_g < g_scores[neighbour_index]:
+                g_scores[neighbour_index] = tentative_g
+                parents[neighbour_index] = index
+                estimate = hypot(neighbour[0] - goal_x, neighbour[1] - goal_y)
+                heappush(heap, (tentative_g + estimate, estimate, tentative_g,
+                                neighbour_index, neighbour))
 
-    """The set of nodes already evaluated."""
-    closedset = set([])
-
-
-    firstItem = HeapItem(start, goal, a_map, 0.0)
-
-    lastItem = None
+    return [], {}, set()
 
-    """
-    openDict is the set of tentative nodes to be evaluated
-    containing just the initial node
 
-    scoreHeap is used as priority queue for next steps.
+class JumpTable():
     """
+    Precomputed scanning information for jump point search
 
-    scoreHeap = HeapSet([firstItem])
-    openDict = {start:firstItem}
+    For each location and cardinal direction table holds how many passable
+    locations there are before a wall and how far is the next jump point.
+    Jump points are locations where shortest path may need to turn, when
+    paths are built by moving horizontally as early as possible.
 
+    Table is calculated once per revision of a level.
 
-    """ the second last node in the shortest path from start node"""
-    came_from = {}
+    .. versionadded:: 0.16
+    """
+    __slots__ = ('x_origin', 'y_origin', 'width', 'height', 'runs', 'jumps')
 
-    """this is the set of points which were uptated when they were in the heap
-    this is used only to debug the algorithm. remove if slows too much"""
-    updateset = set([])
+    def __init__(self, a_map):
+        """
+        Default constructor
 
-    while any(scoreHeap): # is not empty
+        :param a_map: level to calculate table for
+        :type a_map: Level
         """
-        the node in openset having
-        the lowest (f_score,g_score,h_score, position) value (f_score means the most ...)
+        x0, x1, y0, y1 = level_size(a_map)
+        self.x_origin, self.y_origin = x0, y0
+        self.width = width = x1 - x0 + 1
+        self.height = height = y1 - y0 + 1
+        area = width * height
+        blocks = movement_blocker(a_map)
+
+        passable = bytearray(area)
+        for index in range(area):
+            if not blocks((index % width + x0, index // width + y0)):
+                passable[index] = 1
+
+        def free(loc_x, loc_y):
+            return (0 <= loc_x < width and 0 <= loc_y < height
+                    and passable[loc_y * width + loc_x] == 1)
+
+        runs = [[0] * area for _ in range(4)]
+        jumps = [[0] * area for _ in range(4)]
+        run_n, run_e, run_s, run_w = runs
+        jump_n, jump_e, jump_s, jump_w = jumps
+
+        for loc_y in range(height):
+            for loc_x in range(width):
+                index = loc_y * width + loc_x
+                if loc_y > 0 and passable[index - width]:
+                    above = index - width
+                    run_n[index] = run_n[above] + 1
+                    if ((free(loc_x + 1, loc_y - 1)
+                         and not free(loc_x + 1, loc_y))
+                            or (free(loc_x - 1, loc_y - 1)
+                                and not free(loc_x - 1, loc_y))):
+                        jump_n[index] = 1
+                    elif jump_n[above]:
+                        jump_n[index] = jump_n[above] + 1
+
+        for loc_y in reversed(range(height)):
+            for loc_x in range(width):
+                index = loc_y * width + loc_x
+                if loc_y < height - 1 and passable[index + width]:
+                    below = index + width
+                    run_s[index] = run_s[below] + 1
+                    if ((free(loc_x + 1, loc_y + 1)
+                         and not free(loc_x + 1, loc_y))
+                            or (free(loc_x - 1, loc_y + 1)
+                                and not free(loc_x - 1, loc_y))):
+                        jump_s[index] = 1
+                    elif jump_s[below]:
+                        jump_s[index] = jump_s[below] + 1
+
+        for loc_y in range(height):
+            row = loc_y * width
+            for loc_x in range(1, width):
+                index = row + loc_x
+                left = index - 1
+                if passable[left]:
+                    run_w[index] = run_w[left] + 1
+                    if jump_n[left] or jump_s[left]:
+                        jump_w[index] = 1
+                    elif jump_w[left]:
+                        jump_w[index] = jump_w[left] + 1
+            for loc_x in reversed(range(width - 1)):
+                index = row + loc_x
+                right = index + 1
+                if passable[right]:
+                    run_e[index] = run_e[right] + 1
+                    if jump_n[right] or jump_s[right]:
+                        jump_e[index] = 1
+                    elif jump_e[right]:
+                        jump_e[index] = jump_e[right] + 1
+
+        self.runs = runs
+        self.jumps = jumps
+
+    def jump(self, location, direction, goal):
         """
-        x  = pyheapq.heappop(scoreHeap)
-
-        if x.node == goal:
-            if lastItem is None or lastItem.g_score > x.g_score:
-                lastItem = x
-
-            if not any(scoreHeap) or scoreHeap[0].f_score > lastItem.g_score:
-                return [start] + reconstruct_path(came_from, goal), came_from, updateset
-
-        del openDict[x.node]
-        closedset.add(x.node)
-
-        neighbornodes =  [
-            (x.g_score + distance_between(x.node, node_y),node_y )
-            for node_y in adjacent_nodes(a_map, x.node)
-            ]
-        #better sort here than update the heap ..
-        neighbornodes.sort()
+        Find next jump point from location to given direction
+
+        :param location: location to start from
+        :type location: (int, int)
+        :param direction: index of direction, 0 for north, 1 for east, 2 for
+                          south and 3 for west
+        :type direction: int
+        :param goal: goal of the search
+        :type goal: (int, int)
+        :returns: jump point and distance to it or None
+        :rtype: ((int, int), int)
+        """
+        loc_x, loc_y = location
+        index = ((loc_y - self.y_origin) * self.width
+                 + loc_x - self.x_origin)
+        step_x, step_y = DIRECTIONS[direction]
+        run = self.runs[direction][index]
+        distance = self.jumps[direction][index]
+
+        if step_x:
+            offset = (goal[0] - loc_x) * step_x
+            if 0 < offset <= run and (not distance or offset < distance):
+                if goal[1] == loc_y:
+                    distance = offset
+                else:
+                    vertical = NORTH_INDEX if goal[1] < loc_y else SOUTH_INDEX
+                    target = index + offset * step_x
+                    rise = abs(goal[1] - loc_y)
+                    jump = self.jumps[vertical][target]
+                    if (self.runs[vertical][target] >= rise
+                            and (not jump or jump >= rise)):
+                        distance = offset
+        elif goal[0] == loc_x:
+            offset = (goal[1] - loc_y) * step_y
+            if 0 < offset <= run and (not distance or offset < distance):
+                distance = offset
+
+        if not distance:
+            return None
+        return ((loc_x + step_x * distance, loc_y + step_y * distance),
+                distance)
+
+
+def jump_table(a_map):
+    """
+    Get jump table of a level, calculating it if needed
 
+    :param a_map: level
+    :type a_map: Level
+    :returns: table for current revision of level
+    :rtype: JumpTable
+    """
+    revision = level_revision(a_map)
+    cached = a_map.get(JUMP_TABLE)
+    if cached is None or cached[0] != revision:
+        cached = (revision, JumpTable(a_map))
+        a_map[JUMP_TABLE] = cached
+    return cached[1]
 
-        for tentative_g_score, node_y in neighbornodes:
 
-            if node_y in closedset:
+@curry
+def jump_point_search(start, goal, a_map):
+    """
+    Find shortest path between two locations in cardinal directions
+
+    Jump point search gives as short paths as :func:`a_star` with
+    neighbours being all passable locations in cardinal directions, but
+    considers only locations where path might turn. Scanning between jump
+    points uses precomputed table, that is kept until level changes. This
+    makes it considerably faster on levels with large open areas.
+
+    :param start: start location
+    :type start: (int, int)
+    :param goal: goal location
+    :type goal: (int, int)
+    :param a_map: level to search
+    :type a_map: Level
+    :returns: (path, connections, updated), like :func:`a_star`
+    :rtype: ([(int, int)], dict, set)
+
+    .. versionadded:: 0.16
+    """
+    grid = SearchGrid(a_map)
+    start_index = grid.index(start)
+    if (start_index is None or grid.index(goal) is None
+            or movement_blocker(a_map)(start)):
+        return [], {}, set()
+
+    table = jump_table(a_map)
+    g_scores, parents, closed = grid.g_scores, grid.parents, grid.closed
+    goal_x, goal_y = goal
+
+    g_scores[start_index] = 0
+    estimate = abs(start[0] - goal_x) + abs(start[1] - goal_y)
+    heap = [(estimate, estimate, 0, start_index, start)]
+
+    while heap:
+        f_score, h_score, g_score, index, node = heappop(heap)
+        if closed[index] or g_score > g_scores[index]:
+            continue
+        if node == goal:
+            return fill_path(grid.path(start, goal)), {}, set()
+        closed[index] = 1
+
+        for direction in range(4):
+            found = table.jump(node, direction, goal)
+            if found is None:
                 continue
+            jump_point, distance = found
+            jump_index = grid.index(jump_point)
+            if closed[jump_index]:
+                continue
+            tentative_g = g_score + distance
+            if tentative_g < g_scores[jump_index]:
+                g_scores[jump_index] = tentative_g
+                parents[jump_index] = index
+                estimate = (abs(jump_point[0] - goal_x)
+                            + abs(jump_point[1] - goal_y))
+                heappush(heap, (tentative_g + estimate, estimate, tentative_g,
+                                jump_index, jump_point))
 
+    return [], {}, set()
 
-            oldy = openDict.get(node_y, None)
-            y = copy(oldy)
-
-            y = HeapItem(node_y, goal, a_map, tentative_g_score)
-
-            if oldy is None:
-                openDict[node_y] = y
-                came_from[node_y] = x.node
-
-                pyheapq.heappush(scoreHeap, y)
-
-            elif tentative_g_score < oldy.g_score:
-                updateset.add( (node_y, came_from[node_y]) )
-
-                openDict[node_y] = y
-                came_from[node_y] = x.node
 
-                pyheapq.updateheapvalue(scoreHeap, scoreHeap.index(oldy), y)
+def fill_path(jump_points):
+    """
+    Fill in locations between jump points on a straight line
 
-    if lastItem is not None:
-        return [start] + reconstruct_path(came_from,goal), came_from, updateset
-    else:
-        return [], came_from, updateset
+    :param jump_points: jump points of path
+    :type jump_points: [(int, int)]
+    :returns: all locations of the path
+    :rtype: [(int, int)]
+    """
+    path = jump_points[:1]
+    for x, y in jump_points[1:]:
+        prev_x, prev_y = path[-1]
+        step_x = (x > prev_x) - (x < prev_x)
+        step_y = (y > prev_y) - (y < prev_y)
+        while (prev_x, prev_y) != (x, y):
+            prev_x, prev_y = prev_x + step_x, prev_y + step_y
+            path.append((prev_x, prev_y))
+    return path
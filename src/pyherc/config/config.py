@@ -33,7 +33,10 @@ from pyherc.generators import (generate_creature, get_effect_creator,
                                generate_artefact)
 from pyherc.generators.level.old_config import LevelGeneratorFactoryConfig
 from pyherc.generators.level.generator import LevelGeneratorFactory
+from pyherc.data.paging import LevelPager
+from pyherc.generators.level.pregeneration import LevelPregenerator
 from pyherc.generators.level import PortalAdderFactory, new_dungeon, merge_level
+from pyherc.generators.level import LevelCache, config_digest
 from pyherc.generators.level import portals
 from pyherc.ports import set_action_factory
 from pyherc.rules import RulesEngine
@@ -72,6 +75,9 @@ class Configuration():
         self.player_generator = None
         self.trap_generator = None
         self.level_generator_factory = None
+        self.level_pregenerator = None
+        self.level_pager = None
+        self.level_cache_path = None
         self.level_size = None
         self.model = model
         self.rng = random.Random()
@@ -291,7 +297,22 @@ class Configuration():
             config,
             self.rng)
 
-        pyherc.vtable["\ufdd0:generate-level"] = self.level_generator_factory
+        if self.level_cache_path:
+            self.level_generator_factory.cache = LevelCache(
+                self.level_cache_path,
+                self.model,
+                config_digest(context.config_package, pyherc.generators))
+
+        self.level_pregenerator = LevelPregenerator(
+            self.level_generator_factory,
+            self.rng)
+
+        pyherc.vtable["\ufdd0:generate-level"] = self.level_pregenerator
+        pyherc.vtable["\ufdd0:pregenerate-level"] = \
+            self.level_pregenerator.schedule
+
+        self.level_pager = LevelPager(self.model)
+        pyherc.vtable["\ufdd0:page-in-level"] = self.level_pager.page_in
 
     def extend_configuration(self, config, new_config):
         """
@@ -32,6 +32,7 @@ from .model import Model
 
 from .character import Character
 from .character import WeaponProficiency
+from .memory import ShortTermMemory
 
 from .item import Item
 from .new_item import (is_weapon, is_armour, is_potion, is_ammunition,
@@ -50,13 +51,19 @@ from .new_character import (is_skill_ready, cooldown, add_visited_level, visited
 from .level import (get_tile, new_tile, floor_tile, add_portal, get_portal,
                     wall_tile, tile, blocks_los, ornamentation,
                     level_size, find_free_space, blocks_movement,
-                    add_item, get_items, remove_item,
-                    add_character, remove_character, get_character,
-                    get_characters, free_passage,
+                    add_item, add_items, get_items, remove_item,
+                    add_character, add_characters, remove_character,
+                    get_character,
+                    get_characters, characters_within, characters_in_area,
+                    prepare_characters_within, release_characters_within,
+                    items_within, order_revision, level_activity,
+                    mark_activity, free_passage,
                     move_character, add_trap, get_traps, remove_trap,
                     add_location_tag, get_location_tags, get_locations_by_tag,
+                    free_locations_by_tag,
                     new_level, get_tiles,
                     location_features, add_location_feature,
                     remove_location_feature,
-                    level_name, level_description, safe_passage)
+                    level_name, level_description, safe_passage,
+                    movement_blocker, los_blocker, level_revision)
 from .locations import is_next_to_wall, is_corridor, is_open_area, is_doorframe
@@ -28,7 +28,9 @@ from pyherc.aspects import log_debug, log_info
 from pyherc.data.effects.effectscollection import EffectsCollection
 from pyherc.data.inventory import Inventory
 from pyherc.data.magic.spellbook import SpellBook
-from pyherc.events import (new_error_event, new_hit_points_changed_event,
+from pyherc.data.memory import ShortTermMemory
+from pyherc.events import (EventBus, new_error_event,
+                           new_hit_points_changed_event,
                            new_spirit_points_changed_event)
 
 
@@ -80,8 +82,8 @@ class Character():
         self.icon = None
         #internal
         self.tick = 0
-        self.short_term_memory = []
-        self.__event_listeners = []
+        self.short_term_memory = ShortTermMemory(self)
+        self.__event_listeners = EventBus()
         self.__update_listeners = []
         self.item_memory = {}
         self.size = 'medium'
@@ -101,6 +103,19 @@ class Character():
     def __str__(self):
         return self.name
 
+    def __getstate__(self):
+        """
+        Get state of character for saving
+
+        Event and update listeners belong to user interface and are left out.
+
+        .. versionadded:: 0.16
+        """
+        state = self.__dict__.copy()
+        state['_Character__event_listeners'] = EventBus()
+        state['_Character__update_listeners'] = []
+        return state
+
     @log_debug
     def receive_event(self, event):
         """
@@ -108,23 +123,28 @@ class Character():
 
         :param event: event to receive
         :type event: Event
-        """
-        self.short_term_memory.append(event)
 
-        for listener in self.__event_listeners:
-            listener.receive_event(event)
+        .. versionchanged:: 0.16
+           short term memory is bounded
+        """
+        self.short_term_memory.remember(event, self.model.time)
+        self.__event_listeners.publish(event)
 
     @log_debug
-    def register_event_listener(self, listener):
+    def register_event_listener(self, listener, event_types=None):
         """
         Register event listener
 
         :param listener: listener to add
         :type listener: Listener
+        :param event_types: types of events to relay, None for all
+        :type event_types: [string]
 
         .. versionadded:: 0.4
+        .. versionchanged:: 0.16
+           events can be filtered by type
         """
-        self.__event_listeners.append(listener)
+        self.__event_listeners.subscribe(listener, event_types)
 
     @log_debug
     def register_for_updates(self, listener):
@@ -386,7 +406,7 @@ class Character():
         :type trigger: string
 
         :returns: effect handles
-        :rtype: [EffectHandle]
+        :rtype: (EffectHandle)
 
         .. versionadded:: 0.4
         """
@@ -429,19 +449,55 @@ class Character():
         Get effects of the character
 
         :returns: effects
-        :rtype: [Effect]
+        :rtype: (Effect)
 
         .. versionadded:: 0.4
+        .. versionchanged:: 0.16
+           effects are returned as tuple
         """
-        effects = []
+        effects = self.__effects_collection.get_effects()
 
         if self.inventory.boots:
-            effects.extend(self.inventory.boots.get_effects())
-
-        effects.extend(self.__effects_collection.get_effects())
+            return self.inventory.boots.get_effects() + effects
 
         return effects
 
+    def advance_effects(self, elapsed):
+        """
+        Let time pass for effects of the character and its boots
+
+        :param elapsed: amount of time passed
+        :type elapsed: int
+        :returns: True if any effect triggered
+        :rtype: Boolean
+
+        .. versionadded:: 0.16
+        """
+        triggered = False
+        boots = self.inventory.boots
+        if boots:
+            triggered = boots.advance_effects(elapsed)
+        if self.__effects_collection.advance(elapsed):
+            triggered = True
+        return triggered
+
+    def next_effect_due(self):
+        """
+        Time left until the first effect of the character or its boots is due
+
+        :returns: time left or None if no effect is timed
+        :rtype: int
+
+        .. versionadded:: 0.16
+        """
+        due = self.__effects_collection.next_due
+        boots = self.inventory.boots
+        if boots:
+            boots_due = boots.next_effect_due()
+            if due is None or (boots_due is not None and boots_due < due):
+                due = boots_due
+        return due
+
     @log_debug
     def remove_expired_effects(self):
         """
@@ -30,7 +30,19 @@ class EffectsCollection():
     """
     Class for representing collection of effects
 
+    Effects are indexed by their names and handles by their triggers.
+    Effects and handles are returned as tuples that are built once and kept
+    until contents of the collection change.
+
+    Passing of time is recorded as pending time and the time left until the
+    first effect is due is kept at hand. Ticks of effects are updated only
+    when an effect is due or effects are retrieved, so time passes for
+    collections without due effects without touching any effect.
+
     .. versionadded:: 0.4
+    .. versionchanged:: 0.16
+       effects and handles are indexed and returned as cached tuples,
+       effects are updated only when one of them is due
     """
     def __init__(self):
         """
@@ -39,6 +51,11 @@ class EffectsCollection():
         super().__init__()
         self.handles = {}
         self.effects = []
+        self.names = {}
+        self.handle_views = {}
+        self.effect_view = None
+        self.pending = 0
+        self.next_due = None
 
     def add_effect_handle(self, handle):
         """
@@ -49,12 +66,8 @@ class EffectsCollection():
         """
         assert handle is not None
 
-        handles = self.handles
-        trigger = handle.trigger
-
-        if not trigger in handles:
-            handles[trigger] = []
-        handles[trigger].append(handle)
+        self.handles.setdefault(handle.trigger, []).append(handle)
+        self.handle_views.clear()
 
     def get_effect_handles(self, trigger=None):
         """
@@ -64,20 +77,20 @@ class EffectsCollection():
         :type trigger: string
 
         :returns: effect handles
-        :rtype: [EffectHandle]
+        :rtype: (EffectHandle)
+
+        .. versionchanged:: 0.16
+           handles are returned as tuple
         """
-        if trigger is None:
-            effects = []
-            for key in self.handles:
-                for handle in self.handles[key]:
-                    effects.append(handle)
-        else:
-            if trigger in self.handles:
-                effects = [x for x in self.handles[trigger]]
+        view = self.handle_views.get(trigger)
+        if view is None:
+            if trigger is None:
+                view = tuple(handle for handles in self.handles.values()
+                             for handle in handles)
             else:
-                effects = []
-
-        return effects
+                view = tuple(self.handles.get(trigger, ()))
+            self.handle_views[trigger] = view
+        return view
 
     def remove_effect_handle(self, handle):
         """
@@ -91,6 +104,7 @@ class EffectsCollection():
         for key, value in self.handles.items():
             if handle in value:
                 value.remove(handle)
+        self.handle_views.clear()
 
     def has_effect(self, effect):
         """
@@ -99,7 +113,7 @@ class EffectsCollection():
         :param effect: effect to check
         :type effect: Effect
         """
-        return effect.effect_name in [x.effect_name for x in self.effects]
+        return effect.effect_name in self.names
 
     def add_effect(self, effect):
         """
@@ -110,16 +124,30 @@ class EffectsCollection():
         """
         assert effect is not None
 
+        self.sync_ticks()
         self.effects.append(effect)
+        self.names[effect.effect_name] = (self.names.get(effect.effect_name,
+                                                         0) + 1)
+        self.effect_view = None
+        if effect.tick is not None:
+            if self.next_due is None or effect.tick < self.next_due:
+                self.next_due = effect.tick
 
     def get_effects(self):
         """
         Get effects from collection
 
         :returns: effects
-        :rtype: [Effect]
+        :rtype: (Effect)
+
+        .. versionchanged:: 0.16
+           effects are returned as tuple
         """
-        return [x for x in self.effects]
+        if self.pending:
+            self.sync_ticks()
+        if self.effect_view is None:
+            self.effect_view = tuple(self.effects)
+        return self.effect_view
 
     def get_expired_effects(self):
         """
@@ -136,8 +164,77 @@ class EffectsCollection():
         """
         Remove expired effects from collection
         """
+        expired = self.get_expired_effects()
+        if not expired:
+            return
+
         self.effects = [x for x in self.effects
-                        if x.duration > 0]
+                        if x.duration is None or x.duration > 0]
+        for effect in expired:
+            count = self.names[effect.effect_name] - 1
+            if count:
+                self.names[effect.effect_name] = count
+            else:
+                del self.names[effect.effect_name]
+        self.effect_view = None
+        self.update_next_due()
+
+    def sync_ticks(self):
+        """
+        Subtract pending time from ticks of effects
+
+        .. versionadded:: 0.16
+        """
+        pending = self.pending
+        if pending:
+            for effect in self.effects:
+                if effect.tick is not None:
+                    effect.tick = effect.tick - pending
+            self.pending = 0
+
+    def update_next_due(self):
+        """
+        Find time left until the first effect is due
+
+        .. versionadded:: 0.16
+        """
+        ticks = [effect.tick for effect in self.effects
+                 if effect.tick is not None]
+        if ticks:
+            self.next_due = min(ticks) - self.pending
+        else:
+            self.next_due = None
+
+    def advance(self, elapsed):
+        """
+        Let time pass and trigger effects that are due
+
+        Effects are triggered in order they were added. Effects added while
+        triggering are not advanced.
+
+        :param elapsed: amount of time passed
+        :type elapsed: int
+        :returns: True if any effect triggered
+        :rtype: Boolean
+
+        .. versionadded:: 0.16
+        """
+        if self.next_due is None:
+            return False
+
+        self.pending = self.pending + elapsed
+        self.next_due = self.next_due - elapsed
+        if self.next_due > 0:
+            return False
+
+        self.sync_ticks()
+        triggered = False
+        for effect in tuple(self.effects):
+            if effect.tick is not None and effect.tick <= 0:
+                effect.trigger()
+                triggered = True
+        self.update_next_due()
+        return triggered
 
     def get_charges_left(self):
         """
@@ -74,6 +74,18 @@ class Item():
     def __repr__(self):
         return str(self)
 
+    def __getstate__(self):
+        """
+        Get state of item for saving
+
+        Update listeners belong to user interface and are left out.
+
+        .. versionadded:: 0.16
+        """
+        state = self.__dict__.copy()
+        state['_Item__update_listeners'] = []
+        return state
+
     @log_debug
     def get_name(self, character, decorate=False):
         """
@@ -157,6 +169,30 @@ class Item():
         """
         return self.__effects_collection.has_effect(effect)
 
+    def advance_effects(self, elapsed):
+        """
+        Let time pass for effects of item
+
+        :param elapsed: amount of time passed
+        :type elapsed: int
+        :returns: True if any effect triggered
+        :rtype: Boolean
+
+        .. versionadded:: 0.16
+        """
+        return self.__effects_collection.advance(elapsed)
+
+    def next_effect_due(self):
+        """
+        Time left until the first effect of item is due
+
+        :returns: time left or None if no effect is timed
+        :rtype: int
+
+        .. versionadded:: 0.16
+        """
+        return self.__effects_collection.next_due
+
     @log_debug
     def get_expired_effects(self):
         """
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Short term memory of characters
+
+Characters remember events they have seen for a limited time. Memory has a
+fixed capacity and oldest events are forgotten first, so memory of a
+character stays bounded even in a long game. Events are indexed by their
+type and by other characters involved in them, so that questions like who
+has attacked the character recently can be answered without going through
+everything the character remembers.
+
+.. versionadded:: 0.16
+"""
+from collections import deque
+
+from pyherc.events import (e_attacker, e_character, e_deceased, e_event_type,
+                           e_new_character, e_target)
+
+PARTICIPANTS = (e_character, e_attacker, e_target, e_deceased,
+                e_new_character)
+
+
+class ShortTermMemory():
+    """
+    Bounded memory of recent events
+
+    Events are kept in a ring buffer together with time they were seen.
+    When memory is full or an event is older than duration of memory, it is
+    forgotten. Indexes by event type and by other character hold the same
+    entries in the same order, so forgetting the oldest entry removes it
+    from the front of each index it is in.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, owner, capacity=32, duration=50):
+        """
+        Default constructor
+
+        :param owner: character whose memory this is
+        :type owner: Character
+        :param capacity: maximum amount of events remembered
+        :type capacity: int
+        :param duration: how long events are remembered
+        :type duration: int
+        """
+        super().__init__()
+        self.owner = owner
+        self.capacity = capacity
+        self.duration = duration
+        self.entries = deque()
+        self.by_type = {}
+        self.by_character = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return (event for time, event, others in self.entries)
+
+    def remember(self, event, time):
+        """
+        Remember event and forget events that are too old
+
+        :param event: event to remember
+        :type event: Event
+        :param time: time when event was seen
+        :type time: int
+        """
+        self.decay(time)
+        if len(self.entries) >= self.capacity:
+            self.forget_oldest()
+
+        others = []
+        for participant in PARTICIPANTS:
+            character = participant(event)
+            if (character is not None and character is not self.owner
+                    and character not in others):
+                others.append(character)
+
+        entry = (time, event, others)
+        self.entries.append(entry)
+        self.by_type.setdefault(e_event_type(event), deque()).append(entry)
+        for character in others:
+            self.by_character.setdefault(character, deque()).append(entry)
+
+    def decay(self, time):
+        """
+        Forget events that are older than duration of memory
+
+        :param time: current time
+        :type time: int
+        """
+        oldest = time - self.duration
+        while self.entries and self.entries[0][0] < oldest:
+            self.forget_oldest()
+
+    def forget_oldest(self):
+        """
+        Forget the oldest remembered event
+        """
+        entry = self.entries.popleft()
+        time, event, others = entry
+        self.pop_index(self.by_type, e_event_type(event), entry)
+        for character in others:
+            self.pop_index(self.by_character, character, entry)
+
+    def pop_index(self, index, key, entry):
+        """
+        Remove entry from front of index, dropping keys that become empty
+
+        :param index: index to remove entry from
+        :type index: {object: deque}
+        :param key: key of entry in index
+        :param entry: entry to remove
+        :type entry: (int, Event, [Character])
+        """
+        entries = index[key]
+        assert entries[0] is entry
+        entries.popleft()
+        if not entries:
+            del index[key]
+
+    def clear(self):
+        """
+        Forget everything
+        """
+        self.entries.clear()
+        self.by_type.clear()
+        self.by_character.clear()
+
+    def index(self, event_type, character):
+        """
+        Select smallest index holding given events
+
+        :param event_type: type of events, None for all
+        :type event_type: string
+        :param character: character involved in events, None for all
+        :type character: Character
+        :returns: entries in order they were remembered
+        :rtype: deque
+        """
+        if character is not None:
+            return self.by_character.get(character, ())
+        if event_type is not None:
+            return self.by_type.get(event_type, ())
+        return self.entries
+
+    def events(self, event_type=None, character=None, since=None):
+        """
+        Get remembered events, newest first
+
+        :param event_type: type of events to get, None for all
+        :type event_type: string
+        :param character: get only events involving this character
+        :type character: Character
+        :param since: get only events seen at this time or later
+        :type since: int
+        :returns: matching events
+        :rtype: [Event]
+        """
+        events = []
+        for time, event, others in reversed(self.index(event_type,
+                                                       character)):
+            if since is not None and time < since:
+                break
+            if event_type is None or e_event_type(event) == event_type:
+                events.append(event)
+        return events
+
+    def latest(self, event_type=None, character=None):
+        """
+        Get the most recent remembered event
+
+        :param event_type: type of event to get, None for any
+        :type event_type: string
+        :param character: get only event involving this character
+        :type character: Character
+        :returns: matching event or None if there is no such event
+        :rtype: Event
+        """
+        for time, event, others in reversed(self.index(event_type,
+                                                       character)):
+            if event_type is None or e_event_type(event) == event_type:
+                return event
+        return None
+
+    def attackers(self, since=None):
+        """
+        Get characters who have attacked owner of memory, latest first
+
+        :param since: consider only attacks seen at this time or later
+        :type since: int
+        :returns: attacking characters
+        :rtype: [Character]
+        """
+        attacks = []
+        for event_type in ('attack hit', 'attack miss'):
+            for time, event, others in reversed(self.by_type.get(event_type,
+                                                                 ())):
+                if since is not None and time < since:
+                    break
+                if e_target(event) is self.owner:
+                    attacks.append((time, e_attacker(event)))
+
+        attackers = []
+        for time, attacker in sorted(attacks, key=lambda attack: -attack[0]):
+            if attacker not in attackers:
+                attackers.append(attacker)
+        return attackers
+
@@ -24,9 +24,15 @@
 Module for Model related classes
 """
 
+from math import ceil
+
+import pyherc
 from pyherc.aspects import log_debug
-from pyherc.data.level import get_characters
-from pyherc.events import e_level
+from pyherc.data.level import (get_characters, order_revision,
+                               mark_activity, prepare_characters_within,
+                               release_characters_within)
+from pyherc.data.new_character import perception_range
+from pyherc.events import EventBus
 
 ESCAPED_DUNGEON = 1
 DIED_IN_DUNGEON = 2
@@ -43,50 +49,98 @@ class Model():
         """
         super().__init__()
 
+        self.event_bus = EventBus()
         self.dungeon = None
-        self.player = None
+        self.__player = None
         self.config = None
         self.tables = None
-        self.__event_listeners = []
         self.end_condition = 0
+        self.time = 0
+
+    def __get_player(self):
+        """
+        Character controlled by player
+        """
+        return self.__player
+
+    def __set_player(self, player):
+        """
+        Set character controlled by player
+
+        Player receives all events raised in the model.
+
+        .. versionchanged:: 0.16
+           player is subscribed to event bus
+        """
+        if self.__player is not None:
+            self.event_bus.unsubscribe(self.__player)
+        self.__player = player
+        if player is not None:
+            self.event_bus.subscribe(player)
+
+    player = property(__get_player, __set_player)
 
     @log_debug
-    def register_event_listener(self, listener):
+    def register_event_listener(self, listener, event_types=None, level=None,
+                                character=None):
         """
         Registers event listener on this model
 
+        Registering a listener again replaces its earlier registration.
+
         :param listener: Listener to register
+        :param event_types: types of events to receive, None for all
+        :type event_types: [string]
+        :param level: receive only events in this level, None for all
+        :type level: Level
+        :param character: receive only events of this character, None for all
+        :type character: Character
+
+        .. versionchanged:: 0.16
+           events can be filtered
         """
         assert listener is not None
-        self.__event_listeners.append(listener)
+        self.event_bus.subscribe(listener, event_types, level, character)
+
+    @log_debug
+    def remove_event_listener(self, listener):
+        """
+        Removes event listener from this model
+
+        :param listener: Listener to remove
+
+        .. versionadded:: 0.16
+        """
+        self.event_bus.unsubscribe(listener)
 
     @log_debug
     def get_event_listeners(self):
         """
         Retrieve registered event listeners
         """
-        return self.__event_listeners[:]
+        return [listener for listener in self.event_bus.listeners()
+                if listener is not self.__player]
 
     @log_debug
     def raise_event(self, event):
         """
-        Relays event to creatures
+        Relays event to player and interested listeners
 
         :param event: event to relay
         :type event: dict
         """
-        level = e_level(event)
-
-        if self.player:
-            self.player.receive_event(event)
-
-        for listener in self.__event_listeners:
-            listener.receive_event(event)
+        self.event_bus.publish(event)
 
     def get_next_creature(self, rules_engine):
         """
         Get the character who is next to take action
 
+        Instead of advancing time one unit at a time, time is moved forward
+        directly to the next moment when a character gets to act or an
+        effect triggers. Resulting order of turns is the same.
+
+        Level of the player is marked active, see :func:`mark_activity`.
+
         :param rules_engine: engine containing rules
         :type rules_engine: RulesEngine
         :returns: Character to act next
@@ -97,24 +151,161 @@ class Model():
         if level is None:
             return None
 
-        creatures = list(get_characters(level))
+        mark_activity(level)
+        return next_creature(list(get_characters(level)), self)
+
+    def process_npcs(self, rules_engine):
+        """
+        Let other characters act until it is turn of the player
+
+        Characters are processed in a single batch. Instead of collecting
+        characters of the level for every turn, list is collected once and
+        refreshed only when order of characters in the level changes. Order
+        of turns is the same as when calling get_next_creature and act
+        repeatedly, so results stay deterministic.
+
+        Inputs shared by characters acting before the player are computed
+        before they act, see :meth:`prepare_batch`.
+
+        Level where characters act is marked active, so that it will be
+        saved again. Processing stops early if end condition is set. Events raised while
+        characters act are delivered in one batch when processing ends.
+
+        .. versionadded:: 0.16
+
+        :param rules_engine: engine containing rules
+        :type rules_engine: RulesEngine
+        :returns: Character to act next, None if player is not in a level
+        :rtype: Character
+        """
+        player = self.player
+        level = None
+        revision = None
+        creatures = None
+
+        self.event_bus.hold()
+        try:
+            while 1:
+                if player.level is None:
+                    return None
+
+                if player.level is not level:
+                    if level is not None:
+                        release_characters_within(level)
+                    level = player.level
+                    revision = None
+                    mark_activity(level)
+                    self.prepare_batch(level)
 
-        while 1:
-            for creature in creatures:
-                if creature.tick <= 0:
+                if order_revision(level) != revision:
+                    revision = order_revision(level)
+                    creatures = list(get_characters(level))
+
+                creature = next_creature(creatures, self)
+
+                if creature is player or self.end_condition != 0:
                     return creature
 
-            for creature in creatures:
-                creature.tick = creature.tick - 1
-                for effect in creature.get_effects():
-                    if effect.tick is not None:
-                        effect.tick = effect.tick - 1
-                        if effect.tick <= 0:
-                            effect.trigger()
+                creature.act()
+        finally:
+            if level is not None:
+                release_characters_within(level)
+            self.event_bus.release()
+
+    def prepare_batch(self, level):
+        """
+        Compute inputs shared by characters acting before the player
+
+        Characters whose tick is not past tick of the player are looked up
+        and characters within their perception range are found in advance.
+        These results are used until something moves within the range.
+        Rule prepare-npc-batch, if registered, computes inputs specific to
+        AI, like distance map to the player.
+
+        .. versionadded:: 0.16
+
+        :param level: level where characters act
+        :type level: Level
+        """
+        player = self.player
+        creatures = [creature for creature in get_characters(level)
+                     if creature is not player
+                     and creature.tick <= player.tick]
+
+        prepare_characters_within(level,
+                                  [(creature.location,
+                                    perception_range(creature))
+                                   for creature in creatures])
+
+        prepare = pyherc.vtable.get('\ufdd0:prepare-npc-batch')
+        if prepare is not None:
+            prepare(level, player, creatures)
+
+
+def next_creature(creatures, model=None):
+    """
+    Find next creature to act, advancing time as needed
+
+    :param creatures: creatures to consider, in order of precedence
+    :type creatures: [Character]
+    :param model: model whose time is advanced, None for no model
+    :type model: Model
+    :returns: Character to act next
+    :rtype: Character
+
+    Effects collections keep track of when their first effect is due, so
+    only effects that are due are touched. Effects expire only when they
+    trigger, so expired effects are looked for only in creatures whose
+    effects triggered.
+
+    .. versionchanged:: 0.16
+       time of model is advanced
+    """
+    while 1:
+        for creature in creatures:
+            if creature.tick <= 0:
+                return creature
+
+        elapsed = time_to_next_event(creatures)
+        if model is not None:
+            model.time = model.time + elapsed
+
+        for creature in creatures:
+            creature.tick = creature.tick - elapsed
+            if creature.advance_effects(elapsed):
                 creature.remove_expired_effects()
-                for skill, limit in creature.cooldowns.items():
-                    if limit > 0:
-                        creature.cooldowns[skill] = limit - 1
+            for skill, limit in creature.cooldowns.items():
+                if limit > 0:
+                    creature.cooldowns[skill] = limit - min(elapsed,
+                                                            ceil(limit))
+
+
+def time_to_next_event(creatures):
+    """
+    Calculate how much time can pass before something happens
+
+    Something happens when tick of a creature or an effect reaches zero.
+    Time is measured in whole units, as it has always been advanced one
+    unit at a time.
+
+    :param creatures: creatures to check
+    :type creatures: [Character]
+    :returns: amount of time until next event, at least 1
+    :rtype: int
+
+    .. versionadded:: 0.16
+    """
+    ticks = []
+    for creature in creatures:
+        ticks.append(creature.tick)
+        due = creature.next_effect_due()
+        if due is not None:
+            ticks.append(due)
+
+    if not ticks:
+        return 1
+
+    return max(1, ceil(min(ticks)))
 
 
 class Damage():
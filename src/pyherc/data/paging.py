@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Paging of levels to disk
+
+Levels player has left long ago are written into cache files and cleared
+from memory. Dictionary of the level stays in place, so portals and other
+objects referring to it remain valid, and it is filled again when player
+is about to enter it.
+
+Levels are written with the same machinery that is used for saving games.
+Characters and items of paged out level are only referred to weakly while
+the level is on disk. If something else, like memory of a character or an
+effect, still refers to them when the level is read back, same objects are
+filled again. Others are recreated. Portals are kept in memory, as levels
+are linked to each other through them.
+
+.. versionadded:: 0.16
+"""
+import os
+import tempfile
+import weakref
+
+from pyherc.data.level import get_characters, get_items
+from pyherc.data.portal import Portal
+from pyherc.data.savegame import (SaveGame, level_file, level_portals,
+                                  restore_state, read_file, write_file,
+                                  NAME, DESCRIPTION, PAGE)
+
+MODEL = '\ufdd0:model'
+
+
+def is_paged_out(level):
+    """
+    Check if level has been paged out
+
+    :param level: level to check
+    :type level: Level
+    :returns: True if level is paged out, otherwise False
+    :rtype: Boolean
+    """
+    return PAGE in level
+
+
+class LevelPager():
+    """
+    Keeps recently visited levels in memory and pages others out to disk
+
+    Level being entered and levels linked to it through portals are always
+    kept in memory, as are levels visited during last few level changes.
+    Other levels are paged out when player changes level.
+
+    Game can be saved while levels are paged out, if the pager is given to
+    :class:`SaveGame`. It reads them back with :meth:`page_in_all` first.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, model, keep=2, path=None):
+        """
+        Default constructor
+
+        :param model: model of the game
+        :type model: Model
+        :param keep: amount of recently visited levels kept in memory
+        :type keep: int
+        :param path: directory for cache files, temporary one if not given
+        :type path: string
+        """
+        super().__init__()
+        self.model = model
+        self.keep = keep
+        self.path = path
+        self.directory = None
+        self.save_game = None
+        self.levels = {}
+        self.recent = []
+        self.references = {}
+        self.dormant = {}
+
+    def cache(self):
+        """
+        Get save game used to write cache files, creating it if needed
+
+        :returns: save game
+        :rtype: SaveGame
+        """
+        if self.save_game is None:
+            if self.path is None:
+                self.directory = tempfile.TemporaryDirectory(prefix='pyherc-')
+                self.path = self.directory.name
+            os.makedirs(self.path, exist_ok=True)
+            self.save_game = SaveGame(self.path)
+        return self.save_game
+
+    def neighbours(self, level):
+        """
+        Get levels linked to given level through portals
+
+        :param level: level to check
+        :type level: Level
+        :returns: linked levels
+        :rtype: [Level]
+        """
+        if is_paged_out(level):
+            return []
+        linked = (portal.linked_portal() for portal in level_portals(level))
+        return [portal.level for portal in linked
+                if portal is not None and portal.level is not None]
+
+    def page_in(self, level):
+        """
+        Make sure level is in memory before entering it
+
+        Level is read back from cache if needed and levels that have not been
+        visited recently are paged out.
+
+        :param level: level about to be entered
+        :type level: Level
+        """
+        if is_paged_out(level):
+            self.read_level(level)
+        player = self.model.player
+        visited = [level]
+        if player is not None and player.level is not None:
+            visited.insert(0, player.level)
+        for current in visited:
+            self.levels[id(current)] = current
+            if id(current) in self.recent:
+                self.recent.remove(id(current))
+            self.recent.append(id(current))
+        del self.recent[:-self.keep - 1]
+
+        hot = set(self.recent)
+        if player is not None and player.level is not None:
+            hot.add(id(player.level))
+        for neighbour in self.neighbours(level):
+            self.levels[id(neighbour)] = neighbour
+            hot.add(id(neighbour))
+
+        for level_id, known in self.levels.items():
+            if level_id not in hot and not is_paged_out(known):
+                self.page_out(known)
+
+    def page_in_all(self):
+        """
+        Read all paged out levels back into memory
+        """
+        for level in self.levels.values():
+            if is_paged_out(level):
+                self.read_level(level)
+
+    def page_out(self, level):
+        """
+        Write level into cache file and clear it from memory
+
+        Characters and items of the level are forgotten, unless another paged
+        out level refers to them. Weak references to them are kept, so that
+        they can be reused if they are still alive when the level is read
+        back. Entities that the level refers to, but that are not in it, like
+        items in inventories of monsters, stay in memory.
+
+        :param level: level to page out
+        :type level: Level
+        """
+        save_game = self.cache()
+        self.levels[id(level)] = level
+        record = save_game.level_record(level)
+        data, references = save_game.pickle(record, self.model)
+        write_file(os.path.join(self.path, level_file(record['id'])), data)
+        self.references[record['id']] = references
+        entities = list(get_characters(level)) + list(get_items(level))
+        self.dormant[record['id']] = weakref.WeakValueDictionary(
+            (save_game.identify(entity), entity) for entity in entities)
+        self.forget(entities)
+
+        paged = {MODEL: level[MODEL],
+                 NAME: level[NAME],
+                 DESCRIPTION: level[DESCRIPTION],
+                 PAGE: level_file(record['id'])}
+        level.clear()
+        level.update(paged)
+
+    def read_level(self, level):
+        """
+        Read paged out level back into memory
+
+        Characters and items that are still alive are filled with their
+        saved state, instead of creating new ones.
+
+        :param level: level to read
+        :type level: Level
+        """
+        save_game = self.cache()
+        path = os.path.join(self.path, level[PAGE])
+        known = set(save_game.objects)
+        level_id = save_game.identify(level)
+        for entity_id, entity in list(self.dormant.pop(level_id).items()):
+            if entity_id not in known:
+                save_game.register(entity, entity_id)
+        record = save_game.unpickle(read_file(path), self.model)
+        for entity, state in record['entities']:
+            if save_game.identify(entity) not in known:
+                restore_state(entity, state)
+        save_game.restore_level(level, record, self.model)
+        references = self.references.pop(record['id'])
+        self.forget(list(get_characters(level)) + list(get_items(level))
+                    + [save_game.objects[entity_id]
+                       for entity_id in references])
+        os.remove(path)
+
+    def forget(self, entities):
+        """
+        Forget entities that no paged out level refers to
+
+        Portals and levels are never forgotten.
+
+        :param entities: entities to forget
+        :type entities: [Character or Item or Portal]
+        """
+        save_game = self.save_game
+        referred = set().union(*self.references.values())
+        for entity in entities:
+            if (not isinstance(entity, Portal)
+                    and save_game.ids.get(id(entity)) not in referred):
+                save_game.forget(entity)
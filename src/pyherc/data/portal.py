@@ -49,6 +49,7 @@ class Portal():
         self.__other_end = None
         self.exits_dungeon = False
         self.level_generator_name = level_generator_name
+        self.destination_seed = None
         self.model = None
         self.__update_listeners = []
 
@@ -67,6 +68,29 @@ class Portal():
 
         return self.__other_end
 
+    def linked_portal(self):
+        """
+        Get the other end of the portal without generating it
+
+        .. versionadded:: 0.16
+
+        :returns: other end of the portal or None if it hasn't been generated
+        :rtype: Portal
+        """
+        return self.__other_end
+
+    def __getstate__(self):
+        """
+        Get state of portal for saving
+
+        Update listeners belong to user interface and are left out.
+
+        .. versionadded:: 0.16
+        """
+        state = self.__dict__.copy()
+        state['_Portal__update_listeners'] = []
+        return state
+
     @log_debug
     def set_other_end(self, portal):
         """
@@ -0,0 +1,660 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Saving and loading games
+
+Game is saved in a directory holding an index file and one file for each
+level. Every file starts with a magic string and version of the format,
+followed by a pickled record. Floor, wall and flag layers of levels are
+stored as packed arrays.
+
+Characters, items and portals are entities. State of each entity is stored
+once, in the file of the level it is in, and everywhere else it is referred
+to by its id. Entities that are not in any level, like items in inventories
+or characters that have been removed, are stored in the index. This way
+object graph of the game is never pickled as a whole and a level can be
+written without touching the others.
+
+Saves are incremental: level is written only if it is new, player is in it
+or it has changed since previous save. Changes are tracked through
+revisions of tiles, items and characters of the level and through counter
+of turns taken in it, as acting changes hit points, effects and inventories
+that indexes of the level do not track. Other levels stay still while
+player is away, so their files remain valid. Level that has been
+paged out and read back in is always written again, as its entities may have
+been given new ids.
+
+.. versionadded:: 0.16
+"""
+import io
+import os
+import pickle
+import struct
+import threading
+import weakref
+from importlib import import_module
+
+from pyherc.data.character import Character
+from pyherc.data.dungeon import Dungeon
+from pyherc.data.item import Item
+from pyherc.data.level import (get_characters, get_items, new_level,
+                               level_activity)
+from pyherc.data.portal import Portal
+from pyherc.data.tiles import TileGrid, PORTAL
+
+MAGIC = b'PYHERC'
+VERSION = 1
+HEADER = struct.Struct('>6sH')
+INDEX_FILE = 'index.sav'
+
+TILES = '\ufdd0:tiles'
+ITEMS = '\ufdd0:items'
+CHARACTERS = '\ufdd0:characters'
+TAG_INDEX = '\ufdd0:tag-index'
+NAME = '\ufdd0:name'
+DESCRIPTION = '\ufdd0:description'
+PAGE = '\ufdd0:page'
+
+ENTITY_TYPES = (Character, Item, Portal)
+
+
+def level_file(level_id):
+    """
+    Get name of file for given level
+
+    :param level_id: id of the level
+    :type level_id: int
+    :returns: file name
+    :rtype: string
+    """
+    return 'level-{0}.sav'.format(level_id)
+
+
+def tile_layers(level):
+    """
+    Get tiles of level as packed layers
+
+    Levels using other storage engines are converted to :class:`TileGrid`
+    first.
+
+    :param level: level to pack
+    :type level: Level
+    :returns: layers of tiles
+    :rtype: dict
+    """
+    tiles = level[TILES]
+    if not isinstance(tiles, TileGrid):
+        grid = TileGrid()
+        for location, tile in tiles.items():
+            grid[location] = tile
+        tiles = grid
+    return tiles.layers()
+
+
+def level_portals(level):
+    """
+    Get portals in level
+
+    :param level: level to search
+    :type level: Level
+    :returns: portals
+    :rtype: [Portal]
+    """
+    tiles = level[TILES]
+    tables = (tiles.side_tables.values() if isinstance(tiles, TileGrid)
+              else tiles.values())
+    return [table[PORTAL] for table in tables if table.get(PORTAL)]
+
+
+def save_revision(level):
+    """
+    Get revision of level used to detect if it needs to be saved again
+
+    :param level: level to check
+    :type level: Level
+    :returns: revisions of tiles, items and characters and activity
+    :rtype: (int, int, int, int)
+    """
+    return (level[TILES].revision, level[ITEMS].revision,
+            level[CHARACTERS].revision, level_activity(level))
+
+
+def entity_state(entity):
+    """
+    Get state of entity for saving
+
+    :param entity: entity to save
+    :returns: state of the entity
+    :rtype: dict
+    """
+    if hasattr(entity, '__getstate__'):
+        return entity.__getstate__()
+    return entity.__dict__
+
+
+def restore_state(entity, state):
+    """
+    Restore saved state of entity
+
+    :param entity: entity to restore
+    :param state: saved state
+    :type state: dict
+    """
+    if hasattr(entity, '__setstate__'):
+        entity.__setstate__(state)
+    else:
+        entity.__dict__.update(state)
+
+
+def write_file(path, data):
+    """
+    Write data into file, replacing old one only after writing is done
+
+    :param path: path of file to write
+    :type path: string
+    :param data: data to write
+    :type data: bytes
+    """
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as save_file:
+        save_file.write(HEADER.pack(MAGIC, VERSION))
+        save_file.write(data)
+    os.replace(temporary, path)
+
+
+def read_file(path):
+    """
+    Read data from file written with :func:`write_file`
+
+    :param path: path of file to read
+    :type path: string
+    :returns: data without header
+    :rtype: bytes
+    :raises ValueError: if file is not a save file of supported version
+    """
+    with open(path, 'rb') as save_file:
+        data = save_file.read()
+    if len(data) < HEADER.size:
+        raise ValueError('{0} is not a save file'.format(path))
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('{0} is not a save file'.format(path))
+    if version != VERSION:
+        raise ValueError('{0} has unsupported version {1}'.format(path,
+                                                                  version))
+    return data[HEADER.size:]
+
+
+class EntityPickler(pickle.Pickler):
+    """
+    Pickler that refers to model, levels and entities by id
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, stream, save_game, model):
+        """
+        Default constructor
+
+        :param stream: stream to write to
+        :param save_game: save game keeping track of ids
+        :type save_game: SaveGame
+        :param model: model being saved
+        :type model: Model
+        """
+        super().__init__(stream, pickle.HIGHEST_PROTOCOL)
+        self.save_game = save_game
+        self.model = model
+        self.references = set()
+
+    def persistent_id(self, obj):
+        """
+        Get id of model, level or entity, None for other objects
+        """
+        if isinstance(obj, ENTITY_TYPES):
+            entity_id = self.save_game.identify(obj)
+            self.references.add(entity_id)
+            return ('entity', entity_id,
+                    type(obj).__module__, type(obj).__qualname__)
+        if obj is self.model:
+            return ('model',)
+        if type(obj) is dict and (TAG_INDEX in obj
+                                  or id(obj) in self.save_game.ids):
+            return ('level', self.save_game.identify(obj))
+        return None
+
+
+class EntityUnpickler(pickle.Unpickler):
+    """
+    Unpickler that resolves ids written by :class:`EntityPickler`
+
+    Objects are created empty when they are first referred to. Their state
+    is restored after all files have been read.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, stream, save_game, model):
+        """
+        Default constructor
+
+        :param stream: stream to read from
+        :param save_game: save game keeping track of ids
+        :type save_game: SaveGame
+        :param model: model being loaded
+        :type model: Model
+        """
+        super().__init__(stream)
+        self.save_game = save_game
+        self.model = model
+
+    def persistent_load(self, pid):
+        """
+        Get object with given id, creating an empty one if needed
+        """
+        if pid[0] == 'model':
+            return self.model
+        objects = self.save_game.objects
+        if pid[1] not in objects:
+            if pid[0] == 'level':
+                obj = {}
+            else:
+                cls = import_module(pid[2])
+                for name in pid[3].split('.'):
+                    cls = getattr(cls, name)
+                obj = cls.__new__(cls)
+            self.save_game.register(obj, pid[1])
+        return objects[pid[1]]
+
+
+class SaveGame():
+    """
+    Game saved in a directory
+
+    Ids given to levels and entities are kept between saves, so that files
+    of unchanged levels stay valid. Same instance should be used for all
+    saves of a game, including the one it was loaded with.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, path, pager=None):
+        """
+        Default constructor
+
+        :param path: directory to save to
+        :type path: string
+        :param pager: pager used to read paged out levels back before saving
+        :type pager: LevelPager
+        """
+        super().__init__()
+        self.path = path
+        self.pager = pager
+        self.ids = {}
+        self.objects = {}
+        self.next_id = 1
+        self.revisions = {}
+        self.loose = {}
+        self.writer = None
+
+    def identify(self, obj):
+        """
+        Get id of level or entity, giving it a new one if needed
+
+        :param obj: level or entity
+        :returns: id
+        :rtype: int
+        """
+        obj_id = self.ids.get(id(obj))
+        if obj_id is None:
+            obj_id = self.next_id
+            self.register(obj, obj_id)
+        return obj_id
+
+    def register(self, obj, obj_id):
+        """
+        Register object with given id
+
+        :param obj: level or entity
+        :param obj_id: id of the object
+        :type obj_id: int
+        """
+        self.ids[id(obj)] = obj_id
+        self.objects[obj_id] = obj
+        self.next_id = max(self.next_id, obj_id + 1)
+
+    def forget(self, obj):
+        """
+        Forget level or entity, letting it to be garbage collected
+
+        Id of the object is not reused. If the object is referred to later,
+        it will be given a new id.
+
+        :param obj: level or entity
+        """
+        obj_id = self.ids.pop(id(obj), None)
+        if obj_id is not None:
+            del self.objects[obj_id]
+
+    def find_levels(self, model):
+        """
+        Find levels of the game, following portals from level of player
+
+        :param model: model of the game
+        :type model: Model
+        :returns: levels
+        :rtype: [Level]
+        :raises ValueError: if a level has been paged out
+        """
+        levels = [model.player.level]
+        seen = {id(model.player.level)}
+        for level in levels:
+            if PAGE in level:
+                raise ValueError('level {0} is paged out'.format(level[NAME]))
+            for portal in level_portals(level):
+                other_end = portal.linked_portal()
+                if other_end and other_end.level is not None:
+                    if id(other_end.level) not in seen:
+                        seen.add(id(other_end.level))
+                        levels.append(other_end.level)
+        return levels
+
+    def pickle(self, record, model):
+        """
+        Pickle record, referring to levels and entities by id
+
+        :param record: record to pickle
+        :param model: model being saved
+        :type model: Model
+        :returns: pickled record and ids of entities it refers to
+        :rtype: (bytes, set)
+        """
+        stream = io.BytesIO()
+        pickler = EntityPickler(stream, self, model)
+        pickler.dump(record)
+        return (stream.getvalue(), pickler.references)
+
+    def level_record(self, level):
+        """
+        Create record for saving level
+
+        :param level: level to save
+        :type level: Level
+        :returns: record of the level
+        :rtype: dict
+        """
+        characters = list(get_characters(level))
+        items = list(get_items(level))
+        return {'id': self.identify(level),
+                'name': level[NAME],
+                'description': level[DESCRIPTION],
+                'tiles': tile_layers(level),
+                'tag_index': level[TAG_INDEX],
+                'characters': characters,
+                'items': items,
+                'entities': [(entity, entity_state(entity))
+                             for entity
+                             in characters + items + level_portals(level)]}
+
+    def pickle_loose(self, loose, owned, model):
+        """
+        Pickle entities that are not in any level being saved
+
+        Entities referred to by pickled entities are included too.
+
+        :param loose: ids of entities to pickle
+        :type loose: set
+        :param owned: ids of entities in levels being saved
+        :type owned: set
+        :param model: model being saved
+        :type model: Model
+        :returns: pickled entities and their states, ids of pickled entities
+        :rtype: ([bytes], set)
+        """
+        loose = set(loose)
+        pending = list(loose)
+        records = []
+        while pending:
+            entity = self.objects[pending.pop()]
+            data, references = self.pickle((entity, entity_state(entity)),
+                                           model)
+            for entity_id in references - owned - loose:
+                loose.add(entity_id)
+                pending.append(entity_id)
+            records.append(data)
+        return (records, loose)
+
+    def prune(self, live):
+        """
+        Forget levels and entities that were not saved
+
+        Removed characters, destroyed items and levels no longer linked to
+        the dungeon are not kept in memory just because they once had an id.
+
+        :param live: ids of levels and entities that were saved
+        :type live: set
+        """
+        for obj_id in set(self.objects) - live:
+            self.forget(self.objects[obj_id])
+            self.revisions.pop(obj_id, None)
+
+    def changed(self, level):
+        """
+        Check if level has changed since it was last saved or loaded
+
+        :param level: level to check
+        :type level: Level
+        :returns: True if level has to be written again, otherwise False
+        :rtype: Boolean
+        """
+        previous = self.revisions.get(self.identify(level))
+        return (previous is None
+                or previous[0]() is not level[TILES]
+                or previous[1] != save_revision(level))
+
+    def mark_saved(self, level, level_id):
+        """
+        Record current revision of level
+
+        Tiles are referred to weakly, so that level whose contents have been
+        replaced, like when it has been paged back in, is seen as changed.
+
+        :param level: level that was saved or loaded
+        :type level: Level
+        :param level_id: id of the level
+        :type level_id: int
+        """
+        self.revisions[level_id] = (weakref.ref(level[TILES]),
+                                    save_revision(level))
+
+    def save(self, model, background=False):
+        """
+        Save game
+
+        Levels are pickled right away, so game can continue as soon as this
+        method returns. Writing files can be left to a background thread.
+        Levels and entities that are no longer reachable from the player are
+        forgotten afterwards.
+
+        Paged out levels are read back in with pager given to constructor.
+        They stay in memory until pager pages them out again.
+
+        :param model: model of the game
+        :type model: Model
+        :param background: write files in background thread
+        :type background: Boolean
+        :returns: names of files written
+        :rtype: [string]
+        """
+        self.wait()
+        if self.pager is not None:
+            self.pager.page_in_all()
+        levels = self.find_levels(model)
+        level_ids = [self.identify(level) for level in levels]
+        contents = {}
+        for level_id, level in zip(level_ids, levels):
+            contents[level_id] = {self.identify(entity) for entity
+                                  in (list(get_characters(level))
+                                      + list(get_items(level))
+                                      + level_portals(level))}
+        owned = set().union(*contents.values())
+
+        files = {}
+        for level_id, level in zip(level_ids, levels):
+            if level is model.player.level or self.changed(level):
+                data, references = self.pickle(self.level_record(level),
+                                               model)
+                files[level_file(level_id)] = data
+                self.loose[level_id] = references - contents[level_id]
+                self.mark_saved(level, level_id)
+        self.loose = {level_id: self.loose[level_id]
+                      for level_id in level_ids}
+
+        records, loose = self.pickle_loose(set().union(*self.loose.values())
+                                           - owned, owned, model)
+
+        index = {'levels': level_ids,
+                 'player': model.player,
+                 'end_condition': model.end_condition,
+                 'time': model.time,
+                 'next_id': self.next_id,
+                 'loose': self.loose,
+                 'entities': records}
+        files[INDEX_FILE], _ = self.pickle(index, model)
+        self.prune(owned | loose | set(level_ids))
+
+        if background:
+            self.writer = threading.Thread(target=self.write_files,
+                                           args=(files,))
+            self.writer.start()
+        else:
+            self.write_files(files)
+        return sorted(files)
+
+    def remove(self):
+        """
+        Remove files of saved game, for example when game has ended
+
+        Other files in the directory are left in place.
+        """
+        self.wait()
+        if not os.path.isdir(self.path):
+            return
+        for name in os.listdir(self.path):
+            if name == INDEX_FILE or (name.startswith('level-')
+                                      and name.endswith('.sav')):
+                os.remove(os.path.join(self.path, name))
+
+    def write_files(self, files):
+        """
+        Write pickled files, index last
+
+        :param files: pickled data keyed by file name
+        :type files: {string: bytes}
+        """
+        os.makedirs(self.path, exist_ok=True)
+        for name, data in sorted(files.items()):
+            if name != INDEX_FILE:
+                write_file(os.path.join(self.path, name), data)
+        write_file(os.path.join(self.path, INDEX_FILE), files[INDEX_FILE])
+
+    def wait(self):
+        """
+        Wait until files of previous save have been written
+        """
+        if self.writer is not None:
+            self.writer.join()
+            self.writer = None
+
+    def unpickle(self, data, model):
+        """
+        Unpickle record, resolving ids of levels and entities
+
+        :param data: pickled record
+        :type data: bytes
+        :param model: model being loaded
+        :type model: Model
+        :returns: record
+        """
+        return EntityUnpickler(io.BytesIO(data), self, model).load()
+
+    def restore_level(self, level, record, model):
+        """
+        Fill level from record created with :meth:`level_record`
+
+        States of entities in the record have to be restored before calling
+        this.
+
+        :param level: level to fill, contents are replaced
+        :type level: Level
+        :param record: record of the level
+        :type record: dict
+        :param model: model of the game
+        :type model: Model
+        """
+        level.clear()
+        level.update(new_level(model, TileGrid.from_layers(record['tiles'])))
+        level[NAME] = record['name']
+        level[DESCRIPTION] = record['description']
+        level[TAG_INDEX] = record['tag_index']
+        level[CHARACTERS].add_many([(character, character.location)
+                                    for character in record['characters']])
+        level[ITEMS].add_many([(item, item.location)
+                               for item in record['items']])
+        self.mark_saved(level, record['id'])
+
+    def load(self, model):
+        """
+        Load game into model
+
+        Model should have configuration of the game set. Player, dungeon
+        and end condition are set from saved game.
+
+        :param model: model to load into
+        :type model: Model
+        :returns: player character
+        :rtype: Character
+        """
+        self.wait()
+        index = self.unpickle(read_file(os.path.join(self.path, INDEX_FILE)),
+                              model)
+        records = [self.unpickle(read_file(os.path.join(self.path,
+                                                        level_file(level_id))),
+                                 model)
+                   for level_id in index['levels']]
+
+        for record in records:
+            for entity, state in record['entities']:
+                restore_state(entity, state)
+        for data in index['entities']:
+            restore_state(*self.unpickle(data, model))
+
+        for record in records:
+            self.restore_level(self.objects[record['id']], record, model)
+
+        self.next_id = max(self.next_id, index['next_id'])
+        self.loose = index['loose']
+        model.player = index['player']
+        model.end_condition = index['end_condition']
+        model.time = index['time']
+        model.dungeon = Dungeon()
+        return model.player
+
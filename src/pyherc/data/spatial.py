@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Spatial index for things placed on a level
+
+Characters and items of a level are kept in a :class:`SpatialIndex`. It
+remembers order in which things were added or last moved, so iterating it
+behaves like iterating a list where moving is done by removing and adding
+again, but adding, moving and removing are constant time operations and
+things close to a given location can be found without looking at
+everything on the level.
+
+Index tracks two revisions: ``revision`` changes whenever anything is
+added, moved or removed and ``order`` only when iteration order changes.
+Results of radius queries are cached until revision changes, so
+repeated queries between moves are free.
+
+Radius queries that are known to be needed soon, like perception of
+characters acting before the player, can be prepared in advance. Prepared
+result is kept until it is released or something is added, moved or
+removed within its radius.
+
+.. versionadded:: 0.16
+"""
+
+from math import floor, ceil
+
+BUCKET_SIZE = 8
+
+
+class SpatialIndex():
+    """
+    Index of things on a level, bucketed by their location
+
+    Things are tracked by identity. Each thing can be in index only once and
+    its location is the one given when it was added or last moved. Things
+    are iterated in order they were added or last moved, like they would be
+    if moving was done by removing and adding them again.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, bucket_size=BUCKET_SIZE):
+        """
+        Default constructor
+
+        :param bucket_size: width and height of a single bucket
+        :type bucket_size: int
+        """
+        super().__init__()
+        self.bucket_size = bucket_size
+        self.entries = {}
+        self.buckets = {}
+        self.counter = 0
+        self.revision = 0
+        self.order = 0
+        self.query_cache = {}
+        self.prepared = {}
+
+    def _changed(self, *locations):
+        """
+        Mark index changed, invalidating cached query results
+
+        :param locations: locations where things were added, moved or removed
+        :type locations: [(int, int)]
+        """
+        self.revision = self.revision + 1
+        if self.query_cache:
+            self.query_cache = {}
+        if self.prepared:
+            stale = [key for key in self.prepared
+                     if any((x - key[0][0]) ** 2 + (y - key[0][1]) ** 2
+                            <= key[1] * key[1]
+                            for x, y in locations)]
+            for key in stale:
+                del self.prepared[key]
+
+    def _bucket(self, location):
+        """
+        Key of bucket containing given location
+        """
+        size = self.bucket_size
+        return (location[0] // size, location[1] // size)
+
+    def add(self, thing, location):
+        """
+        Add thing to index
+
+        If thing is already in index, it is moved instead.
+
+        :param thing: thing to add
+        :param location: location of the thing
+        :type location: (int, int)
+        """
+        key = id(thing)
+        if key in self.entries:
+            self.move(thing, location)
+            return
+        self.counter = self.counter + 1
+        self.order = self.order + 1
+        self._changed(location)
+        entry = (self.counter, thing, location)
+        self.entries[key] = entry
+        self.buckets.setdefault(self._bucket(location), {})[key] = entry
+
+    def add_many(self, placements):
+        """
+        Add several things to index at once
+
+        Index is marked changed only once, regardless of amount of things.
+        Things already in index are moved.
+
+        :param placements: pairs of thing and location
+        :type placements: [(Any, (int, int))]
+        """
+        entries = self.entries
+        buckets = self.buckets
+        added = []
+        for thing, location in placements:
+            key = id(thing)
+            if key in entries:
+                self.move(thing, location)
+                continue
+            self.counter = self.counter + 1
+            entry = (self.counter, thing, location)
+            entries[key] = entry
+            buckets.setdefault(self._bucket(location), {})[key] = entry
+            added.append(location)
+        self.order = self.order + 1
+        self._changed(*added)
+
+    def remove(self, thing):
+        """
+        Remove thing from index
+
+        :param thing: thing to remove
+        :raises ValueError: if thing is not in index
+        """
+        key = id(thing)
+        if key not in self.entries:
+            raise ValueError('{0} not in index'.format(thing))
+        self.order = self.order + 1
+        location = self.entries.pop(key)[2]
+        self._changed(location)
+        bucket_key = self._bucket(location)
+        bucket = self.buckets[bucket_key]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[bucket_key]
+
+    def move(self, thing, location):
+        """
+        Move thing to a new location and to the end of iteration order
+
+        :param thing: thing to move
+        :param location: new location
+        :type location: (int, int)
+        :raises ValueError: if thing is not in index
+        """
+        key = id(thing)
+        if key not in self.entries:
+            raise ValueError('{0} not in index'.format(thing))
+        serial, _, old_location = self.entries.pop(key)
+        self._changed(old_location, location)
+        if serial != self.counter:
+            self.counter = self.counter + 1
+            self.order = self.order + 1
+            serial = self.counter
+        entry = (serial, thing, location)
+        self.entries[key] = entry
+        old_key = self._bucket(old_location)
+        new_key = self._bucket(location)
+        if old_key == new_key:
+            self.buckets[old_key][key] = entry
+            return
+        old_bucket = self.buckets[old_key]
+        del old_bucket[key]
+        if not old_bucket:
+            del self.buckets[old_key]
+        self.buckets.setdefault(new_key, {})[key] = entry
+
+    def location(self, thing):
+        """
+        Location of thing as recorded in index
+
+        :param thing: thing to look up
+        :returns: location or None if thing is not in index
+        :rtype: (int, int)
+        """
+        entry = self.entries.get(id(thing))
+        if entry is None:
+            return None
+        return entry[2]
+
+    def within_rect(self, x0, y0, x1, y1):
+        """
+        Things inside given rectangle, edges included
+
+        :param x0: left edge
+        :type x0: int
+        :param y0: top edge
+        :type y0: int
+        :param x1: right edge
+        :type x1: int
+        :param y1: bottom edge
+        :type y1: int
+        :returns: things in order they were added
+        :rtype: [Any]
+        """
+        found = []
+        buckets = self.buckets
+        bx0, by0 = self._bucket((x0, y0))
+        bx1, by1 = self._bucket((x1, y1))
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                bucket = buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for entry in bucket.values():
+                    x, y = entry[2]
+                    if x0 <= x <= x1 and y0 <= y <= y1:
+                        found.append(entry)
+        found.sort()
+        return [entry[1] for entry in found]
+
+    def within_radius(self, location, radius):
+        """
+        Things at most radius away from given location
+
+        Distance is measured as a straight line between locations.
+
+        :param location: center of the search
+        :type location: (int, int)
+        :param radius: maximum distance
+        :type radius: float
+        :returns: things in order they were added
+        :rtype: [Any]
+        """
+        cached = self.prepared.get((location, radius))
+        if cached is not None:
+            return list(cached)
+        cached = self.query_cache.get((location, radius))
+        if cached is not None:
+            return list(cached)
+        cx, cy = location
+        x0 = int(floor(cx - radius))
+        y0 = int(floor(cy - radius))
+        x1 = int(ceil(cx + radius))
+        y1 = int(ceil(cy + radius))
+        limit = radius * radius
+        found = []
+        buckets = self.buckets
+        bx0, by0 = self._bucket((x0, y0))
+        bx1, by1 = self._bucket((x1, y1))
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                bucket = buckets.get((bx, by))
+                if not bucket:
+                    continue
+                for entry in bucket.values():
+                    x, y = entry[2]
+                    if (x - cx) ** 2 + (y - cy) ** 2 <= limit:
+                        found.append(entry)
+        found.sort()
+        result = [entry[1] for entry in found]
+        self.query_cache[(location, radius)] = result
+        return list(result)
+
+    def prepare(self, queries):
+        """
+        Run radius queries in advance and keep their results
+
+        :param queries: pairs of location and radius
+        :type queries: [((int, int), float)]
+        """
+        for location, radius in queries:
+            if (location, radius) not in self.prepared:
+                self.prepared[(location, radius)] = \
+                    self.within_radius(location, radius)
+
+    def release(self):
+        """
+        Forget results of prepared queries
+        """
+        self.prepared = {}
+
+    def __contains__(self, thing):
+        return id(thing) in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter([entry[1] for entry in self.entries.values()])
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Index of location tags of a level
+
+Level keeps an inverted index from location tags to locations, so that
+locations with given tag can be found without scanning every tile. For each
+tag, locations that are free, that is safe to step in, are tracked too.
+
+.. versionadded:: 0.16
+"""
+
+
+class LocationSet():
+    """
+    Set of locations supporting constant time random selection
+
+    Locations are kept in a list with their positions stored in a
+    dictionary, so that adding, removing and selecting a random location
+    all take constant time. Removing a location moves the last location in
+    its place.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.locations = []
+        self.positions = {}
+
+    def add(self, location):
+        """
+        Add location to set
+
+        :param location: location to add
+        :type location: (int, int)
+        """
+        if location not in self.positions:
+            self.positions[location] = len(self.locations)
+            self.locations.append(location)
+
+    def discard(self, location):
+        """
+        Remove location from set if it is there
+
+        :param location: location to remove
+        :type location: (int, int)
+        """
+        position = self.positions.pop(location, None)
+        if position is None:
+            return
+        last = self.locations.pop()
+        if position < len(self.locations):
+            self.locations[position] = last
+            self.positions[last] = position
+
+    def choice(self, rng):
+        """
+        Select random location
+
+        :param rng: random number generator
+        :type rng: Random
+        :returns: location
+        :rtype: (int, int)
+        """
+        return rng.choice(self.locations)
+
+    def __contains__(self, location):
+        return location in self.positions
+
+    def __len__(self):
+        return len(self.locations)
+
+    def __iter__(self):
+        return iter(list(self.locations))
+
+
+class TagIndex():
+    """
+    Inverted index from location tags to locations
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.tagged = {}
+        self.free = {}
+
+    def add(self, location, tag, free):
+        """
+        Record that location has given tag
+
+        :param location: tagged location
+        :type location: (int, int)
+        :param tag: tag of the location
+        :type tag: string
+        :param free: is location safe to step in
+        :type free: Boolean
+        """
+        self.tagged.setdefault(tag, {})[location] = None
+        free_locations = self.free.setdefault(tag, LocationSet())
+        if free:
+            free_locations.add(location)
+        else:
+            free_locations.discard(location)
+
+    def update(self, location, tags, free):
+        """
+        Update if location is free for each of its tags
+
+        :param location: location that might have changed
+        :type location: (int, int)
+        :param tags: tags of the location
+        :type tags: [string]
+        :param free: is location safe to step in
+        :type free: Boolean
+        """
+        for tag in tags:
+            free_locations = self.free.get(tag)
+            if free_locations is None:
+                continue
+            if free:
+                free_locations.add(location)
+            else:
+                free_locations.discard(location)
+
+    def locations(self, tag):
+        """
+        Get locations with given tag, in order they were tagged
+
+        :param tag: tag to look for
+        :type tag: string
+        :returns: locations
+        :rtype: [(int, int)]
+        """
+        return list(self.tagged.get(tag, ()))
+
+    def free_locations(self, tag):
+        """
+        Get free locations with given tag
+
+        :param tag: tag to look for
+        :type tag: string
+        :returns: free locations
+        :rtype: LocationSet
+        """
+        return self.free.get(tag) or LocationSet()
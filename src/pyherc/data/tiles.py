@@ -0,0 +1,874 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Storage engines for tiles of a level
+
+Level keeps its tiles in a storage engine, that maps locations to tiles. Two
+engines are available: :class:`TileDict` stores each tile as a dictionary and
+:class:`TileGrid` stores floor and wall tiles in compact arrays and keeps
+everything else in sparse side tables.
+
+Both engines keep track of revision, that is increased every time when
+passability or opacity of a tile might have changed. Algorithms can use it
+to find out if their cached results are still valid.
+
+.. versionadded:: 0.16
+"""
+
+import sys
+from array import array
+
+FLOOR = '\ufdd0:floor'
+WALL = '\ufdd0:wall'
+ORNAMENTATION = '\ufdd0:ornamentation'
+TRAPS = '\ufdd0:traps'
+TAGS = '\ufdd0:tags'
+ITEMS = '\ufdd0:items'
+CHARACTERS = '\ufdd0:characters'
+PORTAL = '\ufdd0:portal'
+FEATURES = '\ufdd0:features'
+
+CONTENT_KEYS = (ORNAMENTATION, TRAPS, TAGS, ITEMS, CHARACTERS, FEATURES)
+TILE_KEYS = (FLOOR, WALL, PORTAL) + CONTENT_KEYS
+
+PRESENT = 1
+PASSABLE = 2
+OPAQUE = 4
+
+
+def new_tile():
+    """
+    Create a tile with default values
+
+    :returns: new tile
+    :rtype: dict
+    """
+    return {FLOOR: None,
+            WALL: None,
+            ORNAMENTATION: [],
+            TRAPS: [],
+            TAGS: [],
+            ITEMS: [],
+            CHARACTERS: [],
+            PORTAL: None,
+            FEATURES: []}
+
+
+def tile_flags(floor, wall):
+    """
+    Calculate flags for tile with given floor and wall
+
+    :param floor: floor tile
+    :param wall: wall tile
+    :returns: combination of PRESENT, PASSABLE and OPAQUE
+    :rtype: int
+    """
+    flags = PRESENT
+    if wall:
+        flags = flags | OPAQUE
+    elif floor:
+        flags = flags | PASSABLE
+    return flags
+
+
+class TileDict(dict):
+    """
+    Storage engine keeping each tile in a dictionary of its own
+
+    Revision is tracked only for changes done through methods of the engine.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, *args, **kwargs):
+        """
+        Default constructor
+        """
+        super().__init__(*args, **kwargs)
+        self.revision = 0
+
+    def get_or_create(self, location):
+        """
+        Get tile at given location, creating it if needed
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :returns: tile
+        :rtype: dict
+        """
+        if location not in self:
+            self[location] = new_tile()
+        return self[location]
+
+    def floor(self, location):
+        """
+        Get floor tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :returns: floor tile or None
+        """
+        tile = self.get(location)
+        return tile[FLOOR] if tile else None
+
+    def set_floor(self, location, tile_id):
+        """
+        Set floor tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :param tile_id: new floor tile
+        """
+        self.get_or_create(location)[FLOOR] = tile_id
+        self.revision = self.revision + 1
+
+    def wall(self, location):
+        """
+        Get wall tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :returns: wall tile or None
+        """
+        tile = self.get(location)
+        return tile[WALL] if tile else None
+
+    def set_wall(self, location, tile_id):
+        """
+        Set wall tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :param tile_id: new wall tile
+        """
+        self.get_or_create(location)[WALL] = tile_id
+        self.revision = self.revision + 1
+
+    def blocks_movement(self, location):
+        """
+        Check if given location blocks movement
+
+        :param location: location to check
+        :type location: (int, int)
+        :rtype: Boolean
+        """
+        tile = self.get(location)
+        if tile is None:
+            return True
+        return not (tile_flags(tile[FLOOR], tile[WALL]) & PASSABLE)
+
+    def blocks_los(self, location):
+        """
+        Check if given location blocks line of sight
+
+        :param location: location to check
+        :type location: (int, int)
+        :rtype: Boolean
+        """
+        tile = self.get(location)
+        return tile is not None and bool(tile[WALL])
+
+    def movement_blocker(self):
+        """
+        Get function for checking if location blocks movement
+
+        :returns: function taking location and returning Boolean
+        :rtype: function
+        """
+        return self.blocks_movement
+
+    def los_blocker(self):
+        """
+        Get function for checking if location blocks line of sight
+
+        :returns: function taking location and returning Boolean
+        :rtype: function
+        """
+        return self.blocks_los
+
+    def portal(self, location):
+        """
+        Get portal at given location
+
+        :param location: location of the portal
+        :type location: (int, int)
+        :returns: portal or None
+        :rtype: Portal
+        """
+        tile = self.get(location)
+        return tile[PORTAL] if tile else None
+
+    def set_portal(self, location, portal):
+        """
+        Set portal at given location
+
+        :param location: location of the portal
+        :type location: (int, int)
+        :param portal: portal to set
+        :type portal: Portal
+        """
+        self.get_or_create(location)[PORTAL] = portal
+        self.revision = self.revision + 1
+
+    def contents(self, location, key):
+        """
+        Get contents of given kind in a location
+
+        :param location: location to check
+        :type location: (int, int)
+        :param key: kind of contents, for example :items or :traps
+        :type key: string
+        :returns: contents
+        :rtype: [object]
+        """
+        tile = self.get(location)
+        return tile[key] if tile else []
+
+    def add_content(self, location, key, value):
+        """
+        Add content of given kind in a location
+
+        :param location: location to modify
+        :type location: (int, int)
+        :param key: kind of contents, for example :items or :traps
+        :type key: string
+        :param value: content to add
+        """
+        self.get_or_create(location)[key].append(value)
+
+    def remove_content(self, location, key, value):
+        """
+        Remove content of given kind from a location
+
+        :param location: location to modify
+        :type location: (int, int)
+        :param key: kind of contents, for example :items or :traps
+        :type key: string
+        :param value: content to remove
+        """
+        self[location][key].remove(value)
+
+    def bounds(self):
+        """
+        Get bounds of tiles stored in this engine
+
+        :returns: (x₀, x₁, y₀, y₁) or None if there are no tiles
+        :rtype: (int, int, int, int)
+        """
+        if not self:
+            return None
+        x_coords = [loc[0] for loc in self]
+        y_coords = [loc[1] for loc in self]
+        return (min(x_coords), max(x_coords), min(y_coords), max(y_coords))
+
+
+class TileGrid():
+    """
+    Storage engine keeping tiles in dense arrays
+
+    Floor and wall tiles are interned and stored as indexes into a table of
+    tile ids. Passability and opacity are stored as flags, that are updated
+    when floor or wall of a tile changes. Checking them is a matter of index
+    calculation and single bit test. Ornamentation, traps, tags, items,
+    characters, portals and features are stored in sparse side tables, as
+    most of the locations never hold any of them.
+
+    Grid grows automatically when tiles are set outside of its current area.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, size=None, origin=(0, 0)):
+        """
+        Default constructor
+
+        :param size: initial size of the grid
+        :type size: (int, int)
+        :param origin: coordinates of top left corner of the grid
+        :type origin: (int, int)
+        """
+        super().__init__()
+        self.x_origin, self.y_origin = origin
+        self.width, self.height = size if size else (0, 0)
+        area = self.width * self.height
+        self.floors = array('H', bytes(2 * area))
+        self.walls = array('H', bytes(2 * area))
+        self.flags = bytearray(area)
+        self.tile_ids = [None]
+        self.tile_codes = {None: 0}
+        self.side_tables = {}
+        self.tile_count = 0
+        self.tile_bounds = None
+        self.revision = 0
+        self.blockers = None
+
+    def index(self, location):
+        """
+        Calculate index of given location in arrays
+
+        :param location: location to calculate
+        :type location: (int, int)
+        :returns: index or None if location is outside of grid
+        :rtype: int
+        """
+        loc_x = location[0] - self.x_origin
+        loc_y = location[1] - self.y_origin
+        if 0 <= loc_x < self.width and 0 <= loc_y < self.height:
+            return loc_y * self.width + loc_x
+        return None
+
+    def location(self, index):
+        """
+        Calculate location of given index
+
+        :param index: index in arrays
+        :type index: int
+        :returns: location
+        :rtype: (int, int)
+        """
+        loc_y, loc_x = divmod(index, self.width)
+        return (loc_x + self.x_origin, loc_y + self.y_origin)
+
+    def tile_code(self, tile_id):
+        """
+        Get code for tile id, interning it if needed
+
+        :param tile_id: id of tile
+        :returns: code of the tile
+        :rtype: int
+        """
+        try:
+            code = self.tile_codes.get(tile_id)
+        except TypeError:
+            # unhashable ids (lists of alternatives) are rare, scan for them
+            for code, known_id in enumerate(self.tile_ids):
+                if known_id == tile_id:
+                    return code
+            self.tile_ids.append(tile_id)
+            return len(self.tile_ids) - 1
+        if code is None:
+            code = len(self.tile_ids)
+            self.tile_ids.append(tile_id)
+            self.tile_codes[tile_id] = code
+        return code
+
+    def create(self, location):
+        """
+        Create tile in given location if it doesn't exist
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :returns: index of the tile
+        :rtype: int
+        """
+        index = self.index(location)
+        if index is None:
+            self.grow(location)
+            index = self.index(location)
+        if not self.flags[index]:
+            self.flags[index] = PRESENT
+            self.tile_count = self.tile_count + 1
+            self.revision = self.revision + 1
+            if self.tile_bounds is None:
+                self.tile_bounds = (location[0], location[0],
+                                    location[1], location[1])
+            else:
+                x0, x1, y0, y1 = self.tile_bounds
+                self.tile_bounds = (min(x0, location[0]),
+                                    max(x1, location[0]),
+                                    min(y0, location[1]),
+                                    max(y1, location[1]))
+        return index
+
+    def grow(self, location):
+        """
+        Grow grid so that given location fits in it
+
+        :param location: location that should fit in the grid
+        :type location: (int, int)
+        """
+        loc_x, loc_y = location
+        old_x0, old_y0 = self.x_origin, self.y_origin
+        old_width, old_height = self.width, self.height
+
+        if old_width == 0 or old_height == 0:
+            x0, x1 = loc_x, loc_x + 1
+            y0, y1 = loc_y, loc_y + 1
+        else:
+            x0, x1 = old_x0, old_x0 + old_width
+            y0, y1 = old_y0, old_y0 + old_height
+            x_slack = max(8, old_width // 2)
+            y_slack = max(8, old_height // 2)
+            if loc_x < x0:
+                x0 = min(loc_x, x0 - x_slack)
+            elif loc_x >= x1:
+                x1 = max(loc_x + 1, x1 + x_slack)
+            if loc_y < y0:
+                y0 = min(loc_y, y0 - y_slack)
+            elif loc_y >= y1:
+                y1 = max(loc_y + 1, y1 + y_slack)
+
+        width, height = x1 - x0, y1 - y0
+        area = width * height
+        floors = array('H', bytes(2 * area))
+        walls = array('H', bytes(2 * area))
+        flags = bytearray(area)
+
+        for row in range(old_height):
+            old_start = row * old_width
+            start = (row + old_y0 - y0) * width + old_x0 - x0
+            floors[start:start + old_width] = \
+                self.floors[old_start:old_start + old_width]
+            walls[start:start + old_width] = \
+                self.walls[old_start:old_start + old_width]
+            flags[start:start + old_width] = \
+                self.flags[old_start:old_start + old_width]
+
+        self.x_origin, self.y_origin = x0, y0
+        self.width, self.height = width, height
+        self.floors, self.walls, self.flags = floors, walls, flags
+        self.blockers = None
+
+    def update_flags(self, index):
+        """
+        Recalculate flags of tile at given index
+
+        :param index: index of the tile
+        :type index: int
+        """
+        flags = tile_flags(self.tile_ids[self.floors[index]],
+                           self.tile_ids[self.walls[index]])
+        if self.flags[index] != flags:
+            self.flags[index] = flags
+            self.revision = self.revision + 1
+
+    def floor(self, location):
+        """
+        Get floor tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :returns: floor tile or None
+        """
+        index = self.index(location)
+        if index is None:
+            return None
+        return self.tile_ids[self.floors[index]]
+
+    def set_floor(self, location, tile_id):
+        """
+        Set floor tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :param tile_id: new floor tile
+        """
+        index = self.create(location)
+        self.floors[index] = self.tile_code(tile_id)
+        self.update_flags(index)
+
+    def wall(self, location):
+        """
+        Get wall tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :returns: wall tile or None
+        """
+        index = self.index(location)
+        if index is None:
+            return None
+        return self.tile_ids[self.walls[index]]
+
+    def set_wall(self, location, tile_id):
+        """
+        Set wall tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :param tile_id: new wall tile
+        """
+        index = self.create(location)
+        self.walls[index] = self.tile_code(tile_id)
+        self.update_flags(index)
+
+    def blocks_movement(self, location):
+        """
+        Check if given location blocks movement
+
+        :param location: location to check
+        :type location: (int, int)
+        :rtype: Boolean
+        """
+        loc_x = location[0] - self.x_origin
+        loc_y = location[1] - self.y_origin
+        if 0 <= loc_x < self.width and 0 <= loc_y < self.height:
+            return not self.flags[loc_y * self.width + loc_x] & PASSABLE
+        return True
+
+    def blocks_los(self, location):
+        """
+        Check if given location blocks line of sight
+
+        :param location: location to check
+        :type location: (int, int)
+        :rtype: Boolean
+        """
+        loc_x = location[0] - self.x_origin
+        loc_y = location[1] - self.y_origin
+        if 0 <= loc_x < self.width and 0 <= loc_y < self.height:
+            return bool(self.flags[loc_y * self.width + loc_x] & OPAQUE)
+        return False
+
+    def movement_blocker(self):
+        """
+        Get function for checking if location blocks movement
+
+        Returned function reads flags directly and is intended to be used
+        in inner loops of spatial algorithms. It stays valid until the grid
+        grows.
+
+        :returns: function taking location and returning Boolean
+        :rtype: function
+        """
+        if self.blockers is None:
+            self.blockers = self.create_blockers()
+        return self.blockers[0]
+
+    def los_blocker(self):
+        """
+        Get function for checking if location blocks line of sight
+
+        Returned function reads flags directly and is intended to be used
+        in inner loops of spatial algorithms. It stays valid until the grid
+        grows.
+
+        :returns: function taking location and returning Boolean
+        :rtype: function
+        """
+        if self.blockers is None:
+            self.blockers = self.create_blockers()
+        return self.blockers[1]
+
+    def create_blockers(self):
+        """
+        Create functions for checking passability and opacity
+
+        :returns: movement and line of sight blockers
+        :rtype: (function, function)
+        """
+        flags = self.flags
+        x_origin, y_origin = self.x_origin, self.y_origin
+        width, height = self.width, self.height
+
+        def blocks_movement(location):
+            loc_x = location[0] - x_origin
+            loc_y = location[1] - y_origin
+            if 0 <= loc_x < width and 0 <= loc_y < height:
+                return not flags[loc_y * width + loc_x] & PASSABLE
+            return True
+
+        def blocks_los(location):
+            loc_x = location[0] - x_origin
+            loc_y = location[1] - y_origin
+            if 0 <= loc_x < width and 0 <= loc_y < height:
+                return flags[loc_y * width + loc_x] & OPAQUE != 0
+            return False
+
+        return (blocks_movement, blocks_los)
+
+    def portal(self, location):
+        """
+        Get portal at given location
+
+        :param location: location of the portal
+        :type location: (int, int)
+        :returns: portal or None
+        :rtype: Portal
+        """
+        table = self.side_tables.get(location)
+        return table.get(PORTAL) if table else None
+
+    def set_portal(self, location, portal):
+        """
+        Set portal at given location
+
+        :param location: location of the portal
+        :type location: (int, int)
+        :param portal: portal to set
+        :type portal: Portal
+        """
+        self.create(location)
+        self.side_tables.setdefault(location, {})[PORTAL] = portal
+        self.revision = self.revision + 1
+
+    def contents(self, location, key):
+        """
+        Get contents of given kind in a location
+
+        :param location: location to check
+        :type location: (int, int)
+        :param key: kind of contents, for example :items or :traps
+        :type key: string
+        :returns: contents
+        :rtype: [object]
+        """
+        table = self.side_tables.get(location)
+        if table:
+            content = table.get(key)
+            if content is not None:
+                return content
+        return []
+
+    def add_content(self, location, key, value):
+        """
+        Add content of given kind in a location
+
+        :param location: location to modify
+        :type location: (int, int)
+        :param key: kind of contents, for example :items or :traps
+        :type key: string
+        :param value: content to add
+        """
+        self.create(location)
+        self.side_tables.setdefault(location, {}).setdefault(key, []).append(value)
+
+    def remove_content(self, location, key, value):
+        """
+        Remove content of given kind from a location
+
+        Empty side tables are released, so that memory use is proportional to
+        amount of content in the level.
+
+        :param location: location to modify
+        :type location: (int, int)
+        :param key: kind of contents, for example :items or :traps
+        :type key: string
+        :param value: content to remove
+        """
+        table = self.side_tables[location]
+        content = table[key]
+        content.remove(value)
+        if not content:
+            del table[key]
+            if not table:
+                del self.side_tables[location]
+
+    def bounds(self):
+        """
+        Get bounds of tiles stored in this engine
+
+        :returns: (x₀, x₁, y₀, y₁) or None if there are no tiles
+        :rtype: (int, int, int, int)
+        """
+        return self.tile_bounds
+
+    def __contains__(self, location):
+        index = self.index(location)
+        return index is not None and self.flags[index] != 0
+
+    def __getitem__(self, location):
+        if location not in self:
+            raise KeyError(location)
+        return TileView(self, location)
+
+    def __setitem__(self, location, tile):
+        index = self.create(location)
+        self.floors[index] = self.tile_code(tile[FLOOR])
+        self.walls[index] = self.tile_code(tile[WALL])
+        self.update_flags(index)
+        self.side_tables.pop(location, None)
+        if tile[PORTAL] is not None:
+            self.set_portal(location, tile[PORTAL])
+        for key in CONTENT_KEYS:
+            if tile[key]:
+                self.side_tables.setdefault(location, {})[key] = tile[key]
+
+    def __iter__(self):
+        flags = self.flags
+        for index in range(len(flags)):
+            if flags[index]:
+                yield self.location(index)
+
+    def __len__(self):
+        return self.tile_count
+
+    def get(self, location, default=None):
+        """
+        Get tile at given location
+
+        :param location: location of the tile
+        :type location: (int, int)
+        :param default: value to return if there is no tile
+        :returns: tile or default
+        :rtype: TileView
+        """
+        if location in self:
+            return TileView(self, location)
+        return default
+
+    def keys(self):
+        """
+        Get locations of tiles
+
+        :returns: locations
+        :rtype: [(int, int)]
+        """
+        return iter(self)
+
+    def items(self):
+        """
+        Get locations and tiles
+
+        :returns: pairs of location and tile
+        :rtype: [((int, int), TileView)]
+        """
+        for location in self:
+            yield (location, TileView(self, location))
+
+    def layers(self):
+        """
+        Get contents of the grid as packed layers
+
+        Floor, wall and flag layers are returned as bytes and side tables
+        as they are. Result can be turned back into a grid with
+        :meth:`from_layers`.
+
+        :returns: layers of the grid
+        :rtype: dict
+        """
+        return {'origin': (self.x_origin, self.y_origin),
+                'size': (self.width, self.height),
+                'byteorder': sys.byteorder,
+                'tile_ids': self.tile_ids,
+                'floors': self.floors.tobytes(),
+                'walls': self.walls.tobytes(),
+                'flags': bytes(self.flags),
+                'side_tables': self.side_tables,
+                'tile_count': self.tile_count,
+                'tile_bounds': self.tile_bounds}
+
+    @classmethod
+    def from_layers(cls, layers):
+        """
+        Create grid from packed layers
+
+        :param layers: layers created with :meth:`layers`
+        :type layers: dict
+        :returns: new grid
+        :rtype: TileGrid
+        """
+        grid = cls(layers['size'], layers['origin'])
+        grid.floors = array('H', layers['floors'])
+        grid.walls = array('H', layers['walls'])
+        if layers['byteorder'] != sys.byteorder:
+            grid.floors.byteswap()
+            grid.walls.byteswap()
+        grid.flags = bytearray(layers['flags'])
+        grid.tile_ids = list(layers['tile_ids'])
+        for code, tile_id in enumerate(grid.tile_ids):
+            try:
+                grid.tile_codes.setdefault(tile_id, code)
+            except TypeError:
+                pass
+        grid.side_tables = layers['side_tables']
+        grid.tile_count = layers['tile_count']
+        grid.tile_bounds = layers['tile_bounds']
+        return grid
+
+
+class TileView():
+    """
+    Dictionary like view to a single tile stored in :class:`TileGrid`
+
+    .. versionadded:: 0.16
+    """
+    __slots__ = ('grid', 'location')
+
+    def __init__(self, grid, location):
+        """
+        Default constructor
+
+        :param grid: grid holding the tile
+        :type grid: TileGrid
+        :param location: location of the tile
+        :type location: (int, int)
+        """
+        self.grid = grid
+        self.location = location
+
+    def __getitem__(self, key):
+        if key == FLOOR:
+            return self.grid.floor(self.location)
+        if key == WALL:
+            return self.grid.wall(self.location)
+        if key == PORTAL:
+            return self.grid.portal(self.location)
+        if key in CONTENT_KEYS:
+            return self.grid.contents(self.location, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == FLOOR:
+            self.grid.set_floor(self.location, value)
+        elif key == WALL:
+            self.grid.set_wall(self.location, value)
+        elif key == PORTAL:
+            self.grid.set_portal(self.location, value)
+        elif key in CONTENT_KEYS:
+            self.grid.side_tables.setdefault(self.location, {})[key] = value
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in TILE_KEYS
+
+    def __iter__(self):
+        return iter(TILE_KEYS)
+
+    def __eq__(self, other):
+        return (isinstance(other, TileView)
+                and self.grid is other.grid
+                and self.location == other.location)
+
+    def __hash__(self):
+        return hash((id(self.grid), self.location))
+
+    def get(self, key, default=None):
+        """
+        Get value of given key
+
+        :param key: key to retrieve
+        :param default: value to return if key is not known
+        """
+        if key in TILE_KEYS:
+            return self[key]
+        return default
+
+    def keys(self):
+        """
+        Get keys of the tile
+        """
+        return TILE_KEYS
+
+    def __repr__(self):
+        return 'TileView({0})'.format(self.location)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Event bus delivering events only to interested listeners
+
+.. versionadded:: 0.16
+"""
+from pyherc.events.event import e_character, e_event_type, e_level
+
+
+class Subscription():
+    """
+    Interest of a listener in events
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, listener, event_types, level, character, method):
+        """
+        Default constructor
+
+        :param listener: listener to deliver events to
+        :param event_types: types of events to deliver, None for all
+        :type event_types: frozenset
+        :param level: deliver only events in this level, None for all
+        :type level: Level
+        :param character: deliver only events of this character, None for all
+        :type character: Character
+        :param method: name of method to call on listener
+        :type method: string
+        """
+        super().__init__()
+        self.listener = listener
+        self.event_types = event_types
+        self.level = level
+        self.character = character
+        self.method = method
+
+    def matches(self, event):
+        """
+        Check if event passes level and character filters
+
+        Events that are not tied to any level pass level filter.
+
+        :param event: event to check
+        :type event: dict
+        :returns: True if listener is interested in event
+        :rtype: Boolean
+        """
+        if self.level is not None:
+            level = e_level(event)
+            if level is not None and level is not self.level:
+                return False
+        if self.character is not None:
+            if e_character(event) is not self.character:
+                return False
+        return True
+
+
+class EventBus():
+    """
+    Delivers events to listeners subscribed to them
+
+    Subscriptions can be limited to certain types of events, events in
+    given level and events of given character. For each type of event, list
+    of subscriptions interested in it is calculated once and kept until
+    subscriptions change.
+
+    Bus can be held, in which case events are queued and delivered in one
+    batch when the bus is released.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.subscriptions = []
+        self.tables = {}
+        self.typed = False
+        self.pending = None
+
+    def subscribe(self, listener, event_types=None, level=None,
+                  character=None, method='receive_event'):
+        """
+        Subscribe listener to events
+
+        Subscribing a listener again replaces its previous subscription.
+
+        :param listener: listener to deliver events to
+        :param event_types: types of events to deliver, None for all
+        :type event_types: [string]
+        :param level: deliver only events in this level, None for all
+        :type level: Level
+        :param character: deliver only events of this character, None for all
+        :type character: Character
+        :param method: name of method to call on listener
+        :type method: string
+        """
+        if event_types is not None:
+            event_types = frozenset(event_types)
+        subscription = Subscription(listener, event_types, level, character,
+                                    method)
+        for index, existing in enumerate(self.subscriptions):
+            if existing.listener is listener:
+                self.subscriptions[index] = subscription
+                break
+        else:
+            self.subscriptions.append(subscription)
+        self.changed()
+
+    def unsubscribe(self, listener):
+        """
+        Remove subscription of listener
+
+        :param listener: listener to remove
+        """
+        self.subscriptions = [subscription for subscription
+                              in self.subscriptions
+                              if subscription.listener is not listener]
+        self.changed()
+
+    def changed(self):
+        """
+        Clear dispatch tables after subscriptions have changed
+        """
+        self.tables.clear()
+        self.typed = any(subscription.event_types is not None
+                         for subscription in self.subscriptions)
+
+    def listeners(self):
+        """
+        Get subscribed listeners
+
+        :returns: listeners in order of subscription
+        :rtype: list
+        """
+        return [subscription.listener for subscription in self.subscriptions]
+
+    def table(self, event_type):
+        """
+        Get subscriptions interested in given type of events
+
+        :param event_type: type of event
+        :type event_type: string
+        :returns: subscriptions in order of subscription
+        :rtype: [Subscription]
+        """
+        table = self.tables.get(event_type)
+        if table is None:
+            table = [subscription for subscription in self.subscriptions
+                     if subscription.event_types is None
+                     or event_type in subscription.event_types]
+            self.tables[event_type] = table
+        return table
+
+    def publish(self, event):
+        """
+        Deliver event to interested listeners, or queue it if bus is held
+
+        :param event: event to publish
+        :type event: dict
+        """
+        if self.pending is not None:
+            self.pending.append(event)
+        else:
+            self.deliver(event)
+
+    def deliver(self, event):
+        """
+        Deliver event to interested listeners right away
+
+        :param event: event to deliver
+        :type event: dict
+        """
+        if self.typed:
+            subscriptions = self.table(e_event_type(event))
+        else:
+            subscriptions = self.subscriptions
+        for subscription in subscriptions:
+            if subscription.matches(event):
+                getattr(subscription.listener, subscription.method)(event)
+
+    def hold(self):
+        """
+        Start queuing events instead of delivering them
+        """
+        if self.pending is None:
+            self.pending = []
+
+    def release(self):
+        """
+        Stop queuing and deliver queued events in order they were published
+        """
+        pending = self.pending
+        self.pending = None
+        for event in pending or []:
+            self.deliver(event)
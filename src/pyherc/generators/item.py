@@ -24,14 +24,13 @@
 Classes needed for item generation
 """
 
-import random
-
 import pyherc
 from pyherc.aspects import log_debug, log_info
 from pyherc.data import Item
 from pyherc.data.effects import EffectHandle, EffectsCollection
 from pyherc.data.item import (AmmunitionData, ArmourData, WeaponData, TrapData,
                               BootsData)
+from pyherc.sampling import CumulativeTable
 
 
 class ItemGenerator():
@@ -58,11 +57,18 @@ class ItemGenerator():
         :type name: string
         :param item_type: type of the item to generate
         :type item_type: string
+        :param artefact_type: type of artefact to generate
+        :type artefact_type: string
         :return: Generated item
         :rtype: Item
+
+        .. versionchanged:: 0.16
+           artefacts are seeded from random number generator of configuration
         """
         if artefact_type:
-            return pyherc.vtable['\ufdd0:generate-artefact'](artefact_type)
+            seed = self.config.rng.randint(1, 9223372036854775807)
+            return pyherc.vtable['\ufdd0:generate-artefact'](artefact_type,
+                                                              seed)
         else:        
             item_specification = self.find_item_specification(name=name,
                                                               item_type=item_type)
@@ -102,7 +108,7 @@ class ItemGenerator():
 
         item.name = item_specification.name
         item.description = item_specification.description
-        item.icon = random.choice(item_specification.icons)
+        item.icon = self.config.rng.choice(item_specification.icons)
         item.cost = item_specification.cost
         item.weight = item_specification.weight
         item.rarity = item_specification.rarity
@@ -176,6 +182,7 @@ class ItemConfigurations():
         super().__init__()
         self.__items = []
         self.__items_by_name = {}
+        self.__tables = {}
         self.rng = rng
 
     @log_debug
@@ -185,6 +192,7 @@ class ItemConfigurations():
         """
         self.__items.append(item_config)
         self.__items_by_name[item_config.name] = item_config
+        self.__tables.clear()
 
     @log_debug
     def get_all_items(self):
@@ -213,25 +221,25 @@ class ItemConfigurations():
         """
         Retrieve a random specification of item by type
 
+        Specifications are weighted by their rarity. Table of matching
+        specifications is built on first request of each type and reused
+        until new items are added.
+
         :param item_type: type of the item
         :type item_type: string
         :return: item specification
         :rtype: ItemConfiguration
         """
-        matching_specs = [x for x in self.__items
-                          if item_type in x.types]
-
-        max_score = sum([x.rarity for x in matching_specs])
-
-        score = self.rng.randint(1, max_score)
-        current_score = 0
+        table = self.__tables.get(item_type)
 
-        for spec in matching_specs:
-            current_score = current_score + spec.rarity
-            if current_score >= score:
-                return spec
+        if table is None:
+            matching_specs = [x for x in self.__items
+                              if item_type in x.types]
+            table = CumulativeTable(matching_specs,
+                                    [x.rarity for x in matching_specs])
+            self.__tables[item_type] = table
 
-        return None
+        return table.draw(self.rng)
 
 
 class ItemConfiguration():
@@ -32,3 +32,5 @@ from .config import (new_dungeon, new_level, add_level, room_generators,
 from .item import ItemAdder
 from .portal import PortalAdderFactory, PortalAdderConfiguration
 from .generator import LevelGeneratorFactory
+from .pregeneration import LevelPregenerator
+from .cache import LevelCache, config_digest
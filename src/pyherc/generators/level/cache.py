@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Caching generated levels on disk
+
+Level generation is deterministic: same configuration, level type and state
+of random number generators always produce the same level. Cache stores
+generated levels in files named after hash of these, along with states of
+random number generators after generation. Reading a level from cache thus
+leaves the game in the same state as generating it would.
+
+.. versionadded:: 0.16
+"""
+import hashlib
+import os
+import pickle
+
+from pyherc.data.savegame import (SaveGame, read_file, write_file,
+                                  restore_state)
+
+
+def config_digest(*modules):
+    """
+    Calculate digest of source code of modules and packages
+
+    Digest changes whenever any of the source files changes, so it can be
+    used to detect that cached levels were generated with a different
+    configuration.
+
+    :param modules: modules or packages to include
+    :type modules: [module]
+    :returns: hexadecimal digest
+    :rtype: string
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        root = os.path.dirname(module.__file__)
+        if os.path.basename(module.__file__).startswith('__init__.'):
+            paths = [os.path.join(directory, name)
+                     for directory, _, names in os.walk(root)
+                     for name in names]
+        else:
+            paths = [module.__file__]
+        for path in sorted(paths):
+            if path.endswith(('.py', '.hy')):
+                digest.update(os.path.relpath(path, root).encode('utf-8'))
+                with open(path, 'rb') as source:
+                    digest.update(source.read())
+    return digest.hexdigest()
+
+
+class LevelCache():
+    """
+    Directory of generated levels
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, path, model, digest=''):
+        """
+        Default constructor
+
+        :param path: directory to store levels in
+        :type path: string
+        :param model: model of the game
+        :type model: Model
+        :param digest: digest of configuration used to generate levels
+        :type digest: string
+        """
+        super().__init__()
+        self.path = path
+        self.model = model
+        self.digest = digest
+
+    def key(self, level_type, state):
+        """
+        Get key of level
+
+        :param level_type: type of level
+        :type level_type: string
+        :param state: states of random number generators before generation
+        :returns: key
+        :rtype: string
+        """
+        content = repr((level_type, state, self.digest)).encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+
+    def file_name(self, key):
+        """
+        Get path of file for given key
+
+        :param key: key of level
+        :type key: string
+        :returns: path of the file
+        :rtype: string
+        """
+        return os.path.join(self.path, key + '.lvl')
+
+    def get(self, key):
+        """
+        Read level from cache
+
+        :param key: key of level
+        :type key: string
+        :returns: level and states of random number generators after its
+                  generation, None if level is not in cache
+        :rtype: (Level, object)
+        """
+        try:
+            content = pickle.loads(read_file(self.file_name(key)))
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            return None
+
+        save_game = SaveGame(self.path)
+        files = content['files']
+        record = save_game.unpickle(files[0], self.model)
+        entities = (record['entities']
+                    + [save_game.unpickle(data, self.model)
+                       for data in files[1:]])
+        for entity, state in entities:
+            restore_state(entity, state)
+
+        level = save_game.objects.get(record['id'])
+        if level is None:
+            level = {}
+            save_game.register(level, record['id'])
+        save_game.restore_level(level, record, self.model)
+        return (level, content['state'])
+
+    def put(self, key, level, state):
+        """
+        Write level into cache
+
+        :param key: key of level
+        :type key: string
+        :param level: generated level
+        :type level: Level
+        :param state: states of random number generators after generation
+        """
+        save_game = SaveGame(self.path)
+        record = save_game.level_record(level)
+        owned = {save_game.identify(entity)
+                 for entity, _ in record['entities']}
+        data, references = save_game.pickle(record, self.model)
+        records, _ = save_game.pickle_loose(references - owned, owned,
+                                            self.model)
+        files = [data] + records
+        os.makedirs(self.path, exist_ok=True)
+        write_file(self.file_name(key),
+                   pickle.dumps({'files': files, 'state': state},
+                                pickle.HIGHEST_PROTOCOL))
@@ -24,9 +24,10 @@
 Classes for creature generation
 """
 
+from collections import OrderedDict
+
 from pyherc.aspects import log_debug, log_info
-from pyherc.data import (add_character, get_locations_by_tag, blocks_movement,
-                         safe_passage)
+from pyherc.data import add_characters, free_locations_by_tag
 
 
 class CreatureAdder():
@@ -108,6 +109,11 @@ class CreatureAdder():
         """
         Place creatures into a level
 
+        Creatures that can be placed in same types of locations are placed
+        together, by sampling distinct free locations for all of them at
+        once. If there are not enough free locations, rest of the creatures
+        are left out.
+
         :param creatures: creatures to place
         :type creatures: [Character]
         :param creature_list: specification where to place creatures
@@ -115,22 +121,28 @@ class CreatureAdder():
         :param level: level to place creatures
         :type level: Level
         """
+        location_types = {}
+        for spec in creature_list:
+            location_types.setdefault(spec['name'], []).append(spec['location'])
+
+        groups = OrderedDict()
         for creature in creatures:
-            location_types = [x['location'] for x in creature_list
-                              if x['name'] == creature.name]
-
-            if not location_types:
-                location_types = ['any']
-               
-
-            locations = []
-            for location_type in location_types:
-                locations.extend([location for location in (get_locations_by_tag(level,
-                                                                                 location_type))
-                                  if safe_passage(level, location)])
-
-            if locations:
-                location = self.rng.choice(locations)
-                add_character(level, location, creature)
+            key = tuple(location_types.get(creature.name, ['any']))
+            groups.setdefault(key, []).append(creature)
+
+        taken = set()
+        placements = []
+        for key, group in groups.items():
+            locations = OrderedDict()
+            for location_type in key:
+                for location in free_locations_by_tag(level, location_type):
+                    if location not in taken:
+                        locations[location] = None
+            selected = self.rng.sample(list(locations),
+                                       min(len(group), len(locations)))
+            taken.update(selected)
+            placements.extend(zip(selected, group))
+
+        add_characters(level, placements)
 
     level_types = property(__get_level_types)
@@ -26,6 +26,50 @@ Module for basic decorators
 from pyherc.data import (floor_tile, wall_tile, ornamentation, get_tiles,
                          get_tile)
 
+NORTH = 1
+NORTH_EAST = 2
+EAST = 4
+SOUTH_EAST = 8
+SOUTH = 16
+SOUTH_WEST = 32
+WEST = 64
+NORTH_WEST = 128
+
+ORTHOGONAL = ((NORTH, (0, -1)), (EAST, (1, 0)),
+              (SOUTH, (0, 1)), (WEST, (-1, 0)))
+DIAGONAL = ((NORTH_EAST, (1, -1)), (SOUTH_EAST, (1, 1)),
+            (SOUTH_WEST, (-1, 1)), (NORTH_WEST, (-1, -1)))
+SURROUNDING = ORTHOGONAL + DIAGONAL
+
+
+def neighbour_masks(locations, members, directions=SURROUNDING):
+    """
+    Calculate neighbour bitmasks for group of locations
+
+    Bit of a direction is set in mask of a location, if neighbour in that
+    direction is in members. Masks are built by sweeping over members once
+    per direction, instead of checking neighbours of each location one by
+    one.
+
+    .. versionadded:: 0.16
+
+    :param locations: locations to calculate masks for
+    :type locations: set
+    :param members: locations that set bits in masks of their neighbours
+    :type members: set
+    :param directions: pairs of bit and offset to neighbour
+    :type directions: [(int, (int, int))]
+    :returns: masks of locations, locations without neighbours are left out
+    :rtype: {(int, int): int}
+    """
+    masks = {}
+    for bit, (x_offset, y_offset) in directions:
+        for loc_x, loc_y in members:
+            location = (loc_x - x_offset, loc_y - y_offset)
+            if location in locations:
+                masks[location] = masks.get(location, 0) | bit
+    return masks
+
 
 class Decorator():
     """
@@ -106,17 +150,19 @@ class WallBuilderDecorator(Decorator):
         :type level: Level
         """
         empty_tile = self.configuration.empty_tile
+        wall_config = self.configuration.wall_config
+
+        empty = set()
+        replaceable = set()
+        for location, tile in get_tiles(level):
+            wall = tile['\ufdd0:wall']
+            if wall == empty_tile:
+                empty.add(location)
+            if wall in wall_config:
+                replaceable.add(location)
 
-        for loc, tile in list(get_tiles(level)):
-            if tile['\ufdd0:wall'] == empty_tile:
-                self.check_and_replace((loc[0] - 1, loc[1]), level)
-                self.check_and_replace((loc[0] + 1, loc[1]), level)
-                self.check_and_replace((loc[0], loc[1] - 1), level)
-                self.check_and_replace((loc[0], loc[1] + 1), level)
-                self.check_and_replace((loc[0] - 1, loc[1] - 1), level)
-                self.check_and_replace((loc[0] - 1, loc[1] + 1), level)
-                self.check_and_replace((loc[0] + 1, loc[1] - 1), level)
-                self.check_and_replace((loc[0] + 1, loc[1] + 1), level)
+        for location in neighbour_masks(replaceable, empty):
+            self.check_and_replace(location, level)
 
     def check_and_replace(self, location, level):
         """
@@ -221,18 +267,94 @@ class DirectionalWallDecorator(Decorator):
                       '57': configuration.west_south,
                       '7': configuration.east_west}
 
+        self.lookup = [self.tile_for_masks(connections, open_sides)
+                       for connections in range(16)
+                       for open_sides in range(256)]
+
     def decorate_level(self, level):
         """
         Decorate level
 
+        Connecting walls and open spaces around every wall are collected
+        into neighbour bitmasks in one sweep and each wall is then replaced
+        with tile found from lookup table.
+
         :param level: level to decorate
         :type level: Level
         """
         wall = self.configuration.wall
+        wall_tiles = set(self.configuration.tiles)
 
+        walls = set()
+        connecting = set()
+        open_space = set()
         for location, tile in get_tiles(level):
-            if tile['\ufdd0:wall'] == wall:
-                tile['\ufdd0:wall'] = self.get_wall_tile(level, location)
+            tile_id = tile['\ufdd0:wall']
+            if tile_id in wall_tiles:
+                connecting.add(location)
+                if tile_id == wall:
+                    walls.add(location)
+            else:
+                open_space.add(location)
+
+        connection_masks = neighbour_masks(walls, connecting, ORTHOGONAL)
+        open_masks = neighbour_masks(walls, open_space)
+        lookup = self.lookup
+
+        for location in walls:
+            wall_tile(level, location,
+                      lookup[self.lookup_index(connection_masks.get(location, 0),
+                                               open_masks.get(location, 0))])
+
+    def lookup_index(self, connection_mask, open_mask):
+        """
+        Calculate index in lookup table
+
+        :param connection_mask: neighbours that are walls
+        :type connection_mask: int
+        :param open_mask: neighbours that are not walls
+        :type open_mask: int
+        :returns: index in lookup table
+        :rtype: int
+        """
+        connections = (bool(connection_mask & NORTH)
+                       | bool(connection_mask & EAST) << 1
+                       | bool(connection_mask & SOUTH) << 2
+                       | bool(connection_mask & WEST) << 3)
+        return connections * 256 + open_mask
+
+    def tile_for_masks(self, connections, open_sides):
+        """
+        Calculate correct wall tile for neighbourhood
+
+        Wall connects to direction, when there's a wall in that direction
+        and the connection is not completely surrounded by walls.
+
+        :param connections: north, east, south and west walls as bits 0-3
+        :type connections: int
+        :param open_sides: neighbours that are not walls as bitmask
+        :type open_sides: int
+        :rtype: int
+        """
+        if not connections:
+            return self.configuration.wall
+
+        directions = []
+        if connections & 1 and open_sides & (NORTH_WEST | NORTH_EAST
+                                             | WEST | EAST):
+            directions.append('1')
+        if connections & 2 and open_sides & (NORTH_EAST | SOUTH_EAST
+                                             | NORTH | SOUTH):
+            directions.append('3')
+        if connections & 4 and open_sides & (SOUTH_WEST | SOUTH_EAST
+                                             | WEST | EAST):
+            directions.append('5')
+        if connections & 8 and open_sides & (NORTH_WEST | SOUTH_WEST
+                                             | NORTH | SOUTH):
+            directions.append('7')
+
+        return self.tiles.get(''.join(directions),
+                              self.configuration.four_way)
 
     def get_wall_tile(self, level, location):
         """
@@ -244,67 +366,20 @@ class DirectionalWallDecorator(Decorator):
         :type location: (int, int)
         :rtype: int
         """
-
-        directions = []
+        wall_tiles = self.configuration.tiles
         loc_x, loc_y = location
-        wall_tiles = []
-        wall_tiles.append(self.configuration.wall)
-        wall_tiles.extend(self.tiles.values())
-
-        pillar = self.check_pillar(level, location)
-        if pillar:
-            return pillar
-
-        if wall_tile(level, (loc_x, loc_y - 1)) in self.configuration.tiles:
-            if not (is_wall(level, (loc_x - 1, loc_y - 1), wall_tiles)
-                    and is_wall(level, (loc_x + 1, loc_y - 1), wall_tiles)
-                    and is_wall(level, (loc_x - 1, loc_y), wall_tiles)
-                    and is_wall(level, (loc_x + 1, loc_y), wall_tiles)):
-                directions.append('1')
-        if wall_tile(level, (loc_x + 1, loc_y)) in self.configuration.tiles:
-            if not (is_wall(level, (loc_x + 1, loc_y - 1), wall_tiles)
-                    and is_wall(level, (loc_x + 1, loc_y + 1), wall_tiles)
-                    and is_wall(level, (loc_x, loc_y - 1), wall_tiles)
-                    and is_wall(level, (loc_x, loc_y + 1), wall_tiles)):
-                directions.append('3')
-        if wall_tile(level, (loc_x, loc_y + 1)) in self.configuration.tiles:
-            if not (is_wall(level, (loc_x - 1, loc_y + 1), wall_tiles)
-                    and is_wall(level, (loc_x + 1, loc_y + 1), wall_tiles)
-                    and is_wall(level, (loc_x - 1, loc_y), wall_tiles)
-                    and is_wall(level, (loc_x + 1, loc_y), wall_tiles)):
-                directions.append('5')
-        if wall_tile(level, (loc_x - 1, loc_y)) in self.configuration.tiles:
-            if not (is_wall(level, (loc_x - 1, loc_y - 1), wall_tiles)
-                    and is_wall(level, (loc_x - 1, loc_y + 1), wall_tiles)
-                    and is_wall(level, (loc_x, loc_y - 1), wall_tiles)
-                    and is_wall(level, (loc_x, loc_y + 1), wall_tiles)):
-                directions.append('7')
-
-        key = ''.join(directions)
-
-        if key in self.tiles:
-            return self.tiles[''.join(directions)]
-        else:
-            return self.configuration.four_way
-
-    def check_pillar(self, level, location):
-        "check for possible pillar"
-        tiles = self.configuration.tiles
-        x_loc, y_loc = location
-        
-        if (wall_tile(level, (x_loc - 1, y_loc)) not in tiles
-                and wall_tile(level, (x_loc + 1, y_loc)) not in tiles
-                and wall_tile(level, (x_loc, y_loc - 1)) not in tiles
-                and wall_tile(level, (x_loc, y_loc + 1)) not in tiles):
+        connection_mask = 0
+        open_mask = 0
 
-            return self.configuration.wall
+        for bit, (x_offset, y_offset) in SURROUNDING:
+            neighbour = (loc_x + x_offset, loc_y + y_offset)
+            if wall_tile(level, neighbour) in wall_tiles:
+                connection_mask = connection_mask | bit
+            elif get_tile(level, neighbour) is not None:
+                open_mask = open_mask | bit
 
-        return None
+        return self.lookup[self.lookup_index(connection_mask, open_mask)]
 
-def is_wall(level, location, wall_tiles):
-    "check if given location is considered as a wall"
-    return (get_tile(level, location) is None 
-            or wall_tile(level, location) in wall_tiles)
 
 class FloorBuilderDecoratorConfig(DecoratorConfig):
     """
@@ -25,7 +25,9 @@ Classs needed for generating levels
 """
 
 import logging
+import random
 
+import pyherc
 from pyherc.aspects import log_debug, log_info
 from pyherc.data import new_level, Portal, add_portal, get_locations_by_tag
 from pyherc.data import wall_tile
@@ -34,7 +36,9 @@ from pyherc.data import wall_tile
 from pyherc.generators.level.partitioners.old_grid import RandomConnector
 from pyherc.generators.level import (level_partitioners, room_generators,
                                      decorators, items, characters, description)
-from pyherc.generators.level.new_generator import new_level_generator
+from pyherc.data.savegame import level_portals
+from pyherc.generators.level.new_generator import (new_level_generator,
+                                                   connect_level)
 
 class LevelGeneratorFactory():
     """
@@ -58,6 +62,7 @@ class LevelGeneratorFactory():
         #self.portal_adder_factory.level_generator_factory = self
 
         self.rng = random_generator
+        self.cache = None
 
 
     @log_info
@@ -96,9 +101,36 @@ class LevelGeneratorFactory():
     def __call__(self, level_type, portal = None):
         """
         Generate a level and connect it with portal
+
+        If cache has been set, level is read from it when possible. Random
+        number generators are left in the same state either way.
+
+        .. versionchanged:: 0.16
+           levels can be read from cache
         """
         generator = self.get_generator(level_type)
-        return generator(portal)
+        if self.cache is None:
+            return generator(portal)
+
+        key = self.cache.key(level_type, (self.rng.getstate(),
+                                          random.getstate()))
+        cached = self.cache.get(key)
+        if cached is None:
+            level = generator(None)
+            self.cache.put(key, level, (self.rng.getstate(),
+                                        random.getstate()))
+        else:
+            level, (rng_state, random_state) = cached
+            self.rng.setstate(rng_state)
+            random.setstate(random_state)
+            schedule = pyherc.vtable.get('\ufdd0:pregenerate-level')
+            if schedule:
+                for cached_portal in level_portals(level):
+                    schedule(cached_portal)
+
+        if portal is not None:
+            connect_level(level, portal, self.rng)
+        return level
 
     
     @log_debug
@@ -23,9 +23,10 @@
 """
 Classes for item generation
 """
+from collections import OrderedDict
+
 from pyherc.aspects import log_debug, log_info
-from pyherc.data import (add_item, get_locations_by_tag, blocks_movement, 
-                         safe_passage)
+from pyherc.data import add_items, free_locations_by_tag
 
 
 class ItemAdder():
@@ -104,22 +105,37 @@ class ItemAdder():
         """
         Place items to level
 
+        Items for same type of location are placed together, by sampling
+        distinct free locations for them at once. If there are more items
+        than locations, rest of the items share locations.
+
         :param items: list of tupples (item_spec, item)
         :param level: level to place items
         :type level: Level
         """
-        for item in items:
-            location_type = item[0]['location']
+        groups = OrderedDict()
+        for spec, item in items:
+            location_type = spec['location']
 
             if location_type is None:
                 location_type = 'any'
 
-            locations = [location for location in (get_locations_by_tag(level, location_type))
-                         if safe_passage(level, location)]
+            groups.setdefault(location_type, []).append(item)
+
+        placements = []
+        for location_type, group in groups.items():
+            locations = list(free_locations_by_tag(level, location_type))
+
+            if not locations:
+                continue
+
+            selected = self.rng.sample(locations,
+                                       min(len(group), len(locations)))
+            while len(selected) < len(group):
+                selected.append(self.rng.choice(locations))
+            placements.extend(zip(selected, group))
 
-            if locations:
-                location = self.rng.choice(locations)
-                add_item(level, location, item[1])
+        add_items(level, placements)
 
 
     level_types = property(__get_level_types)
@@ -24,9 +24,9 @@
 Module for adding portals
 """
 
+import pyherc
 from pyherc.aspects import log_debug, log_info
-from pyherc.data import (Portal, add_portal, get_locations_by_tag,
-                         blocks_movement, safe_passage)
+from pyherc.data import Portal, add_portal, free_locations_by_tag
 
 
 class PortalAdderConfiguration():
@@ -139,12 +139,14 @@ class PortalAdder():
         :param level: level to modify
         :type level: Level
         """
-        locations = [x for x in get_locations_by_tag(level, self.location_type)
-                     if safe_passage(level, x)]
+        locations = free_locations_by_tag(level, self.location_type)
 
         if locations:
-            location = self.rng.choice(locations)
+            location = locations.choice(self.rng)
             portal = Portal(icons=self.icons,
                             level_generator_name=self.level_generator_name)
             portal.exits_dungeon = self.escape_stairs
             add_portal(level, location, portal)
+            schedule = pyherc.vtable.get('\ufdd0:pregenerate-level')
+            if schedule:
+                schedule(portal)
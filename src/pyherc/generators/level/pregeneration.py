@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Generating levels behind portals before they are entered
+
+.. versionadded:: 0.16
+"""
+import random
+from collections import OrderedDict
+
+
+class LevelPregenerator():
+    """
+    Service generating levels behind portals ahead of time
+
+    When a portal is added to a level, a seed is drawn for its destination
+    and the portal is placed in queue. Pending levels can then be generated
+    when game is otherwise idle. If player enters portal before its level has
+    been generated, the level is generated right away with the same seed.
+
+    Generation of each level uses its own seed and random number generators
+    are restored afterwards, so resulting levels and rest of the game do not
+    depend on when generation happens.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, level_generator_factory, rng):
+        """
+        Default constructor
+
+        :param level_generator_factory: factory used to generate levels
+        :type level_generator_factory: LevelGeneratorFactory
+        :param rng: random number generator used by level generators
+        :type rng: Random
+        """
+        super().__init__()
+        self.level_generator_factory = level_generator_factory
+        self.rng = rng
+        self.pending = OrderedDict()
+
+    def schedule(self, portal):
+        """
+        Queue level behind portal for generation
+
+        Seed is stored in the portal, so a portal keeps its seed when it is
+        scheduled again, for example after its level has been read from cache.
+
+        :param portal: portal leading to level that has not been generated
+        :type portal: Portal
+        """
+        if portal.exits_dungeon or not portal.level_generator_name:
+            return
+        if portal.destination_seed is None:
+            portal.destination_seed = self.rng.getrandbits(32)
+        self.pending[portal] = portal.destination_seed
+
+    def generate(self, level_type, portal, seed):
+        """
+        Generate level with given seed and connect it to portal
+
+        :param level_type: type of level to generate
+        :type level_type: string
+        :param portal: portal to connect the level to
+        :type portal: Portal
+        :param seed: seed for random number generators
+        :type seed: int
+        :returns: generated level
+        :rtype: Level
+        """
+        rng_state = self.rng.getstate()
+        random_state = random.getstate()
+        self.rng.seed(seed)
+        random.seed(seed)
+        try:
+            return self.level_generator_factory(level_type, portal)
+        finally:
+            self.rng.setstate(rng_state)
+            random.setstate(random_state)
+
+    def run_pending(self, level=None, limit=None):
+        """
+        Generate pending levels
+
+        :param level: generate only levels behind portals of this level,
+                      None for any level
+        :type level: Level
+        :param limit: maximum amount of levels to generate, None for all
+        :type limit: int
+        :returns: amount of levels generated
+        :rtype: int
+        """
+        selected = [(portal, seed) for portal, seed in self.pending.items()
+                    if level is None or portal.level is level]
+        if limit is not None:
+            selected = selected[:limit]
+        for portal, seed in selected:
+            del self.pending[portal]
+            self.generate(portal.level_generator_name, portal, seed)
+        return len(selected)
+
+    def has_pending(self, level=None):
+        """
+        Are there levels waiting to be generated
+
+        :param level: check only portals of this level, None for any level
+        :type level: Level
+        :rtype: Boolean
+        """
+        return any(level is None or portal.level is level
+                   for portal in self.pending)
+
+    def __call__(self, level_type, portal=None):
+        """
+        Generate a level and connect it with portal
+
+        Level behind a scheduled portal is generated with the seed drawn
+        when the portal was added.
+        """
+        if portal in self.pending:
+            return self.generate(level_type, portal, self.pending.pop(portal))
+        return self.level_generator_factory(level_type, portal)
@@ -80,7 +80,8 @@ class CatacombsGenerator():
         while len(BSPStack) > 0:
             tempBSP = BSPStack.pop()
             tempBSP.split(min_size=(room_min_size[0] + 4,
-                                    room_min_size[1] + 4))
+                                    room_min_size[1] + 4),
+                          rng=self.rng)
             if tempBSP.node1 is not None:
                 BSPStack.append(tempBSP.node1)
             if tempBSP.node2 is not None:
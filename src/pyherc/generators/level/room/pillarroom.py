@@ -39,7 +39,7 @@ class PillarRoomGenerator():
     """
     @log_debug
     def __init__(self, floor_tile, corridor_tile, empty_tile, pillar_tile,
-                 level_types):
+                 level_types, rng=None):
         """
         Default constructor
 
@@ -51,17 +51,23 @@ class PillarRoomGenerator():
         :type empty_tile: integer
         :param level_types: types of level this generator can be used
         :type level_types: [string]
+        :param rng: random number generator, new one if not given
+        :type rng: Random
+
+        .. versionchanged:: 0.16
+           random number generator can be given
         """
+        self.rng = rng if rng is not None else Random()
         self.square_generator = SquareRoomGenerator(floor_tile,
                                                     empty_tile,
                                                     corridor_tile,
-                                                    level_types)
+                                                    level_types,
+                                                    self.rng)
         self.floor_tile = floor_tile
         self.corridor_tile = corridor_tile
         self.empty_tile = empty_tile
         self.level_types = level_types
         self.pillar_tile = pillar_tile
-        self.rng = Random()
 
     def __call__(self, section):
         """
@@ -40,7 +40,8 @@ class SquareRoomGenerator():
     """
     Class for generating a square room
     """
-    def __init__(self, floor_tile, empty_tile, corridor_tile, level_types):
+    def __init__(self, floor_tile, empty_tile, corridor_tile, level_types,
+                 rng=None):
         """
         Default constructor
 
@@ -52,6 +53,11 @@ class SquareRoomGenerator():
         :type corridor_tile: integer
         :param level_types: types of level this generator can be used
         :type level_types: [string]
+        :param rng: random number generator, new one if not given
+        :type rng: Random
+
+        .. versionchanged:: 0.16
+           random number generator can be given
         """
         self.floor_tile = floor_tile
         self.corridor_tile = corridor_tile
@@ -59,7 +65,7 @@ class SquareRoomGenerator():
         self.room_width = None
         self.room_height = None
         self.level_types = level_types
-        self.rng = Random()
+        self.rng = rng if rng is not None else Random()
         self.room_corners = []
         self.rows = []
         self.logger = logging.getLogger('pyherc.generators.level.room.squareroom.SquareRoomGenerator')  # noqa
@@ -30,7 +30,7 @@ from pyherc.data.effects import EffectHandle
 from pyherc.data.geometry import get_target_in_direction, TargetData
 from pyherc.data import blocks_los, get_character
 from pyherc.data.magic import Spell
-from pyherc.rules.los import get_fov_matrix
+from pyherc.rules.fov import get_fov
 
 
 class SpellGenerator():
@@ -171,9 +171,9 @@ def targeting_spherical_area(parameters, radius):
         splash_center = initial.previous_target.location
         level = parameters.caster.level
 
-        matrix = get_fov_matrix(splash_center,
-                                level,
-                                radius)
+        fov = get_fov(splash_center,
+                      level,
+                      radius)
 
         x_range = range(splash_center[0] - radius,
                         splash_center[0] + radius + 1)
@@ -181,23 +181,22 @@ def targeting_spherical_area(parameters, radius):
         y_range = range(splash_center[1] - radius,
                         splash_center[1] + radius + 1)
 
-        for location, is_visible in matrix.items():
-            if is_visible:
-                creature = get_character(level, location)
-                if creature:
-                    targets.append(TargetData('character',
-                                              location,
-                                              creature,
-                                              None))
-                elif blocks_los(level, location):
-                    targets.append(TargetData('wall',
-                                              location,
-                                              None,
-                                              None))
-                else:
-                    targets.append(TargetData('void',
-                                              location,
-                                              None,
-                                              None))
+        for location in fov.locations():
+            creature = get_character(level, location)
+            if creature:
+                targets.append(TargetData('character',
+                                          location,
+                                          creature,
+                                          None))
+            elif blocks_los(level, location):
+                targets.append(TargetData('wall',
+                                          location,
+                                          None,
+                                          None))
+            else:
+                targets.append(TargetData('void',
+                                          location,
+                                          None,
+                                          None))
 
     return targets
@@ -48,12 +48,13 @@ class BSPSection():
         self.direction = direction
         self.logger = logging.getLogger('pyherc.generators.utils.BSPSection')
 
-    def split(self, min_size=(6, 6), direction=None):
+    def split(self, min_size=(6, 6), direction=None, rng=random):
         """
         Split BSPSection in two
         Links two new BSPSections into this one
         :param min_size: minimum size to split into
         :param direction: horizontal (1) / vertical split (2)
+        :param rng: random number generator
         """
         assert self.corner1 is not None
         assert self.corner2 is not None
@@ -63,7 +64,7 @@ class BSPSection():
 
         if direction is None:
             # 1 split horizontal, 2 split vertical
-            direction = random.randint(1, 2)
+            direction = rng.randint(1, 2)
         assert(direction in (1, 2))
 
         if direction == 1:
@@ -80,7 +81,7 @@ class BSPSection():
                     direction = 1
 
         if direction == 1:
-            split_location = random.randint(min_size[1], size[1] - min_size[1])
+            split_location = rng.randint(min_size[1], size[1] - min_size[1])
             self.node1 = BSPSection(self.corner1,
                                     (self.corner2[0],
                                         self.corner1[1] + split_location),
@@ -90,7 +91,7 @@ class BSPSection():
                                     self.corner2,
                                     self, direction)
         else:
-            split_location = random.randint(min_size[0], size[0] - min_size[0])
+            split_location = rng.randint(min_size[0], size[0] - min_size[0])
             self.node1 = BSPSection(self.corner1,
                                     (self.corner1[0] + split_location,
                                      self.corner2[1]),
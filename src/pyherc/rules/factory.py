@@ -29,6 +29,12 @@ from hymn.types.maybe import Nothing, Just
 class SubActionFactory():
     """
     Factory to handle concrete creation of actions
+
+    Dispatch table is built when sub factories are first needed and again
+    after a new list of sub factories has been assigned.
+
+    .. versionchanged:: 0.16
+       sub factories are found from dispatch table
     """
     def __init__(self, effect_factory=None):
         """
@@ -40,6 +46,8 @@ class SubActionFactory():
         super().__init__()
         self.action_type = 'default'
         self.logger = logging.getLogger('pyherc.rules.factory.SubActionFactory')  # noqa
+        self.table = None
+        self.fallback = []
         self.factories = []
         self.effect_factory = effect_factory
 
@@ -56,6 +64,40 @@ class SubActionFactory():
         else:
             return Nothing        
 
+    def __get_factories(self):
+        """
+        Sub factories of this factory
+        """
+        return self.__factories
+
+    def __set_factories(self, factories):
+        """
+        Set sub factories, dispatch table is rebuilt when next needed
+        """
+        self.__factories = factories
+        self.table = None
+
+    factories = property(__get_factories, __set_factories)
+
+    def compile(self):
+        """
+        Build dispatch table of sub factories keyed by sub action
+
+        Sub factories without sub action are tried after sub factories
+        found from the table. All of them are still asked if they can handle
+        parameters.
+
+        .. versionadded:: 0.16
+        """
+        self.table = {}
+        self.fallback = []
+        for factory in self.factories:
+            sub_action = getattr(factory, 'sub_action', None)
+            if isinstance(sub_action, str):
+                self.table.setdefault(sub_action, []).append(factory)
+            else:
+                self.fallback.append(factory)
+
     def get_sub_factory(self, parameters):
         """
         Get sub factory to handle parameters
@@ -63,7 +105,13 @@ class SubActionFactory():
         Args:
             parameters: Parameters to use for searching the factory
         """
-        subs = [x for x in self.factories if x.can_handle(parameters)]
+        if self.table is None:
+            self.compile()
+
+        subs = [x for x
+                in (self.table.get(getattr(parameters, 'sub_action', None), [])
+                    + self.fallback)
+                if x.can_handle(parameters)]
 
         if len(subs) == 1:
             return subs[0]
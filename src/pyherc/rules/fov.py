@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Field of view calculation using precomputed octant tables
+
+Algorithm is the same recursive shadowcasting that is used in
+:mod:`pyherc.rules.los`, but geometry of each octant (slopes, distances and
+positions in result mask) is calculated only once per radius. Scanning is
+done with an explicit stack instead of recursion and result is a boolean
+mask instead of a dictionary.
+
+Results are cached per level and keyed by origin and radius. Cache is
+emptied when revision of the level changes, so repeated queries between
+changes of level are free. Only MAX_FOVS most recently used results are
+kept.
+
+.. versionadded:: 0.16
+"""
+
+from collections import OrderedDict
+
+from pyherc.data import los_blocker, level_revision
+
+MULT = ((1, 0, 0, -1, -1, 0, 0, 1),
+        (0, 1, -1, 0, 0, -1, 1, 0),
+        (0, 1, 1, 0, 0, -1, -1, 0),
+        (1, 0, 0, 1, -1, 0, 0, -1))
+
+FOV_CACHE = '\ufdd0:fov-cache'
+MAX_FOVS = 64
+
+octant_tables = {}
+
+
+class FieldOfView():
+    """
+    Boolean mask of visible locations around origin
+
+    .. versionadded:: 0.16
+    """
+    __slots__ = ('origin', 'radius', 'size', 'mask')
+
+    def __init__(self, origin, radius, mask):
+        """
+        Default constructor
+
+        :param origin: center of the field of view
+        :type origin: (int, int)
+        :param radius: radius of the field of view
+        :type radius: int
+        :param mask: visibility of each location, row by row
+        :type mask: bytearray
+        """
+        self.origin = origin
+        self.radius = radius
+        self.size = 2 * radius + 1
+        self.mask = mask
+
+    def __contains__(self, location):
+        index = self.index(location)
+        return index is not None and self.mask[index] != 0
+
+    def __getitem__(self, location):
+        return location in self
+
+    def index(self, location):
+        """
+        Index of given location in mask
+
+        :param location: location to check
+        :type location: (int, int)
+        :returns: index or None if location is outside of the mask
+        :rtype: int
+        """
+        loc_x = location[0] - self.origin[0] + self.radius
+        loc_y = location[1] - self.origin[1] + self.radius
+        if 0 <= loc_x < self.size and 0 <= loc_y < self.size:
+            return loc_y * self.size + loc_x
+        return None
+
+    def get(self, location, default=False):
+        """
+        Check if location is visible
+
+        :param location: location to check
+        :type location: (int, int)
+        :param default: value to return for locations outside of the mask
+        :rtype: Boolean
+        """
+        if self.index(location) is None:
+            return default
+        return location in self
+
+    def locations(self):
+        """
+        Visible locations
+
+        :returns: visible locations
+        :rtype: [(int, int)]
+        """
+        x0 = self.origin[0] - self.radius
+        y0 = self.origin[1] - self.radius
+        size = self.size
+        return [(x0 + index % size, y0 + index // size)
+                for index, visible in enumerate(self.mask)
+                if visible]
+
+    def items(self):
+        """
+        Visible locations paired with True
+
+        Provided for compatibility with :func:`pyherc.rules.los.get_fov_matrix`
+
+        :returns: pairs of location and visibility
+        :rtype: [((int, int), Boolean)]
+        """
+        return [(location, True) for location in self.locations()]
+
+    def __len__(self):
+        return sum(1 for visible in self.mask if visible)
+
+
+def octant_table(radius):
+    """
+    Get precomputed scan geometry for given radius
+
+    For each octant there is a list of rows and each row is a list of
+    cells in scanning order. A cell is a tuple of offset from origin,
+    left and right slope, is it within radius and its index in result mask.
+
+    :param radius: radius of the field of view
+    :type radius: int
+    :returns: rows of all eight octants
+    :rtype: [[[(int, int, float, float, Boolean, int)]]]
+    """
+    table = octant_tables.get(radius)
+    if table is not None:
+        return table
+
+    size = 2 * radius + 1
+    radius_squared = radius * radius
+    table = []
+    for octant in range(8):
+        xx, xy, yx, yy = (MULT[0][octant], MULT[1][octant],
+                          MULT[2][octant], MULT[3][octant])
+        rows = []
+        for j in range(1, radius + 1):
+            row = []
+            dy = -j
+            for dx in range(-j, 1):
+                off_x = dx * xx + dy * xy
+                off_y = dx * yx + dy * yy
+                row.append((off_x, off_y,
+                            (dx - 0.5) / (dy + 0.5),
+                            (dx + 0.5) / (dy - 0.5),
+                            dx * dx + dy * dy < radius_squared,
+                            (off_y + radius) * size + off_x + radius))
+            rows.append(row)
+        table.append(rows)
+
+    octant_tables[radius] = table
+    return table
+
+
+def calculate_fov(location, level, radius):
+    """
+    Calculate field of view without consulting cache
+
+    :param location: center of fov calculation
+    :type location: (int, int)
+    :param level: level where fov is calculated
+    :type level: Level
+    :param radius: distance of vision
+    :type radius: int
+    :returns: visible locations
+    :rtype: FieldOfView
+    """
+    size = 2 * radius + 1
+    mask = bytearray(size * size)
+    mask[radius * size + radius] = 1
+    blocks_los = los_blocker(level)
+    cx, cy = location
+
+    for rows in octant_table(radius):
+        stack = [(1, 1.0, 0.0)]
+        while stack:
+            row, start, end = stack.pop()
+            if start < end:
+                continue
+            new_start = start
+            for j in range(row, radius + 1):
+                blocked = False
+                for off_x, off_y, l_slope, r_slope, lit, index in rows[j - 1]:
+                    if start < r_slope:
+                        continue
+                    elif end > l_slope:
+                        break
+                    if lit:
+                        mask[index] = 1
+                    if blocked:
+                        if blocks_los((cx + off_x, cy + off_y)):
+                            new_start = r_slope
+                        else:
+                            blocked = False
+                            start = new_start
+                    elif j < radius and blocks_los((cx + off_x, cy + off_y)):
+                        blocked = True
+                        stack.append((j + 1, start, l_slope))
+                        new_start = r_slope
+                if blocked:
+                    break
+
+    return FieldOfView(location, radius, mask)
+
+
+def get_fov(location, level, radius):
+    """
+    Get field of view, using cached result if possible
+
+    :param location: center of fov calculation
+    :type location: (int, int)
+    :param level: level where fov is calculated
+    :type level: Level
+    :param radius: distance of vision
+    :type radius: int
+    :returns: visible locations
+    :rtype: FieldOfView
+    """
+    revision = level_revision(level)
+    cache = level.get(FOV_CACHE)
+    if cache is None or cache[0] != revision:
+        cache = (revision, OrderedDict())
+        level[FOV_CACHE] = cache
+
+    fovs = cache[1]
+    key = (location, radius)
+    fov = fovs.get(key)
+    if fov is None:
+        fov = calculate_fov(location, level, radius)
+        fovs[key] = fov
+        if len(fovs) > MAX_FOVS:
+            fovs.popitem(last=False)
+    else:
+        fovs.move_to_end(key)
+    return fov
@@ -120,5 +120,4 @@ class InventoryFactory(SubActionFactory):
         if hasattr(factories, '__iter__'):
             self.factories = factories
         else:
-            self.factories = []
-            self.factories.append(factories)
+            self.factories = [factories]
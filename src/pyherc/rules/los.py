@@ -33,7 +33,7 @@
 Line of sight implementation
 """
 
-from pyherc.data import level_size, blocks_los
+from pyherc.data import los_blocker
 
 mult = [[1,  0,  0, -1, -1,  0,  0,  1],
         [0,  1, -1,  0,  0, -1,  1,  0],
@@ -42,10 +42,13 @@ mult = [[1,  0,  0, -1, -1,  0,  0,  1],
 
 #TODO: parametrize for vision and movement
 def cast_light(cx, cy, row, start, end, radius, xx, xy, yx, yy, fov_matrix,
-               level):
+               blocks_los):
     """
     Recursive lightcasting function
 
+    blocks_los is function for checking if given location blocks line of
+    sight, as returned by los_blocker
+
     Returns:
         fov_matrix
     """
@@ -73,18 +76,18 @@ def cast_light(cx, cy, row, start, end, radius, xx, xy, yx, yy, fov_matrix,
                     fov_matrix[(X, Y)] = True
                 if blocked:
                     # we're scanning a row of blocked squares:
-                    if blocks_los(level, (X, Y)):
+                    if blocks_los((X, Y)):
                         new_start = r_slope
                         continue
                     else:
                         blocked = False
                         start = new_start
                 else:
-                    if blocks_los(level, (X, Y)) and j < radius:
+                    if blocks_los((X, Y)) and j < radius:
                         # This is a blocking square, start a child scan:
                         blocked = True
                         cast_light(cx, cy, j+1, start, l_slope,
-                                   radius, xx, xy, yx, yy, fov_matrix, level)
+                                   radius, xx, xy, yx, yy, fov_matrix, blocks_los)
                         new_start = r_slope
         # Row is scanned; do next row unless last square was blocked:
         if blocked:
@@ -97,10 +100,11 @@ def do_fov(x, y, radius, fov_matrix, level):
     """
     Calculate lit squares from the given location and radius
     """
+    blocks_los = los_blocker(level)
     for oct in range(8):
         cast_light(x, y, 1, 1.0, 0.0, radius,
                    mult[0][oct], mult[1][oct],
-                   mult[2][oct], mult[3][oct], fov_matrix, level)
+                   mult[2][oct], mult[3][oct], fov_matrix, blocks_los)
 
     return fov_matrix
 
@@ -33,13 +33,141 @@ InventoryParameters - Class used to guide inventory related actions
 SpellCastingParameteres - Class used to guide spell casting
 """
 
+from timeit import default_timer
+
 from hymn.types.maybe import Just, Nothing, is_nothing
 from pyherc.aspects import log_debug, log_info
+from pyherc.rules.factory import SubActionFactory
+
+ACTION_RULES = ('\ufdd0:move', '\ufdd0:attack', '\ufdd0:wait',
+                '\ufdd0:lunge')
+
+
+def action_key(parameters):
+    """
+    Get key identifying type of action described by parameters
+
+    Args:
+        parameters: Parameters of action
+
+    Returns:
+        Action type, followed by sub action if there is one
+
+    .. versionadded:: 0.16
+    """
+    action_type = getattr(parameters, 'action_type', None)
+    sub_action = getattr(parameters, 'sub_action', None)
+    if sub_action is None:
+        return action_type
+    return '{0}: {1}'.format(action_type, sub_action)
+
+
+class ActionStatistics():
+    """
+    Counts and times creation and execution of actions
+
+    Actions created through :class:`ActionFactory` are recorded when
+    statistics is set for the factory. Moving, attacking, waiting and
+    lunging are rules in vtable and don't go through the factory, so they
+    are recorded only after :meth:`instrument` has wrapped them. Time of
+    a rule includes time of rules it calls.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.entries = {}
+        self.originals = {}
+
+    def instrument(self, vtable, keys=ACTION_RULES):
+        """
+        Wrap rules in vtable so that their execution is recorded
+
+        Args:
+            vtable: Table of rules, usually pyherc.vtable
+            keys: Keys of rules to wrap
+        """
+        for key in keys:
+            if key in vtable and key not in self.originals:
+                self.originals[key] = vtable[key]
+                vtable[key] = self.timed(key.replace('\ufdd0:', '', 1),
+                                         vtable[key])
+
+    def restore(self, vtable):
+        """
+        Put original rules back in vtable
+
+        Args:
+            vtable: Table of rules given to instrument
+        """
+        for key, rule in self.originals.items():
+            vtable[key] = rule
+        self.originals = {}
+
+    def timed(self, name, rule):
+        """
+        Wrap rule so that its execution is recorded
+
+        Args:
+            name: Name used in statistics
+            rule: Function to wrap
+
+        Returns:
+            Function calling rule and recording how long it took
+        """
+        def wrapper(*args, **kwargs):
+            start = default_timer()
+            try:
+                return rule(*args, **kwargs)
+            finally:
+                self.record(name, 'execution', default_timer() - start)
+        return wrapper
+
+    def record(self, key, stage, seconds):
+        """
+        Record creating or executing an action
+
+        Args:
+            key: Type of action
+            stage: 'creation' or 'execution'
+            seconds: Time it took
+        """
+        entry = self.entries.get((key, stage))
+        if entry is None:
+            self.entries[(key, stage)] = [1, seconds]
+        else:
+            entry[0] = entry[0] + 1
+            entry[1] = entry[1] + seconds
+
+    def report(self):
+        """
+        Get counts and times keyed by type of action and stage
+
+        Returns:
+            Dictionary of calls and seconds, keyed by type of action and
+            stage
+        """
+        results = {}
+        for (key, stage), (calls, seconds) in sorted(self.entries.items()):
+            results.setdefault(key, {})[stage] = {'calls': calls,
+                                                  'seconds': seconds}
+        return results
 
 
 class ActionFactory():
     """
     Object for creating actions
+
+    Sub factories are placed in a dispatch table keyed by action type when
+    they are assigned to the factory. Factories without action type are
+    asked if they can handle parameters, after factories found from the
+    table.
+
+    .. versionchanged:: 0.16
+       factories are found from dispatch table
     """
 
     @log_debug
@@ -53,13 +181,67 @@ class ActionFactory():
         """
         super().__init__()
 
+        self.model = model
+        self.statistics = None
+        self.table = {}
+        self.fallback = []
+
         if hasattr(factories, '__iter__'):
             self.factories = factories
         else:
-            self.factories = []
-            self.factories.append(factories)
+            self.factories = [factories]
 
-        self.model = model
+    def __get_factories(self):
+        """
+        Sub factories of this factory
+        """
+        return self.__factories
+
+    def __set_factories(self, factories):
+        """
+        Set sub factories and build dispatch table for them
+        """
+        self.__factories = factories
+        self.compile()
+
+    factories = property(__get_factories, __set_factories)
+
+    def compile(self):
+        """
+        Build dispatch table of sub factories
+
+        .. versionadded:: 0.16
+        """
+        self.table = {}
+        self.fallback = []
+        for factory in self.factories:
+            action_type = getattr(factory, 'action_type', None)
+            if isinstance(action_type, str):
+                self.table.setdefault(action_type, []).append(factory)
+            else:
+                self.fallback.append(factory)
+            if isinstance(factory, SubActionFactory):
+                factory.compile()
+
+    def candidates(self, parameters):
+        """
+        Get sub factories that can handle parameters
+
+        Factories are looked up from dispatch table, but each one of them is
+        still asked if it can handle parameters.
+
+        Args:
+            parameters: Parameters of action
+
+        Returns:
+            List of factories in order they should be tried
+
+        .. versionadded:: 0.16
+        """
+        factories = self.table.get(getattr(parameters, 'action_type', None),
+                                   [])
+        return [factory for factory in factories + self.fallback
+                if factory.can_handle(parameters)]
 
     def __call__(self, parameters):
         """
@@ -69,14 +251,80 @@ class ActionFactory():
             Just(Action) when creation of Action was possible
             Nothing when creation of Action was not possible
         """
-        iterator = iter(self.factories)
-        res = Nothing
-        for fn in iter(self.factories):
+        for fn in self.candidates(parameters):
             res = fn(parameters)
             if not is_nothing(res):
                 return res
         return Nothing
 
+    def create(self, parameters):
+        """
+        Create an action, recording statistics if they are collected
+
+        Args:
+            parameters: Parameters of action
+
+        Returns:
+            Action or None if no factory could create it
+
+        .. versionadded:: 0.16
+        """
+        statistics = self.statistics
+        if statistics is not None:
+            start = default_timer()
+
+        action = None
+        for factory in self.candidates(parameters):
+            action = factory.get_action(parameters)
+            break
+
+        if statistics is not None:
+            statistics.record(action_key(parameters), 'creation',
+                              default_timer() - start)
+        return action
+
+    def run(self, parameters):
+        """
+        Create and execute an action
+
+        Args:
+            parameters: Parameters of action
+
+        Returns:
+            Result of executing the action
+
+        .. versionadded:: 0.16
+        """
+        action = self.create(parameters)
+        assert action is not None, 'no suitable factory found'
+
+        statistics = self.statistics
+        if statistics is None:
+            return action.execute()
+
+        start = default_timer()
+        result = action.execute()
+        statistics.record(action_key(parameters), 'execution',
+                          default_timer() - start)
+        return result
+
+    def is_legal(self, parameters):
+        """
+        Check if action would be legal
+
+        Args:
+            parameters: Parameters of action
+
+        Returns:
+            True if action can be created and is legal
+
+        .. versionadded:: 0.16
+        """
+        action = self.create(parameters)
+        if action is None:
+            return False
+        return action.is_legal()
+
     @log_info
     def get_action(self, parameters):
         """
@@ -110,7 +358,7 @@ class ActionFactory():
         Returns:
             Sub factory if found, None otherwise
         """
-        subs = [x for x in self.factories if x.can_handle(parameters)]
+        subs = self.candidates(parameters)
 
         if len(subs) == 1:
             return subs[0]
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Weighted random sampling
+
+Tables are built once from items and their integer weights and can then be
+used for drawing items repeatedly. :class:`CumulativeTable` draws with a
+single call to ``randint`` and binary search, while :class:`AliasTable` uses
+Vose's alias method and draws in constant time.
+
+.. versionadded:: 0.16
+"""
+from bisect import bisect_left
+from itertools import accumulate
+
+
+class CumulativeTable():
+    """
+    Weighted table using cumulative weights and binary search
+
+    Drawing picks a score between 1 and sum of weights and returns the first
+    item whose cumulative weight reaches it. This consumes random numbers in
+    the same way as a linear scan over running totals would.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, items, weights):
+        """
+        Default constructor
+
+        :param items: items to draw from
+        :type items: [Any]
+        :param weights: positive integer weights of items
+        :type weights: [int]
+        """
+        super().__init__()
+        self.items = list(items)
+        self.cumulative = list(accumulate(weights))
+        self.total = self.cumulative[-1] if self.cumulative else 0
+
+    def draw(self, rng):
+        """
+        Draw random item
+
+        :param rng: random number generator
+        :type rng: Random
+        :returns: item or None if table is empty
+        """
+        if not self.total:
+            return None
+        score = rng.randint(1, self.total)
+        return self.items[bisect_left(self.cumulative, score)]
+
+    def __len__(self):
+        return len(self.items)
+
+
+class AliasTable():
+    """
+    Weighted table using Vose's alias method
+
+    Each slot holds an item, a threshold and an alias. Drawing selects a
+    slot and a score uniformly and returns either item of the slot or its
+    alias, so that every draw takes constant time. Integer arithmetic is
+    used, so probabilities are exact.
+
+    .. versionadded:: 0.16
+    """
+    def __init__(self, items, weights):
+        """
+        Default constructor
+
+        :param items: items to draw from
+        :type items: [Any]
+        :param weights: positive integer weights of items
+        :type weights: [int]
+        """
+        super().__init__()
+        self.items = list(items)
+        count = len(self.items)
+        self.total = sum(weights)
+        self.thresholds = [weight * count for weight in weights]
+        self.aliases = list(range(count))
+
+        small = [index for index in range(count)
+                 if self.thresholds[index] < self.total]
+        large = [index for index in range(count)
+                 if self.thresholds[index] >= self.total]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.aliases[less] = more
+            self.thresholds[more] = (self.thresholds[more]
+                                     - (self.total - self.thresholds[less]))
+            if self.thresholds[more] < self.total:
+                small.append(more)
+            else:
+                large.append(more)
+        for index in small + large:
+            self.thresholds[index] = self.total
+
+    def draw(self, rng):
+        """
+        Draw random item
+
+        :param rng: random number generator
+        :type rng: Random
+        :returns: item or None if table is empty
+        """
+        if not self.total:
+            return None
+        index = rng.randrange(len(self.items))
+        if rng.randrange(self.total) < self.thresholds[index]:
+            return self.items[index]
+        return self.items[self.aliases[index]]
+
+    def __len__(self):
+        return len(self.items)
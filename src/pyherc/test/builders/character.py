@@ -42,6 +42,7 @@ class CharacterBuilder():
         self.spirit = 5
         self.max_spirit = 5
         self.model = mock()
+        self.model.time = 0
 
         self.speed = 1
         self.tick = 0
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Tests for action factory
+"""
+import pyherc
+from hamcrest import assert_that, equal_to, has_key, is_, none
+from mockito import mock
+from pyherc.data import Model, add_item
+from pyherc.data.constants import Duration
+from pyherc.ports import pick_up, set_action_factory
+from pyherc.ports.inventory import InventoryParameters
+from pyherc.rules.factory import SubActionFactory
+from pyherc.rules.inventory.factories import DropFactory, PickUpFactory
+from pyherc.rules.public import ActionStatistics
+from pyherc.test.builders import (ActionFactoryBuilder, CharacterBuilder,
+                                  ItemBuilder, LevelBuilder)
+
+
+class TestActionFactory():
+    """
+    Tests for action factory
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.factory = None
+        self.character = None
+        self.item = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.factory = (ActionFactoryBuilder()
+                        .with_inventory_factory()
+                        .with_dig_factory()
+                        .build())
+        self.character = (CharacterBuilder()
+                          .with_level(LevelBuilder().build())
+                          .with_location((5, 5))
+                          .with_model(Model())
+                          .build())
+        self.item = ItemBuilder().build()
+        add_item(self.character.level, (5, 5), self.item)
+
+    def test_factories_are_placed_in_dispatch_table(self):
+        """
+        Factories should be found from table by their action type
+        """
+        assert_that(self.factory.table, has_key('inventory'))
+        assert_that(self.factory.table, has_key('dig'))
+
+    def test_sub_factory_is_found_by_sub_action(self):
+        """
+        Inventory factory should find its sub factory by sub action
+        """
+        parameters = InventoryParameters(self.character, self.item, 'drop')
+
+        factory = self.factory.get_sub_factory(parameters)
+        sub_factory = factory.get_sub_factory(parameters)
+
+        assert_that(sub_factory.sub_action, is_(equal_to('drop')))
+
+    def test_unknown_action_type_is_not_handled(self):
+        """
+        Parameters with unknown action type should not create action
+        """
+        parameters = mock()
+        parameters.action_type = 'juggle'
+
+        assert_that(self.factory.get_sub_factory(parameters), is_(none()))
+        assert_that(self.factory.create(parameters), is_(none()))
+        assert_that(self.factory.is_legal(parameters), is_(equal_to(False)))
+
+    def test_factory_without_action_type_is_consulted(self):
+        """
+        Factory without string action type should be asked if it can handle
+        parameters
+        """
+        sub_factory = SubActionFactory()
+        sub_factory.action_type = None
+        sub_factory.can_handle = lambda parameters: True
+
+        parameters = mock()
+        parameters.action_type = 'juggle'
+        factory = (ActionFactoryBuilder()
+                   .with_inventory_factory()
+                   .with_dig_factory()
+                   .build())
+        factory.factories = factory.factories + [sub_factory]
+
+        assert_that(factory.get_sub_factory(parameters),
+                    is_(equal_to(sub_factory)))
+
+    def test_factories_in_table_are_asked_if_they_can_handle(self):
+        """
+        Factories found from dispatch table should still be able to decline
+        """
+        parameters = InventoryParameters(self.character, self.item, 'drop')
+        inventory = self.factory.get_sub_factory(parameters)
+        drop = inventory.get_sub_factory(parameters)
+        drop.can_handle = lambda parameters: False
+        inventory.can_handle = lambda parameters: False
+
+        assert_that(inventory.get_sub_factory(parameters), is_(none()))
+        assert_that(self.factory.get_sub_factory(parameters), is_(none()))
+        assert_that(self.factory.create(parameters), is_(none()))
+
+    def test_actions_are_counted_per_type(self):
+        """
+        Statistics should count creation and execution per action type
+        """
+        statistics = ActionStatistics()
+        self.factory.statistics = statistics
+        set_action_factory(self.factory)
+
+        pick_up(self.character, self.item)
+
+        report = statistics.report()
+        entry = report['inventory: pick up']
+        assert_that(entry['creation']['calls'], is_(equal_to(1)))
+        assert_that(entry['execution']['calls'], is_(equal_to(1)))
+        assert_that(self.item in self.character.inventory)
+
+    def test_new_sub_factories_are_used(self):
+        """
+        Assigning new sub factories should rebuild dispatch table
+        """
+        parameters = InventoryParameters(self.character, self.item, 'drop')
+        inventory = self.factory.get_sub_factory(parameters)
+        inventory.get_sub_factory(parameters)
+
+        drop = DropFactory()
+        inventory.factories = [PickUpFactory(), drop]
+
+        assert_that(inventory.get_sub_factory(parameters),
+                    is_(equal_to(drop)))
+
+    def test_rules_in_vtable_are_counted(self):
+        """
+        Instrumented rules in vtable should be counted and restored
+        """
+        statistics = ActionStatistics()
+        original = pyherc.vtable['\ufdd0:wait']
+        statistics.instrument(pyherc.vtable)
+        try:
+            pyherc.vtable['\ufdd0:wait'](self.character, Duration.fast)
+        finally:
+            statistics.restore(pyherc.vtable)
+
+        report = statistics.report()
+        assert_that(report['wait']['execution']['calls'], is_(equal_to(1)))
+        assert_that(pyherc.vtable['\ufdd0:wait'], is_(equal_to(original)))
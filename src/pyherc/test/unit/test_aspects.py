@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Tests for logging aspects
+"""
+
+import logging
+import sys
+import types
+
+import pyherc
+from hamcrest import assert_that, is_, equal_to, same_instance
+from pyherc.aspects import set_module_logging
+
+SOURCE = """
+from toolz import curry
+from pyherc.aspects import log_debug, log_info
+
+@log_debug
+def double(value):
+    return value * 2
+
+@log_info
+def triple(value):
+    return value * 3
+
+class Doubler():
+    @log_debug
+    def double(self, value):
+        return value * 2
+
+@curry
+@log_debug
+def multiply(value, multiplier):
+    return value * multiplier
+"""
+
+
+class CountingValue():
+    """
+    Value keeping track how many times it has been formatted
+    """
+    def __init__(self):
+        super().__init__()
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted = self.formatted + 1
+        return 'counting value'
+
+    def __mul__(self, other):
+        return self
+
+
+class RecordingHandler(logging.Handler):
+    """
+    Handler storing emitted records
+    """
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestLoggingAspects():
+    """
+    Tests for logging aspects
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.module = None
+        self.original = None
+        self.handler = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.module = types.ModuleType('aspect_test_module')
+        sys.modules['aspect_test_module'] = self.module
+        exec(SOURCE, self.module.__dict__)
+        self.original = self.module.double
+        self.handler = RecordingHandler()
+        logger = logging.getLogger('aspect_test_module')
+        logger.addHandler(self.handler)
+        logger.setLevel(logging.DEBUG)
+
+    def teardown(self):
+        """
+        Clean up after test
+        """
+        set_module_logging('aspect_test_module', 'none')
+        set_module_logging('aspect_test', 'none')
+        set_module_logging('aspect_test_module.sub', 'none')
+        pyherc.vtable.pop('\ufdd0:aspect-test-double', None)
+        pyherc.vtable.pop('\ufdd0:aspect-test-method', None)
+        logging.getLogger('aspect_test_module').removeHandler(self.handler)
+        del sys.modules['aspect_test_module']
+
+    def test_nothing_is_logged_when_logging_is_off(self):
+        """
+        Decorated functions are called without logging when logging is off
+        """
+        value = CountingValue()
+
+        result = self.module.double(value)
+
+        assert_that(result, is_(same_instance(value)))
+        assert_that(self.handler.messages, is_(equal_to([])))
+        assert_that(value.formatted, is_(equal_to(0)))
+
+    def test_logging_can_be_switched_on_at_runtime(self):
+        """
+        Logging can be switched on after functions have been decorated
+        """
+        set_module_logging('aspect_test_module', 'debug')
+
+        self.module.double(2)
+
+        assert_that(len(self.handler.messages), is_(equal_to(2)))
+
+    def test_methods_are_logged(self):
+        """
+        Methods of classes are logged too
+        """
+        set_module_logging('aspect_test_module', 'debug')
+
+        self.module.Doubler().double(2)
+
+        assert_that(len(self.handler.messages), is_(equal_to(2)))
+
+    def test_level_is_respected(self):
+        """
+        Only functions with high enough level are logged
+        """
+        set_module_logging('aspect_test_module', 'info')
+
+        self.module.double(2)
+        self.module.triple(2)
+
+        assert_that(len(self.handler.messages), is_(equal_to(2)))
+
+    def test_logging_can_be_switched_off_at_runtime(self):
+        """
+        Logging stops when it is switched off, without replacing functions
+        """
+        set_module_logging('aspect_test_module', 'debug')
+        set_module_logging('aspect_test_module', 'none')
+
+        self.module.double(2)
+
+        assert_that(self.handler.messages, is_(equal_to([])))
+        assert_that(self.module.double, is_(same_instance(self.original)))
+
+    def test_references_taken_earlier_are_logged(self):
+        """
+        References taken before logging was switched on are logged too
+        """
+        double = self.module.double
+        closure = lambda value: double(value)
+        set_module_logging('aspect_test_module', 'debug')
+
+        closure(2)
+
+        assert_that(len(self.handler.messages), is_(equal_to(2)))
+
+    def test_arguments_are_formatted_lazily(self):
+        """
+        Arguments are not formatted if record is not emitted
+        """
+        set_module_logging('aspect_test_module', 'debug')
+        logging.getLogger('aspect_test_module').setLevel(logging.ERROR)
+        value = CountingValue()
+
+        self.module.double(value)
+
+        assert_that(value.formatted, is_(equal_to(0)))
+
+    def test_vtable_entries_are_logged(self):
+        """
+        Functions and bound methods placed in vtable are logged too
+        """
+        pyherc.vtable['\ufdd0:aspect-test-double'] = self.module.double
+        pyherc.vtable['\ufdd0:aspect-test-method'] = \
+            self.module.Doubler().double
+        set_module_logging('aspect_test_module', 'debug')
+
+        pyherc.vtable['\ufdd0:aspect-test-double'](2)
+        pyherc.vtable['\ufdd0:aspect-test-method'](2)
+
+        assert_that(len(self.handler.messages), is_(equal_to(4)))
+
+    def test_other_modules_are_not_logged(self):
+        """
+        Switching logging on for a module does not affect other modules
+        """
+        set_module_logging('aspect_test', 'debug')
+        set_module_logging('aspect_test_module.sub', 'debug')
+
+        self.module.double(2)
+
+        assert_that(self.handler.messages, is_(equal_to([])))
+
+    def test_curried_functions_are_logged(self):
+        """
+        Curried functions are logged too
+        """
+        set_module_logging('aspect_test_module', 'debug')
+
+        result = self.module.multiply(2)(3)
+
+        assert_that(result, is_(equal_to(6)))
+        assert_that(len(self.handler.messages), is_(equal_to(2)))
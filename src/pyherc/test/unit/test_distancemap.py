@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Tests for shared distance maps
+"""
+
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to, same_instance, is_not
+from pyherc.ai import a_star, distance_map, downhill_step, follow_distance_map
+from pyherc.data import blocks_movement, area_4_around, wall_tile
+from pyherc.test.builders import LevelBuilder
+from pyherc.test.matchers import continuous_path
+
+
+def passable_neighbours(level, location):
+    """
+    Passable locations in cardinal directions
+    """
+    return [node for node in area_4_around(location)
+            if not blocks_movement(level, node)]
+
+
+class TestDistanceMap():
+    """
+    Tests for distance maps
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.level = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        rng = Random(11)
+        builder = LevelBuilder().with_size((30, 15))
+        for _ in range(100):
+            builder = builder.with_wall_at((rng.randint(0, 29),
+                                            rng.randint(0, 14)))
+        self.level = builder.build()
+
+    def test_paths_are_shortest(self):
+        """
+        Paths following distance map are as short as ones found with A*
+        """
+        rng = Random(3)
+        free = [(x, y) for x in range(30) for y in range(15)
+                if not blocks_movement(self.level, (x, y))]
+        goal = rng.choice(free)
+
+        for _ in range(30):
+            start = rng.choice(free)
+            expected = a_star(passable_neighbours, start, goal, self.level)[0]
+            path = follow_distance_map(start, goal, self.level)[0]
+
+            assert_that(len(path), is_(equal_to(len(expected))))
+            if path:
+                assert_that(path, is_(continuous_path(start=start,
+                                                      destination=goal,
+                                                      level=self.level)))
+
+    def test_step_is_taken_along_path(self):
+        """
+        Downhill step is the next location of path to goal
+        """
+        path = follow_distance_map((1, 1), (20, 10), self.level)[0]
+
+        step = downhill_step((1, 1), (20, 10), self.level)
+
+        assert_that(step, is_(equal_to(path[1])))
+
+    def test_no_step_is_taken_at_goal(self):
+        """
+        There is no step to take when already standing at goal
+        """
+        step = downhill_step((5, 5), (5, 5), self.level)
+
+        assert_that(step, is_(equal_to(None)))
+
+    def test_map_is_shared_between_searches(self):
+        """
+        Searches towards the same target use the same map
+        """
+        first = distance_map(self.level, (5, 5))
+        second = distance_map(self.level, (5, 5))
+
+        assert_that(second, is_(same_instance(first)))
+
+    def test_changing_level_recalculates_map(self):
+        """
+        Changing terrain causes map to be calculated again
+        """
+        wall_tile(self.level, (0, 0), None)
+        first = distance_map(self.level, (5, 5))
+        wall_tile(self.level, (0, 0), 11)
+        second = distance_map(self.level, (5, 5))
+
+        assert_that(second, is_not(same_instance(first)))
+        assert_that(second.distance((0, 0)), is_(equal_to(None)))
+
+    def test_unreachable_target(self):
+        """
+        Path to target that can not be reached is empty
+        """
+        level = (LevelBuilder()
+                 .with_size((10, 3))
+                 .with_wall_at((4, 0))
+                 .with_wall_at((4, 1))
+                 .with_wall_at((4, 2))
+                 .build())
+
+        path = follow_distance_map((1, 1), (8, 1), level)[0]
+
+        assert_that(path, is_(equal_to([])))
+        assert_that(downhill_step((1, 1), (8, 1), level), is_(equal_to(None)))
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Tests for event bus
+"""
+from hamcrest import assert_that, is_, equal_to, contains
+from mockito import mock, verify
+from pyherc.data import Model
+from pyherc.events import EventBus, new_move_event, new_notice_event
+from pyherc.test.builders import CharacterBuilder, LevelBuilder
+
+
+class EventRecorder():
+    """
+    Listener keeping track of received events
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.events = []
+
+    def receive_event(self, event):
+        """
+        Store received event
+        """
+        self.events.append(event)
+
+
+class TestEventBus():
+    """
+    Tests for event bus
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.bus = None
+        self.level = None
+        self.character = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.bus = EventBus()
+        self.level = LevelBuilder().build()
+        self.character = (CharacterBuilder()
+                          .with_level(self.level)
+                          .with_location((5, 5))
+                          .build())
+
+    def test_events_are_filtered_by_type(self):
+        """
+        Listener should receive only events it has subscribed to
+        """
+        listener = EventRecorder()
+        self.bus.subscribe(listener, event_types=['notice'])
+
+        notice = new_notice_event(self.character, self.character)
+        self.bus.publish(new_move_event(self.character, (4, 5),
+                                        self.level, 3))
+        self.bus.publish(notice)
+
+        assert_that(listener.events, contains(notice))
+
+    def test_events_are_filtered_by_level(self):
+        """
+        Events in other levels should not be delivered
+        """
+        listener = EventRecorder()
+        self.bus.subscribe(listener, level=LevelBuilder().build())
+
+        self.bus.publish(new_notice_event(self.character, self.character))
+
+        assert_that(listener.events, is_(equal_to([])))
+
+    def test_events_are_filtered_by_character(self):
+        """
+        Events of other characters should not be delivered
+        """
+        listener = EventRecorder()
+        other = (CharacterBuilder()
+                 .with_level(self.level)
+                 .with_location((6, 6))
+                 .build())
+        self.bus.subscribe(listener, character=self.character)
+
+        own = new_notice_event(self.character, other)
+        self.bus.publish(new_notice_event(other, self.character))
+        self.bus.publish(own)
+
+        assert_that(listener.events, contains(own))
+
+    def test_subscribing_again_replaces_subscription(self):
+        """
+        Listener subscribing twice should receive events only once
+        """
+        listener = EventRecorder()
+        self.bus.subscribe(listener, event_types=['move'])
+        self.bus.subscribe(listener, event_types=['notice'])
+
+        self.bus.publish(new_notice_event(self.character, self.character))
+
+        assert_that(len(listener.events), is_(equal_to(1)))
+        assert_that(self.bus.listeners(), contains(listener))
+
+    def test_held_events_are_delivered_in_order_on_release(self):
+        """
+        Events published while bus is held should be delivered in batch
+        """
+        listener = EventRecorder()
+        self.bus.subscribe(listener)
+        first = new_notice_event(self.character, self.character)
+        second = new_move_event(self.character, (4, 5), self.level, 3)
+
+        self.bus.hold()
+        self.bus.publish(first)
+        self.bus.publish(second)
+
+        assert_that(listener.events, is_(equal_to([])))
+
+        self.bus.release()
+
+        assert_that(listener.events, contains(first, second))
+
+    def test_player_receives_events_raised_in_model(self):
+        """
+        Player character should be subscribed to events of the model
+        """
+        model = Model()
+        player = mock()
+        model.player = player
+        event = new_notice_event(self.character, self.character)
+
+        model.raise_event(event)
+
+        verify(player).receive_event(event)
@@ -23,8 +23,13 @@
 """
 Tests for events
 """
+import pickle
+
+from hamcrest import assert_that, is_, is_not, equal_to, none, same_instance
 from mockito import mock, verify
-from pyherc.test.builders import CharacterBuilder
+from pyherc.events import (e_event_type, e_character, e_level, e_target,
+                           new_move_event, new_drop_event, new_pick_up_event)
+from pyherc.test.builders import CharacterBuilder, LevelBuilder
 
 
 class TestCharacterEvents():
@@ -48,3 +53,66 @@ class TestCharacterEvents():
         character.receive_event(event)
 
         verify(listener).receive_event(event)
+
+
+class TestEventRecords():
+    """
+    Tests for records used to represent events
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.level = None
+        self.character = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.level = LevelBuilder().build()
+        self.character = (CharacterBuilder()
+                          .with_level(self.level)
+                          .with_location((5, 5))
+                          .build())
+
+    def test_fields_are_accessible(self):
+        """
+        Fields of event should be available through accessors
+        """
+        event = new_move_event(self.character, (5, 4), self.level, 5)
+
+        assert_that(e_event_type(event), is_(equal_to('move')))
+        assert_that(e_level(event), is_(same_instance(self.level)))
+        assert_that(e_character(event), is_(same_instance(self.character)))
+
+    def test_missing_fields_are_none(self):
+        """
+        Accessing field not used by type of event should give None
+        """
+        event = new_move_event(self.character, (5, 4), self.level, 5)
+
+        assert_that(e_target(event), is_(none()))
+
+    def test_events_with_same_fields_are_different(self):
+        """
+        Events should be distinct even if their fields are equal
+        """
+        item = mock()
+
+        pick_up = new_pick_up_event(self.character, item)
+        drop = new_drop_event(self.character, item)
+
+        assert_that(pick_up, is_not(equal_to(drop)))
+
+    def test_event_can_be_pickled(self):
+        """
+        Events should survive pickling
+        """
+        event = new_move_event(self.character, (5, 4), None, 5)
+
+        loaded = pickle.loads(pickle.dumps(event))
+
+        assert_that(e_event_type(loaded), is_(equal_to('move')))
+        assert_that(e_character(loaded).location, is_(equal_to((5, 5))))
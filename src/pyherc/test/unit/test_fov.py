@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Tests for field of view calculation
+"""
+
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to, same_instance, is_not
+from pyherc.data import wall_tile
+from pyherc.rules.fov import FOV_CACHE, MAX_FOVS, calculate_fov, get_fov
+from pyherc.rules.los import get_fov_matrix
+from pyherc.test.builders import LevelBuilder
+
+
+class TestFieldOfView():
+    """
+    Tests for field of view calculation
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.level = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        rng = Random(17)
+        builder = LevelBuilder().with_size((30, 20))
+        for _ in range(120):
+            builder = builder.with_wall_at((rng.randint(0, 29),
+                                            rng.randint(0, 19)))
+        self.level = builder.build()
+
+    def test_same_locations_as_recursive_shadowcasting(self):
+        """
+        Visible locations match ones calculated with recursive shadowcasting
+        """
+        for origin in [(5, 5), (15, 10), (0, 0), (29, 19), (12, 3)]:
+            for radius in [1, 3, 7, 12]:
+                expected = [location for location, visible
+                            in get_fov_matrix(origin, self.level,
+                                              radius).items()
+                            if visible]
+                fov = calculate_fov(origin, self.level, radius)
+
+                assert_that(sorted(fov.locations()),
+                            is_(equal_to(sorted(expected))))
+
+    def test_result_is_cached(self):
+        """
+        Repeated queries with unchanged level return cached result
+        """
+        first = get_fov((5, 5), self.level, 5)
+        second = get_fov((5, 5), self.level, 5)
+
+        assert_that(second, is_(same_instance(first)))
+
+    def test_changing_level_invalidates_cache(self):
+        """
+        Changing opacity of level invalidates cached results
+        """
+        first = get_fov((5, 5), self.level, 5)
+        wall_tile(self.level, (6, 5), 11)
+        second = get_fov((5, 5), self.level, 5)
+
+        assert_that(second, is_not(same_instance(first)))
+        assert_that((7, 5) in second, is_(equal_to(False)))
+
+    def test_cache_is_bounded(self):
+        """
+        Only most recently used results are kept in cache
+        """
+        first = get_fov((0, 0), self.level, 3)
+        for loc_x in range(1, MAX_FOVS + 1):
+            get_fov((loc_x % 30, loc_x // 30), self.level, 3)
+            get_fov((0, 0), self.level, 3)
+        get_fov((1, 19), self.level, 3)
+
+        assert_that(len(self.level[FOV_CACHE][1]), is_(equal_to(MAX_FOVS)))
+        assert_that(get_fov((0, 0), self.level, 3), is_(same_instance(first)))
@@ -28,9 +28,11 @@ from hamcrest import (assert_that, is_, equal_to,
                       contains_inanyorder)
 from pyherc.data import (Model, level_size, get_locations_by_tag,
                          add_location_tag, add_location_feature,
-                         location_features)
+                         location_features, add_characters, add_items,
+                         get_characters, get_items, characters_within,
+                         free_locations_by_tag)
 from pyherc.data.features import new_cache, feature_type
-from pyherc.test.builders import LevelBuilder
+from pyherc.test.builders import CharacterBuilder, ItemBuilder, LevelBuilder
 
 class TestLevel:
     """
@@ -100,3 +102,35 @@ class TestLevel:
 
         assert_that(rooms, contains_inanyorder((5, 5), (5, 6),
                                                (8, 8), (9, 8)))
+
+    def test_adding_characters_in_bulk(self):
+        """
+        Characters added in bulk are placed like when added one by one
+        """
+        characters = [CharacterBuilder().build() for _ in range(3)]
+        for location in [(1, 1), (2, 1), (5, 5)]:
+            add_location_tag(self.level, location, 'room')
+
+        add_characters(self.level, list(zip([(1, 1), (2, 1), (5, 5)],
+                                            characters)))
+
+        assert_that(list(get_characters(self.level)),
+                    is_(equal_to(characters)))
+        assert_that(characters_within(self.level, (1, 1), 1),
+                    is_(equal_to(characters[:2])))
+        assert_that(list(get_characters(self.level, (5, 5))),
+                    is_(equal_to(characters[2:])))
+        assert_that(len(free_locations_by_tag(self.level, 'room')),
+                    is_(equal_to(0)))
+
+    def test_adding_items_in_bulk(self):
+        """
+        Items added in bulk can share location
+        """
+        items = [ItemBuilder().build() for _ in range(3)]
+
+        add_items(self.level, list(zip([(1, 1), (1, 1), (3, 2)], items)))
+
+        assert_that(list(get_items(self.level, (1, 1))),
+                    is_(equal_to(items[:2])))
+        assert_that(items[2].location, is_(equal_to((3, 2))))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Tests for caching generated levels
+"""
+import shutil
+import tempfile
+
+from hamcrest import (assert_that, is_, equal_to, contains, is_not, none,
+                      same_instance)
+from pyherc.data import (Model, Portal, add_item, add_portal, floor_tile,
+                         get_characters, get_items, get_portal)
+from pyherc.generators.level import LevelCache
+from pyherc.test.builders import CharacterBuilder, ItemBuilder, LevelBuilder
+
+
+class TestLevelCache():
+    """
+    Tests for caching generated levels
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.path = None
+        self.model = None
+        self.level = None
+        self.cache = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.path = tempfile.mkdtemp()
+        self.model = Model()
+        rat = (CharacterBuilder()
+               .with_model(self.model)
+               .with_name('rat')
+               .with_location((5, 5))
+               .with_item(ItemBuilder().with_name('cheese').build())
+               .build())
+        self.level = (LevelBuilder()
+                      .with_model(self.model)
+                      .with_floor_tile('rock')
+                      .with_character(rat)
+                      .build())
+        add_item(self.level, (3, 3), ItemBuilder().with_name('dagger').build())
+        add_portal(self.level, (1, 1), Portal(('stairs', 'stairs'), 'cave'))
+        self.cache = LevelCache(self.path, self.model, 'digest')
+
+    def teardown(self):
+        """
+        Remove cached files
+        """
+        shutil.rmtree(self.path)
+
+    def test_cached_level_is_returned(self):
+        """
+        Level and states of random number generators are read from cache
+        """
+        key = self.cache.key('cellar', 5)
+        self.cache.put(key, self.level, 'state')
+
+        level, state = self.cache.get(key)
+
+        assert_that(state, is_(equal_to('state')))
+        assert_that(floor_tile(level, (2, 2)), is_(equal_to('rock')))
+        rats = list(get_characters(level))
+        assert_that([(rat.name, rat.location) for rat in rats],
+                    contains(('rat', (5, 5))))
+        assert_that(rats[0].level, is_(same_instance(level)))
+        assert_that([item.name for item in rats[0].inventory],
+                    contains('cheese'))
+        assert_that([item.name for item in get_items(level)],
+                    contains('dagger'))
+        assert_that(get_portal(level, (1, 1)).level_generator_name,
+                    is_(equal_to('cave')))
+
+    def test_missing_level_is_not_found(self):
+        """
+        Cache returns None for levels it does not have
+        """
+        self.cache.put(self.cache.key('cellar', 5), self.level, 'state')
+
+        assert_that(self.cache.get(self.cache.key('cellar', 6)), is_(none()))
+
+    def test_key_depends_on_configuration(self):
+        """
+        Levels generated with different configuration have different keys
+        """
+        other = LevelCache(self.path, self.model, 'other digest')
+
+        assert_that(other.key('cellar', 5),
+                    is_not(equal_to(self.cache.key('cellar', 5))))
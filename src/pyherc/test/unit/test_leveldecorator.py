@@ -33,6 +33,9 @@ from pyherc.generators.level.decorator import (DirectionalWallDecorator,
                                                WallBuilderDecoratorConfig,
                                                WallOrnamentDecorator,
                                                WallOrnamentDecoratorConfig)
+from pyherc.generators.level.decorator.basic import (EAST, NORTH, NORTH_EAST,
+                                                     ORTHOGONAL, SOUTH_WEST,
+                                                     neighbour_masks)
 from pyherc.generators.level.prototiles import (FLOOR_CONSTRUCTED,
                                                 FLOOR_NATURAL, WALL_CONSTRUCTED,
                                                 WALL_NATURAL)
@@ -159,6 +162,51 @@ class TestDirectionalWallDecorator():
         assert_that(wall_tile(self.level, (1, 3)), is_(equal_to('east-north')))
         assert_that(wall_tile(self.level, (3, 3)), is_(equal_to('west-north')))
 
+    def test_single_wall_matches_whole_level(self):
+        """
+        Wall tile calculated for single location matches decorated level
+        """
+        expected = {location: self.decorator.get_wall_tile(self.level,
+                                                           location)
+                    for location, tile in get_tiles(self.level)
+                    if tile['\ufdd0:wall'] == self.wall}
+
+        self.decorator.decorate_level(self.level)
+
+        for location, tile in expected.items():
+            assert_that(wall_tile(self.level, location),
+                        is_(equal_to(tile)))
+
+
+class TestNeighbourMasks():
+    """
+    Tests for calculating neighbour bitmasks
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+
+    def test_neighbours_set_bits(self):
+        """
+        Each neighbour that is a member sets bit of its direction
+        """
+        masks = neighbour_masks({(5, 5), (9, 9)},
+                                {(5, 4), (6, 4), (4, 6), (6, 5), (0, 0)})
+
+        assert_that(masks,
+                    is_(equal_to({(5, 5): NORTH | NORTH_EAST | EAST
+                                  | SOUTH_WEST})))
+
+    def test_directions_can_be_limited(self):
+        """
+        Only given directions are used for masks
+        """
+        masks = neighbour_masks({(5, 5)}, {(5, 4), (6, 4)}, ORTHOGONAL)
+
+        assert_that(masks, is_(equal_to({(5, 5): NORTH})))
+
 class TestDecoratingWallOrnaments():
     """
     Test that walls can be ornamented
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Tests for short term memory
+"""
+from hamcrest import (assert_that, is_, contains, empty, none,
+                      same_instance)
+from pyherc.data import ShortTermMemory
+from pyherc.events import (new_attack_hit_event, new_attack_miss_event,
+                           new_move_event)
+from pyherc.test.builders import CharacterBuilder, LevelBuilder
+
+
+class TestShortTermMemory():
+    """
+    Tests for short term memory
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.character = None
+        self.rat = None
+        self.bat = None
+        self.memory = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        level = LevelBuilder().build()
+        self.character = (CharacterBuilder()
+                          .with_level(level)
+                          .with_location((5, 5))
+                          .build())
+        self.rat = (CharacterBuilder()
+                    .with_level(level)
+                    .with_location((5, 6))
+                    .build())
+        self.bat = (CharacterBuilder()
+                    .with_level(level)
+                    .with_location((6, 6))
+                    .build())
+        self.memory = ShortTermMemory(self.character, capacity=3, duration=10)
+
+    def test_oldest_events_are_forgotten_when_memory_is_full(self):
+        """
+        Memory should not grow over its capacity
+        """
+        moves = [new_move_event(self.rat, (5, 5), None, 1)
+                 for _ in range(5)]
+        for time, move in enumerate(moves):
+            self.memory.remember(move, time)
+
+        assert_that(list(self.memory), contains(*moves[2:]))
+
+    def test_forgotten_events_are_removed_from_indexes(self):
+        """
+        Characters of forgotten events should not be kept in indexes
+        """
+        self.memory.remember(new_move_event(self.rat, (5, 5), None, 1), 0)
+        for time in range(1, 4):
+            self.memory.remember(new_move_event(self.bat, (6, 5), None, 1),
+                                 time)
+
+        assert_that(self.memory.events(character=self.rat), is_(empty()))
+        assert_that(self.memory.by_character.keys(), contains(self.bat))
+
+    def test_old_events_decay(self):
+        """
+        Events older than duration of memory should be forgotten
+        """
+        old = new_move_event(self.rat, (5, 5), None, 1)
+        new = new_move_event(self.bat, (6, 5), None, 1)
+        self.memory.remember(old, 0)
+        self.memory.remember(new, 11)
+
+        assert_that(list(self.memory), contains(new))
+
+    def test_events_can_be_found_by_type_and_character(self):
+        """
+        Events should be found by type and character involved
+        """
+        move = new_move_event(self.rat, (5, 5), None, 1)
+        attack = new_attack_hit_event('melee', self.rat, self.character, 1)
+        self.memory.remember(move, 0)
+        self.memory.remember(attack, 1)
+        self.memory.remember(new_move_event(self.bat, (6, 5), None, 1), 2)
+
+        assert_that(self.memory.events(character=self.rat),
+                    contains(attack, move))
+        assert_that(self.memory.events('move', self.rat), contains(move))
+        assert_that(self.memory.latest('attack hit'),
+                    is_(same_instance(attack)))
+        assert_that(self.memory.latest('notice'), is_(none()))
+
+    def test_recent_attackers_are_found(self):
+        """
+        Characters attacking owner of memory recently should be found
+        """
+        self.memory.remember(new_attack_hit_event('melee', self.bat,
+                                                  self.character, 1), 0)
+        self.memory.remember(new_attack_miss_event('melee', self.rat,
+                                                   self.character), 5)
+        self.memory.remember(new_attack_hit_event('melee', self.character,
+                                                  self.rat, 1), 6)
+
+        assert_that(self.memory.attackers(), contains(self.rat, self.bat))
+        assert_that(self.memory.attackers(since=3), contains(self.rat))
+
+    def test_character_remembers_events_with_time_of_model(self):
+        """
+        Character should remember events it receives
+        """
+        self.character.model.time = 7
+        move = new_move_event(self.rat, (5, 5), None, 1)
+
+        self.character.receive_event(move)
+
+        assert_that(self.character.short_term_memory.events(since=7),
+                    contains(move))
@@ -24,11 +24,14 @@
 Module for testing Model
 """
 #pylint: disable=W0614
-from hamcrest import assert_that  # pylint: disable-msg=E0611
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to  # pylint: disable-msg=E0611
 from mockito import mock, verify
-from pyherc.data import Model
+from pyherc.data import (Model, add_character, get_characters,
+                         remove_character)
 from pyherc.events import new_move_event
-from pyherc.test.builders import CharacterBuilder, LevelBuilder
+from pyherc.test.builders import CharacterBuilder, EffectBuilder, LevelBuilder
 from pyherc.test.matchers import has_event_listener
 
 
@@ -76,3 +79,160 @@ class TestModel():
         self.model.raise_event(event)
 
         verify(self.listener).receive_event(event)
+
+
+def next_creature_one_tick_at_time(model):
+    """
+    Find next creature by advancing time one unit at a time
+
+    This is how turn order was originally determined and is used as
+    reference for the scheduler in Model
+    """
+    creatures = list(get_characters(model.player.level))
+
+    while 1:
+        for creature in creatures:
+            if creature.tick <= 0:
+                return creature
+
+        for creature in creatures:
+            creature.tick = creature.tick - 1
+            for effect in creature.get_effects():
+                if effect.tick is not None:
+                    effect.tick = effect.tick - 1
+                    if effect.tick <= 0:
+                        effect.trigger()
+            creature.remove_expired_effects()
+            for skill, limit in creature.cooldowns.items():
+                if limit > 0:
+                    creature.cooldowns[skill] = limit - 1
+
+
+class TestTurnOrder():
+    """
+    Regression tests for order of turns
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+
+    def build_world(self, seed):
+        """
+        Build model with creatures having various ticks, effects and
+        cooldowns
+        """
+        rng = Random(seed)
+        model = Model()
+        level = LevelBuilder().with_model(model).build()
+
+        for index in range(8):
+            tick = rng.choice([0, 1, 3, 7, 2.5, 12, 40])
+            builder = (CharacterBuilder()
+                       .with_model(model)
+                       .with_name('creature {0}'.format(index))
+                       .with_tick(tick))
+            for _ in range(rng.randint(0, 2)):
+                frequency = rng.choice([1, 3, 5, 10])
+                builder = builder.with_effect(
+                    EffectBuilder()
+                    .with_duration(frequency * rng.randint(1, 5))
+                    .with_frequency(frequency)
+                    .with_tick(rng.choice([frequency, 1, 2.5])))
+            creature = builder.build()
+            creature.cooldowns['skill'] = rng.choice([0, 4, 9.5, 30])
+            add_character(level, (index, 0), creature)
+
+        model.player = list(get_characters(level))[0]
+        return model
+
+    def play(self, model, next_creature, seed):
+        """
+        Play a number of turns and record what happened
+        """
+        rng = Random(seed)
+        turns = []
+        for _ in range(200):
+            creature = next_creature(model)
+            turns.append((creature.name,
+                          creature.tick,
+                          creature.cooldowns['skill'],
+                          [(effect.tick, effect.duration)
+                           for effect in creature.get_effects()]))
+            creature.tick = creature.tick + rng.choice([1, 2, 4, 8, 2.5, 16])
+        return turns
+
+    def test_order_is_same_as_advancing_one_tick_at_time(self):
+        """
+        Test that scheduler produces same order of turns as advancing
+        time one tick at a time
+        """
+        for seed in range(10):
+            expected = self.play(self.build_world(seed),
+                                 next_creature_one_tick_at_time,
+                                 seed)
+            turns = self.play(self.build_world(seed),
+                              lambda model: model.get_next_creature(None),
+                              seed)
+
+            assert_that(turns, is_(equal_to(expected)))
+
+    def give_brains(self, model, seed, log):
+        """
+        Give creatures other than player simple AI that records its turns
+
+        Some turns remove an other creature from the level or add a new one
+        """
+        rng = Random(seed)
+        level = model.player.level
+
+        def brain(creature):
+            def act():
+                log.append((creature.name, creature.tick))
+                creature.tick = creature.tick + rng.choice([1, 2, 4, 2.5, 16])
+                roll = rng.random()
+                others = [x for x in get_characters(level)
+                          if x is not creature and x is not model.player]
+                if roll < 0.05 and others:
+                    remove_character(level, rng.choice(others))
+                elif roll < 0.1:
+                    spawn = (CharacterBuilder()
+                             .with_model(model)
+                             .with_name('spawn {0}'.format(len(log)))
+                             .with_tick(rng.choice([0, 3, 5]))
+                             .build())
+                    spawn.artificial_intelligence = brain(spawn)
+                    add_character(level, (len(log), 1), spawn)
+            return act
+
+        for creature in get_characters(level):
+            if creature is not model.player:
+                creature.artificial_intelligence = brain(creature)
+
+    def test_batched_npc_phase_is_same_as_one_at_time(self):
+        """
+        Test that processing characters in a batch produces same turns as
+        finding next character after every action
+        """
+        for seed in range(10):
+            model = self.build_world(seed)
+            expected = []
+            self.give_brains(model, seed, expected)
+            for _ in range(30):
+                creature = model.get_next_creature(None)
+                while creature is not model.player:
+                    creature.act()
+                    creature = model.get_next_creature(None)
+                expected.append('player')
+                creature.tick = creature.tick + 3
+
+            model = self.build_world(seed)
+            turns = []
+            self.give_brains(model, seed, turns)
+            for _ in range(30):
+                creature = model.process_npcs(None)
+                turns.append('player')
+                creature.tick = creature.tick + 3
+
+            assert_that(turns, is_(equal_to(expected)))
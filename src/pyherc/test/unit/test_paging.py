@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+"""
+Tests for paging levels to disk
+"""
+import os
+import shutil
+import tempfile
+
+from hamcrest import (assert_that, is_, equal_to, contains, same_instance,
+                      empty, calling, raises)
+from pyherc.data import (Model, Portal, add_item, add_portal, floor_tile,
+                         get_characters, get_items, get_portal)
+from pyherc.data.paging import LevelPager, is_paged_out
+from pyherc.data.savegame import SaveGame
+from pyherc.test.builders import CharacterBuilder, ItemBuilder, LevelBuilder
+
+
+class TestLevelPager():
+    """
+    Tests for paging levels to disk
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.path = None
+        self.model = None
+        self.level = None
+        self.other_level = None
+        self.pager = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.path = tempfile.mkdtemp()
+        self.model = Model()
+        self.model.player = (CharacterBuilder()
+                             .with_model(self.model)
+                             .with_name('player')
+                             .with_location((2, 2))
+                             .as_player_character()
+                             .build())
+        rat = (CharacterBuilder()
+               .with_model(self.model)
+               .with_name('rat')
+               .with_location((5, 5))
+               .with_item(ItemBuilder().with_name('cheese').build())
+               .build())
+        self.level = (LevelBuilder()
+                      .with_model(self.model)
+                      .with_floor_tile('floor')
+                      .with_character(self.model.player)
+                      .build())
+        self.other_level = (LevelBuilder()
+                            .with_model(self.model)
+                            .with_floor_tile('rock')
+                            .with_character(rat)
+                            .build())
+        add_item(self.other_level, (3, 3),
+                 ItemBuilder().with_name('dagger').build())
+        add_portal(self.level, (8, 8), Portal(('stairs', 'stairs'), None),
+                   Portal(('stairs', 'stairs'), None))
+        add_portal(self.other_level, (1, 1), get_portal(self.level, (8, 8))
+                   .linked_portal())
+        self.pager = LevelPager(self.model, keep=0, path=self.path)
+
+    def teardown(self):
+        """
+        Remove cache files
+        """
+        shutil.rmtree(self.path)
+
+    def test_paged_out_level_is_cleared(self):
+        """
+        Paging out level clears it, but keeps its name
+        """
+        self.other_level['\ufdd0:name'] = 'cellar'
+
+        self.pager.page_out(self.other_level)
+
+        assert_that(is_paged_out(self.other_level), is_(equal_to(True)))
+        assert_that(self.other_level['\ufdd0:name'], is_(equal_to('cellar')))
+        assert_that('\ufdd0:characters' in self.other_level,
+                    is_(equal_to(False)))
+
+    def test_level_is_restored_when_paged_in(self):
+        """
+        Tiles, characters, items and portals are restored when paging in
+        """
+        self.pager.page_out(self.other_level)
+
+        self.pager.page_in(self.other_level)
+
+        assert_that(is_paged_out(self.other_level), is_(equal_to(False)))
+        assert_that(floor_tile(self.other_level, (2, 2)),
+                    is_(equal_to('rock')))
+        rats = list(get_characters(self.other_level))
+        assert_that([(rat.name, rat.location) for rat in rats],
+                    contains(('rat', (5, 5))))
+        assert_that([item.name for item in rats[0].inventory],
+                    contains('cheese'))
+        assert_that([item.name for item in get_items(self.other_level)],
+                    contains('dagger'))
+        assert_that(get_portal(self.other_level, (1, 1)).linked_portal(),
+                    is_(same_instance(get_portal(self.level, (8, 8)))))
+        assert_that(os.listdir(self.path), is_(empty()))
+
+    def test_levels_not_visited_recently_are_paged_out(self):
+        """
+        Levels other than current, its neighbours and recent ones are paged out
+        """
+        remote_level = (LevelBuilder()
+                        .with_model(self.model)
+                        .build())
+        self.pager.page_in(remote_level)
+
+        self.pager.page_in(self.other_level)
+
+        assert_that(is_paged_out(remote_level), is_(equal_to(True)))
+        assert_that(is_paged_out(self.level), is_(equal_to(False)))
+        assert_that(is_paged_out(self.other_level), is_(equal_to(False)))
+
+    def test_entities_still_referred_to_are_reused(self):
+        """
+        Character that is still referred to is filled again when paging in
+        """
+        rat = list(get_characters(self.other_level))[0]
+        self.pager.page_out(self.other_level)
+
+        self.pager.page_in(self.other_level)
+
+        assert_that(list(get_characters(self.other_level))[0],
+                    is_(same_instance(rat)))
+        assert_that(rat.location, is_(equal_to((5, 5))))
+
+    def test_game_can_be_saved_while_levels_are_paged_out(self):
+        """
+        Paged out levels are read back in when saving game
+        """
+        save_path = os.path.join(self.path, 'save')
+        self.pager.page_out(self.other_level)
+
+        SaveGame(save_path, self.pager).save(self.model)
+
+        player = SaveGame(save_path).load(Model())
+        other_end = get_portal(player.level, (8, 8)).linked_portal()
+        assert_that([rat.name for rat in get_characters(other_end.level)],
+                    contains('rat'))
+        assert_that([item.name for item in get_items(other_end.level)],
+                    contains('dagger'))
+
+    def test_saving_without_pager_is_rejected(self):
+        """
+        Saving game with paged out levels requires pager
+        """
+        self.pager.page_out(self.other_level)
+
+        assert_that(calling(SaveGame(os.path.join(self.path, 'save')).save)
+                    .with_args(self.model),
+                    raises(ValueError))
@@ -25,11 +25,12 @@ tests for path finding
 """
 from random import Random
 
-from hamcrest import assert_that, contains, is_
+from hamcrest import assert_that, contains, is_, equal_to
 from mockito import mock
-from pyherc.ai import a_star
+from pyherc.ai import a_star, jump_point_search
 from pyherc.config.dsl import LevelContext
-from pyherc.data import Portal, Model, find_free_space, wall_tile
+from pyherc.data import (Portal, Model, find_free_space, wall_tile,
+                         blocks_movement, area_4_around)
 from pyherc.data.geometry import free_locations_around
 from pyherc.generators.level.partitioners import grid_partitioning
 from pyherc.generators.level.portal import PortalAdder
@@ -96,3 +97,73 @@ class TestAStar():
         assert_that(path, is_(continuous_path(start = (10, 10),
                                               destination = (15, 10),
                                               level = level)))
+
+    def test_no_path_through_walls(self):
+        """
+        Test that empty path is returned when goal can not be reached
+        """
+        level = (LevelBuilder()
+                    .with_floor_tile(FLOOR_TILE)
+                    .with_wall_tile(EMPTY_TILE)
+                    .with_solid_wall_tile(WALL_TILE)
+                    .with_wall_at((3, 0))
+                    .with_wall_at((3, 1))
+                    .with_wall_at((3, 2))
+                    .with_size((10, 3))
+                    .build())
+
+        path, connections, updated = a_star(passable_neighbours,
+                                            (1, 1), (6, 1), level)
+
+        assert_that(path, is_(equal_to([])))
+
+
+def passable_neighbours(level, location):
+    """
+    Passable locations in cardinal directions
+    """
+    return [node for node in area_4_around(location)
+            if not blocks_movement(level, node)]
+
+
+class TestJumpPointSearch():
+    """
+    Tests for jump point search
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+
+    def test_paths_are_as_short_as_with_a_star(self):
+        """
+        Test that jump point search finds as short paths as A*
+        """
+        rng = Random(5)
+        builder = (LevelBuilder()
+                   .with_floor_tile(FLOOR_TILE)
+                   .with_wall_tile(EMPTY_TILE)
+                   .with_solid_wall_tile(WALL_TILE)
+                   .with_size((40, 20)))
+        for _ in range(250):
+            builder = builder.with_wall_at((rng.randint(0, 39),
+                                            rng.randint(0, 19)))
+        level = builder.build()
+        free = [(x, y) for x in range(40) for y in range(20)
+                if not blocks_movement(level, (x, y))]
+
+        for _ in range(50):
+            start = rng.choice(free)
+            goal = rng.choice(free)
+            expected = a_star(passable_neighbours, start, goal, level)[0]
+            path = jump_point_search(start, goal, level)[0]
+
+            assert_that(len(path), is_(equal_to(len(expected))))
+            if path:
+                assert_that(path, is_(continuous_path(start=start,
+                                                      destination=goal,
+                                                      level=level)))
+                assert_that(any(blocks_movement(level, node)
+                                for node in path),
+                            is_(equal_to(False)))
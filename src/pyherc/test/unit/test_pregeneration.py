@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Tests for generating levels ahead of time
+"""
+import random
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to
+from pyherc.data import Portal
+from pyherc.generators.level import LevelPregenerator
+
+
+class TestLevelPregenerator():
+    """
+    Tests for generating levels behind portals
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.rng = None
+        self.generated = None
+        self.pregenerator = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.rng = Random(5)
+        self.generated = []
+        self.pregenerator = LevelPregenerator(self.generate, self.rng)
+
+    def generate(self, level_type, portal):
+        """
+        Level generator recording what it generated
+        """
+        level = (level_type, self.rng.random(), random.random())
+        self.generated.append(level)
+        return level
+
+    def portal(self, level, name):
+        """
+        Create portal leading to given type of level
+        """
+        portal = Portal((None, None), name)
+        portal.level = level
+        return portal
+
+    def test_pending_levels_are_generated_for_given_level(self):
+        """
+        Only levels behind portals of given level are generated
+        """
+        first = self.portal('here', 'crypt')
+        self.pregenerator.schedule(first)
+        self.pregenerator.schedule(self.portal('elsewhere', 'cave'))
+
+        generated = self.pregenerator.run_pending('here')
+
+        assert_that(generated, is_(equal_to(1)))
+        assert_that(self.generated[0][0], is_(equal_to('crypt')))
+        assert_that(self.pregenerator.has_pending('here'), is_(equal_to(False)))
+        assert_that(self.pregenerator.has_pending(), is_(equal_to(True)))
+
+    def test_level_is_same_when_generated_on_demand(self):
+        """
+        Level and rest of the random number sequence do not depend on when
+        level is generated
+        """
+        portal = self.portal('here', 'crypt')
+        self.pregenerator.schedule(portal)
+        state = self.rng.getstate()
+        self.pregenerator.run_pending()
+        early = self.generated[0]
+
+        assert_that(self.rng.getstate(), is_(equal_to(state)))
+
+        self.setup()
+        portal = self.portal('here', 'crypt')
+        self.pregenerator.schedule(portal)
+        self.rng.random()
+        self.pregenerator('crypt', portal)
+
+        assert_that(self.generated[0], is_(equal_to(early)))
+        assert_that(self.pregenerator.has_pending(), is_(equal_to(False)))
+
+    def test_exits_are_not_scheduled(self):
+        """
+        Portals leading out of the dungeon do not have levels behind them
+        """
+        portal = self.portal('here', None)
+        portal.exits_dungeon = True
+        self.pregenerator.schedule(portal)
+
+        assert_that(self.pregenerator.has_pending(), is_(equal_to(False)))
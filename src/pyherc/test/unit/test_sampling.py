@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Tests for weighted sampling tables
+"""
+from collections import Counter
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to, close_to, none
+from pyherc.sampling import AliasTable, CumulativeTable
+
+
+def linear_scan(items, weights, rng):
+    """
+    Reference implementation of weighted draw with running totals
+    """
+    score = rng.randint(1, sum(weights))
+    current = 0
+    for item, weight in zip(items, weights):
+        current = current + weight
+        if current >= score:
+            return item
+
+
+class TestCumulativeTable():
+    """
+    Tests for cumulative weight table
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+
+    def test_draws_match_linear_scan(self):
+        """
+        Table draws same items as scanning running totals with same seed
+        """
+        items = ['dagger', 'sword', 'axe', 'club', 'spear']
+        weights = [1024, 16, 256, 1, 64]
+        table = CumulativeTable(items, weights)
+        rng = Random(7)
+        reference = Random(7)
+
+        for _ in range(1000):
+            assert_that(table.draw(rng),
+                        is_(equal_to(linear_scan(items, weights, reference))))
+
+    def test_empty_table_draws_nothing(self):
+        """
+        Drawing from empty table returns None
+        """
+        assert_that(CumulativeTable([], []).draw(Random(1)), is_(none()))
+
+
+class TestAliasTable():
+    """
+    Tests for alias method table
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+
+    def test_items_are_drawn_according_to_weights(self):
+        """
+        Items are drawn in proportion to their weights
+        """
+        table = AliasTable(['a', 'b', 'c', 'd'], [1, 0, 3, 4])
+        rng = Random(3)
+        counts = Counter(table.draw(rng) for _ in range(80000))
+
+        assert_that(counts['b'], is_(equal_to(0)))
+        assert_that(counts['a'] / 80000, is_(close_to(1 / 8, 0.01)))
+        assert_that(counts['c'] / 80000, is_(close_to(3 / 8, 0.01)))
+        assert_that(counts['d'] / 80000, is_(close_to(4 / 8, 0.01)))
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Tests for saving and loading games
+"""
+import os
+import shutil
+import tempfile
+
+from hamcrest import (assert_that, is_, equal_to, contains, same_instance,
+                      calling, raises)
+from pyherc.data import (Model, Portal, add_item, add_location_tag,
+                         add_portal, floor_tile, get_characters, get_items,
+                         get_location_tags, get_portal, mark_activity,
+                         ornamentation, remove_item, wall_tile)
+from pyherc.data.savegame import INDEX_FILE, SaveGame, level_file
+from pyherc.test.builders import CharacterBuilder, ItemBuilder, LevelBuilder
+
+
+class TestSaveGame():
+    """
+    Tests for saving and loading games
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.path = None
+        self.model = None
+        self.level = None
+        self.other_level = None
+        self.player = None
+        self.rat = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.path = tempfile.mkdtemp()
+        self.model = Model()
+        self.player = (CharacterBuilder()
+                       .with_model(self.model)
+                       .with_name('player')
+                       .with_hit_points(7)
+                       .with_location((2, 2))
+                       .with_item(ItemBuilder().with_name('apple').build())
+                       .as_player_character()
+                       .build())
+        self.rat = (CharacterBuilder()
+                    .with_model(self.model)
+                    .with_name('rat')
+                    .with_location((5, 5))
+                    .build())
+        self.level = (LevelBuilder()
+                      .with_model(self.model)
+                      .with_floor_tile('floor')
+                      .with_wall_at((1, 4))
+                      .with_character(self.player)
+                      .with_character(self.rat)
+                      .build())
+        self.other_level = (LevelBuilder()
+                            .with_model(self.model)
+                            .with_floor_tile('rock')
+                            .build())
+        add_item(self.level, (3, 3), ItemBuilder().with_name('dagger').build())
+        ornamentation(self.level, (1, 4), 'torch')
+        add_location_tag(self.level, (3, 3), 'room')
+        add_portal(self.level, (8, 8), Portal(('stairs', 'stairs'), None),
+                   Portal(('stairs', 'stairs'), None))
+        add_portal(self.other_level, (1, 1), get_portal(self.level, (8, 8))
+                   .linked_portal())
+
+    def teardown(self):
+        """
+        Remove saved files
+        """
+        shutil.rmtree(self.path)
+
+    def load(self):
+        """
+        Load saved game into a new model
+
+        :returns: loaded player
+        :rtype: Character
+        """
+        return SaveGame(self.path).load(Model())
+
+    def test_tiles_are_restored(self):
+        """
+        Floors, walls, ornamentation and tags are restored
+        """
+        SaveGame(self.path).save(self.model)
+
+        level = self.load().level
+
+        assert_that(floor_tile(level, (2, 2)), is_(equal_to('floor')))
+        assert_that(wall_tile(level, (1, 4)), is_(equal_to(11)))
+        assert_that(ornamentation(level, (1, 4)), is_(equal_to(['torch'])))
+        assert_that(list(get_location_tags(level, (3, 3))),
+                    is_(equal_to(['room'])))
+
+    def test_characters_and_items_are_restored(self):
+        """
+        Characters, items and inventories are restored in original order
+        """
+        SaveGame(self.path).save(self.model)
+
+        player = self.load()
+        level = player.level
+
+        assert_that([(character.name, character.location)
+                     for character in get_characters(level)],
+                    contains(('player', (2, 2)), ('rat', (5, 5))))
+        assert_that(player.hit_points, is_(equal_to(7)))
+        assert_that([item.name for item in get_items(level)],
+                    contains('dagger'))
+        assert_that([item.name for item in player.inventory],
+                    contains('apple'))
+
+    def test_portals_link_levels(self):
+        """
+        Portals are restored and linked to levels behind them
+        """
+        SaveGame(self.path).save(self.model)
+
+        level = self.load().level
+        portal = get_portal(level, (8, 8))
+        other_end = portal.linked_portal()
+
+        assert_that(other_end.linked_portal(), is_(same_instance(portal)))
+        assert_that(floor_tile(other_end.level, (0, 0)),
+                    is_(equal_to('rock')))
+
+    def test_only_changed_levels_are_written_again(self):
+        """
+        Level is not written again if it hasn't changed since previous save
+        """
+        save_game = SaveGame(self.path)
+        save_game.save(self.model)
+
+        written = save_game.save(self.model)
+
+        assert_that(written,
+                    contains(INDEX_FILE,
+                             level_file(save_game.identify(self.level))))
+
+    def test_levels_where_characters_acted_are_written_again(self):
+        """
+        Level is written again if characters have acted in it
+        """
+        save_game = SaveGame(self.path)
+        save_game.save(self.model)
+        mark_activity(self.other_level)
+
+        written = save_game.save(self.model)
+
+        assert_that(written,
+                    contains(INDEX_FILE,
+                             level_file(save_game.identify(self.level)),
+                             level_file(save_game.identify(self.other_level))))
+
+    def test_removed_items_are_forgotten(self):
+        """
+        Items that are no longer in the game are forgotten when saving
+        """
+        save_game = SaveGame(self.path)
+        save_game.save(self.model)
+        dagger = list(get_items(self.level))[0]
+        remove_item(self.level, dagger)
+
+        save_game.save(self.model)
+
+        assert_that(id(dagger) in save_game.ids, is_(equal_to(False)))
+        assert_that(id(self.player) in save_game.ids, is_(equal_to(True)))
+
+    def test_loaded_game_can_be_saved_incrementally(self):
+        """
+        Game loaded from save can be saved again without rewriting levels
+        """
+        SaveGame(self.path).save(self.model)
+        save_game = SaveGame(self.path)
+        model = Model()
+        save_game.load(model)
+
+        written = save_game.save(model)
+
+        assert_that(written, contains(INDEX_FILE,
+                                      level_file(save_game.identify(
+                                          model.player.level))))
+        assert_that(self.load().name, is_(equal_to('player')))
+
+    def test_other_files_are_rejected(self):
+        """
+        Loading a file that is not a save file raises an error
+        """
+        with open(os.path.join(self.path, INDEX_FILE), 'wb') as index:
+            index.write(b'not a saved game')
+
+        assert_that(calling(self.load), raises(ValueError))
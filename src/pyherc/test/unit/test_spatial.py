@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Tests for spatial index
+"""
+
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to, contains, is_not, is_in
+from pyherc.data import (new_level, add_character, move_character,
+                         remove_character, characters_within, get_characters)
+from pyherc.data.spatial import SpatialIndex
+from pyherc.test.builders import CharacterBuilder
+
+
+class TestSpatialIndex():
+    """
+    Tests for bucketed spatial index
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.index = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.index = SpatialIndex(bucket_size=4)
+
+    def test_iteration_keeps_insertion_order(self):
+        """
+        Things are iterated in order they were added or last moved
+        """
+        self.index.add('a', (10, 10))
+        self.index.add('b', (-3, 2))
+        self.index.add('c', (0, 0))
+        self.index.move('a', (-20, 3))
+        self.index.remove('b')
+
+        assert_that(list(self.index), contains('c', 'a'))
+        assert_that(len(self.index), is_(equal_to(2)))
+        assert_that('b', is_not(is_in(self.index)))
+
+    def test_cached_query_is_refreshed_after_move(self):
+        """
+        Results of radius query are not reused after something moves
+        """
+        self.index.add('a', (1, 1))
+        self.index.add('b', (9, 9))
+        first = self.index.within_radius((0, 0), 3)
+        self.index.move('b', (2, 0))
+
+        assert_that(first, contains('a'))
+        assert_that(self.index.within_radius((0, 0), 3), contains('a', 'b'))
+
+    def test_removing_missing_thing_is_error(self):
+        """
+        Removing thing that is not in index raises ValueError like lists do
+        """
+        try:
+            self.index.remove('a')
+            raised = False
+        except ValueError:
+            raised = True
+
+        assert_that(raised, is_(equal_to(True)))
+
+    def test_queries_match_brute_force(self):
+        """
+        Radius and rectangle queries find same things as checking everything
+        """
+        rng = Random(8)
+        things = {}
+        for thing in range(200):
+            location = (rng.randint(-30, 30), rng.randint(-30, 30))
+            things[thing] = location
+            self.index.add(thing, location)
+        for thing in range(0, 200, 3):
+            location = (rng.randint(-30, 30), rng.randint(-30, 30))
+            things[thing] = location
+            self.index.move(thing, location)
+        order = ([thing for thing in range(200) if thing % 3]
+                 + list(range(0, 200, 3)))
+
+        for _ in range(50):
+            cx, cy = rng.randint(-35, 35), rng.randint(-35, 35)
+            radius = rng.choice([0, 1, 2.5, 7, 15])
+            expected = [thing for thing in order
+                        if ((things[thing][0] - cx) ** 2 +
+                            (things[thing][1] - cy) ** 2 <= radius ** 2)]
+            assert_that(self.index.within_radius((cx, cy), radius),
+                        is_(equal_to(expected)))
+
+            x1, y1 = cx + rng.randint(0, 12), cy + rng.randint(0, 12)
+            expected = [thing for thing in order
+                        if (cx <= things[thing][0] <= x1 and
+                            cy <= things[thing][1] <= y1)]
+            assert_that(self.index.within_rect(cx, cy, x1, y1),
+                        is_(equal_to(expected)))
+
+    def test_prepared_queries_match_fresh_queries(self):
+        """
+        Prepared results are used only while they are still valid
+        """
+        rng = Random(5)
+        fresh = SpatialIndex(bucket_size=4)
+        for thing in range(100):
+            location = (rng.randint(-20, 20), rng.randint(-20, 20))
+            self.index.add(thing, location)
+            fresh.add(thing, location)
+        queries = [((rng.randint(-20, 20), rng.randint(-20, 20)),
+                    rng.choice([1, 2, 4, 6])) for _ in range(30)]
+        self.index.prepare(queries)
+
+        for turn in range(100):
+            thing = rng.randint(0, 99)
+            location = (rng.randint(-20, 20), rng.randint(-20, 20))
+            if turn % 10 == 0 and thing in self.index:
+                self.index.remove(thing)
+                fresh.remove(thing)
+            else:
+                self.index.add(thing, location)
+                fresh.add(thing, location)
+
+            for location, radius in queries:
+                assert_that(self.index.within_radius(location, radius),
+                            is_(equal_to(fresh.within_radius(location,
+                                                             radius))))
+
+    def test_prepared_query_is_kept_when_change_is_far(self):
+        """
+        Prepared result is kept when nothing changes within its radius
+        """
+        self.index.add('a', (1, 1))
+        self.index.add('b', (20, 20))
+        self.index.prepare([((0, 0), 3)])
+        self.index.move('b', (21, 20))
+
+        assert_that(list(self.index.prepared), contains(((0, 0), 3)))
+        self.index.move('b', (2, 2))
+        assert_that(list(self.index.prepared), is_(equal_to([])))
+        assert_that(self.index.within_radius((0, 0), 3), contains('a', 'b'))
+
+
+class TestLevelCharacterIndex():
+    """
+    Tests that level keeps its character index up to date
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.level = None
+        self.character = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.level = new_level(None)
+        self.character = CharacterBuilder().build()
+        add_character(self.level, (2, 2), self.character)
+
+    def test_moved_character_is_found_in_new_location(self):
+        """
+        Moving character updates radius queries
+        """
+        move_character(self.level, (40, 40), self.character)
+
+        assert_that(characters_within(self.level, (2, 2), 5),
+                    is_(equal_to([])))
+        assert_that(characters_within(self.level, (41, 40), 1),
+                    contains(self.character))
+
+    def test_removed_character_is_not_found(self):
+        """
+        Removing character removes it from radius queries
+        """
+        remove_character(self.level, self.character)
+
+        assert_that(characters_within(self.level, (2, 2), 5),
+                    is_(equal_to([])))
+
+    def test_moved_character_acts_last(self):
+        """
+        Moved character is placed last in characters of level
+        """
+        other = CharacterBuilder().build()
+        add_character(self.level, (3, 3), other)
+
+        move_character(self.level, (2, 3), self.character)
+
+        assert_that(list(get_characters(self.level)),
+                    contains(other, self.character))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+"""
+Tests for location tag index
+"""
+from random import Random
+
+from hamcrest import assert_that, is_, equal_to, contains_inanyorder
+from pyherc.data import (new_level, floor_tile, wall_tile, add_location_tag,
+                         get_locations_by_tag, free_locations_by_tag,
+                         add_character, move_character, remove_character)
+from pyherc.data.tagindex import LocationSet
+from pyherc.test.builders import CharacterBuilder
+
+
+class TestLocationSet():
+    """
+    Tests for set of locations
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+
+    def test_removing_keeps_rest_of_locations(self):
+        """
+        Removing location from middle of the set keeps other locations
+        """
+        locations = LocationSet()
+        for index in range(5):
+            locations.add((index, 0))
+        locations.discard((1, 0))
+        locations.discard((4, 0))
+        locations.discard((9, 9))
+
+        assert_that(list(locations),
+                    contains_inanyorder((0, 0), (2, 0), (3, 0)))
+        assert_that(locations.choice(Random(1)) in locations,
+                    is_(equal_to(True)))
+
+
+class TestFreeLocationsByTag():
+    """
+    Tests that free locations are tracked as level changes
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.level = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.level = new_level(None)
+        for loc_x in range(3):
+            floor_tile(self.level, (loc_x, 0), 'floor')
+            add_location_tag(self.level, (loc_x, 0), 'room')
+        add_location_tag(self.level, (1, 0), 'corridor')
+
+    def test_tagged_locations_are_found(self):
+        """
+        Locations can be found by their tags
+        """
+        assert_that(list(get_locations_by_tag(self.level, 'room')),
+                    contains_inanyorder((0, 0), (1, 0), (2, 0)))
+        assert_that(list(get_locations_by_tag(self.level, 'corridor')),
+                    contains_inanyorder((1, 0)))
+
+    def test_characters_occupy_locations(self):
+        """
+        Locations with characters are not free
+        """
+        character = CharacterBuilder().build()
+        add_character(self.level, (0, 0), character)
+        move_character(self.level, (1, 0), character)
+
+        assert_that(list(free_locations_by_tag(self.level, 'room')),
+                    contains_inanyorder((0, 0), (2, 0)))
+        assert_that(len(free_locations_by_tag(self.level, 'corridor')),
+                    is_(equal_to(0)))
+
+        remove_character(self.level, character)
+
+        assert_that(len(free_locations_by_tag(self.level, 'corridor')),
+                    is_(equal_to(1)))
+
+    def test_walls_are_not_free(self):
+        """
+        Building a wall removes location from free locations
+        """
+        wall_tile(self.level, (2, 0), 'wall')
+
+        assert_that(list(free_locations_by_tag(self.level, 'room')),
+                    contains_inanyorder((0, 0), (1, 0)))
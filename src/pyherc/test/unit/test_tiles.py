@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2010-2017 Tuukka Turto
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""
+Tests for tile storage engines
+"""
+
+from hamcrest import assert_that, is_, equal_to, contains_inanyorder
+from pyherc.data.tiles import TileGrid, TileDict, ITEMS, FLOOR
+
+
+class TestTileGrid():
+    """
+    Tests for array backed tile storage
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.tiles = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.tiles = TileGrid()
+
+    def test_storing_floor(self):
+        """
+        Floor stored into grid can be read back
+        """
+        self.tiles.set_floor((3, 2), 'ground')
+
+        assert_that(self.tiles.floor((3, 2)), is_(equal_to('ground')))
+
+    def test_grid_grows_to_negative_coordinates(self):
+        """
+        Grid can grow to any direction without losing data
+        """
+        self.tiles.set_floor((2, 2), 'ground')
+        self.tiles.set_wall((-5, -7), 'rock')
+        self.tiles.set_floor((40, 30), 'sand')
+
+        assert_that(self.tiles.floor((2, 2)), is_(equal_to('ground')))
+        assert_that(self.tiles.wall((-5, -7)), is_(equal_to('rock')))
+        assert_that(self.tiles.bounds(), is_(equal_to((-5, 40, -7, 30))))
+        assert_that(len(self.tiles), is_(equal_to(3)))
+
+    def test_walls_block_movement_and_los(self):
+        """
+        Walls block both movement and line of sight
+        """
+        self.tiles.set_floor((1, 1), 'ground')
+        self.tiles.set_wall((2, 1), 'rock')
+
+        assert_that(self.tiles.blocks_movement((1, 1)), is_(equal_to(False)))
+        assert_that(self.tiles.blocks_los((1, 1)), is_(equal_to(False)))
+        assert_that(self.tiles.blocks_movement((2, 1)), is_(equal_to(True)))
+        assert_that(self.tiles.blocks_los((2, 1)), is_(equal_to(True)))
+
+    def test_outside_of_level_blocks_movement(self):
+        """
+        Locations outside of level block movement, but not line of sight
+        """
+        assert_that(self.tiles.blocks_movement((50, 50)), is_(equal_to(True)))
+        assert_that(self.tiles.blocks_los((50, 50)), is_(equal_to(False)))
+
+    def test_contents_can_be_added_and_removed(self):
+        """
+        Items can be added and removed from tiles
+        """
+        self.tiles.add_content((1, 1), ITEMS, 'dagger')
+        self.tiles.add_content((1, 1), ITEMS, 'sword')
+        self.tiles.remove_content((1, 1), ITEMS, 'dagger')
+
+        assert_that(self.tiles.contents((1, 1), ITEMS),
+                    contains_inanyorder('sword'))
+
+    def test_unhashable_tile_ids(self):
+        """
+        Lists of tile alternatives can be used as tile ids
+        """
+        self.tiles.set_floor((1, 1), ['a', 'b'])
+        self.tiles.set_floor((2, 1), ['a', 'b'])
+
+        assert_that(self.tiles.floor((2, 1)), is_(equal_to(['a', 'b'])))
+
+    def test_tile_view_behaves_like_dictionary(self):
+        """
+        Tile retrieved from grid can be read and written like a dictionary
+        """
+        self.tiles.set_floor((1, 1), 'ground')
+        tile = self.tiles[(1, 1)]
+        tile[FLOOR] = 'sand'
+
+        assert_that(self.tiles.floor((1, 1)), is_(equal_to('sand')))
+
+    def test_reading_contents_does_not_allocate(self):
+        """
+        Reading contents of an empty tile should not create side tables
+        """
+        self.tiles.set_floor((1, 1), 'ground')
+        tile = self.tiles[(1, 1)]
+
+        assert_that(tile[ITEMS], is_(equal_to([])))
+        assert_that(self.tiles.side_tables, is_(equal_to({})))
+
+    def test_changing_wall_increases_revision(self):
+        """
+        Changing passability of a tile increases revision of the grid
+        """
+        self.tiles.set_floor((1, 1), 'ground')
+        revision = self.tiles.revision
+
+        self.tiles.set_wall((1, 1), 'rock')
+
+        assert_that(self.tiles.revision, is_(equal_to(revision + 1)))
+
+    def test_setting_same_floor_keeps_revision(self):
+        """
+        Setting floor that does not change passability keeps revision
+        """
+        self.tiles.set_floor((1, 1), 'ground')
+        revision = self.tiles.revision
+
+        self.tiles.set_floor((1, 1), 'sand')
+
+        assert_that(self.tiles.revision, is_(equal_to(revision)))
+
+    def test_blocker_sees_changes_in_grid(self):
+        """
+        Movement blocker reflects changes done after it was created
+        """
+        self.tiles.set_floor((1, 1), 'ground')
+        self.tiles.set_floor((2, 1), 'ground')
+        blocks_movement = self.tiles.movement_blocker()
+
+        self.tiles.set_wall((2, 1), 'rock')
+
+        assert_that(blocks_movement((1, 1)), is_(equal_to(False)))
+        assert_that(blocks_movement((2, 1)), is_(equal_to(True)))
+        assert_that(self.tiles.los_blocker()((2, 1)), is_(equal_to(True)))
+
+
+class TestTileDict():
+    """
+    Tests for dictionary based tile storage
+    """
+    def __init__(self):
+        """
+        Default constructor
+        """
+        super().__init__()
+        self.tiles = None
+
+    def setup(self):
+        """
+        Setup test case
+        """
+        self.tiles = TileDict()
+
+    def test_bounds(self):
+        """
+        Dictionary storage reports bounds of stored tiles
+        """
+        self.tiles.set_floor((-1, 2), 'ground')
+        self.tiles.set_wall((5, 7), 'rock')
+
+        assert_that(self.tiles.bounds(), is_(equal_to((-1, 5, 2, 7))))